@@ -0,0 +1,254 @@
+'''
+AsyncAppController es una alternativa a AppController armada como un pipeline de etapas asyncio.
+    1.-Etapas: captura → preprocesado → inferencia → decisión, más una etapa de render que dibuja
+    cada frame capturado con el último resultado disponible.
+    2.-Las etapas se conectan con colas acotadas. Cada cola tiene su política: "block" (aplica
+    contrapresión a la etapa anterior), "drop_oldest" (descarta el frame más viejo) o
+    "drop_newest" (descarta el que llega).
+    3.-La lectura de la cámara, el preprocesado y la inferencia corren cada una en su propio
+    executor con run_in_executor: el preprocesado del frame siguiente se solapa con la inferencia
+    del actual y el bucle de eventos sigue atendiendo el render y Tk.
+    4.-La ventana se mantiene al ritmo de la cámara aunque la inferencia vaya más lenta; la
+    profundidad de cada cola y los descartes se pueden consultar con queue_stats() y se imprimen
+    cada stats_every segundos.
+    5.-Si una etapa falla, se imprime el error y se detiene todo el pipeline en lugar de seguir
+    mostrando la cámara sin detecciones.
+'''
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+
+from core.decision.decision_strategies import StreakDecision
+from interfaces import ICamera, IController, IDecisionStrategy, IDetailUI
+
+DROP_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+class _StageQueue:
+    """Cola acotada entre dos etapas con su política de descarte y contadores."""
+
+    def __init__(self, name: str, maxsize: int, policy: str) -> None:
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Política de cola desconocida '{policy}', usa una de {DROP_POLICIES}")
+        self.name = name
+        self.policy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, maxsize))
+        self.dropped = 0
+
+    async def put(self, item) -> None:
+        if self.policy == "block":
+            await self.queue.put(item)
+            return
+        if self.queue.full():
+            self.dropped += 1
+            if self.policy == "drop_newest":
+                return
+            self.queue.get_nowait()
+        self.queue.put_nowait(item)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class AsyncAppController(IController):
+    def __init__(self, camera: ICamera, engine, ui: IDetailUI, valid_classes: Set[str],
+                 no_object_class: str, threshold: float, confirm_frames: int,
+                 decision: Optional[IDecisionStrategy] = None,
+                 roi: Optional[Tuple[int, int, int, int]] = None,
+                 window_name: str = "Teachable Machine - Cam",
+                 queue_size: int = 2, stats_every: float = 5.0) -> None:
+        self._camera = camera
+        self._engine = engine
+        self._ui = ui
+        self._valid_classes = valid_classes
+        self._threshold = threshold
+        self._decision = decision or StreakDecision(
+            valid_classes, no_object_class, threshold, confirm_frames
+        )
+        self._roi = roi
+        self._window_name = window_name
+        self._queue_size = queue_size
+        self._stats_every = stats_every
+
+        self._paused = False
+        self._stop: Optional[asyncio.Event] = None
+        self._queues: List[_StageQueue] = []
+        self._latest: Optional[Tuple[str, float]] = None
+
+        self.frames_captured = 0
+        self.frames_inferred = 0
+        self.frames_rendered = 0
+        self.stage_error: Optional[BaseException] = None
+
+    def queue_stats(self) -> Dict[str, Tuple[int, int]]:
+        """Devuelve {cola: (profundidad, descartados)}."""
+        return {q.name: (q.queue.qsize(), q.dropped) for q in self._queues}
+
+    def _resume(self) -> None:
+        self._paused = False
+        self._decision.reset()
+
+    # ----------------------------------------------------------------- etapas
+
+    async def _capture(self, loop, io_pool, to_render: _StageQueue,
+                       to_preprocess: _StageQueue) -> None:
+        while not self._stop.is_set():
+            try:
+                frame = await loop.run_in_executor(io_pool, self._camera.read)
+            except Exception:
+                self._stop.set()
+                return
+            self.frames_captured += 1
+            await to_render.put(frame)
+            if not self._paused:
+                await to_preprocess.put(frame)
+
+    async def _preprocess(self, loop, pool, src: _StageQueue, dst: _StageQueue) -> None:
+        can_split = hasattr(self._engine, "predict_preprocessed")
+        while True:
+            frame = await src.get()
+            if not can_split:
+                await dst.put(frame)
+                continue
+            img = await loop.run_in_executor(pool, self._engine.preprocess, frame)
+            # Copia: el preprocesador puede reutilizar su buffer para el siguiente frame.
+            await dst.put(np.array(img, copy=True))
+
+    async def _infer(self, loop, pool, src: _StageQueue, dst: _StageQueue) -> None:
+        can_split = hasattr(self._engine, "predict_preprocessed")
+        fn = self._engine.predict_preprocessed if can_split else self._engine.predict
+        while True:
+            item = await src.get()
+            result = await loop.run_in_executor(pool, fn, item)
+            if result is None:
+                # El motor todavía no tiene un resultado nuevo (por ejemplo, procesos en vuelo).
+                continue
+            self.frames_inferred += 1
+            await dst.put(result)
+
+    async def _decide(self, root, src: _StageQueue) -> None:
+        while True:
+            label, conf, probs = await src.get()
+            self._latest = (label, conf)
+            if self._paused:
+                continue
+            confirmed = self._decision.update(label, conf, probs)
+            if confirmed is not None:
+                self._paused = True
+                root.after(0, self._ui.show, confirmed[0], confirmed[1], self._resume)
+
+    async def _render(self, root, src: _StageQueue) -> None:
+        last_stats = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                frame = await asyncio.wait_for(src.get(), timeout=0.05)
+            except asyncio.TimeoutError:
+                frame = None
+
+            if frame is not None:
+                self._draw(frame)
+                self.frames_rendered += 1
+
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                self._stop.set()
+                return
+            root.update_idletasks()
+            root.update()
+
+            now = time.perf_counter()
+            if self._stats_every > 0 and now - last_stats >= self._stats_every:
+                depths = ", ".join(
+                    f"{name}={depth} (descartados {dropped})"
+                    for name, (depth, dropped) in self.queue_stats().items()
+                )
+                print(f"[{self._window_name}] colas: {depths}")
+                last_stats = now
+
+    def _draw(self, frame: np.ndarray) -> None:
+        overlay = frame.copy()
+        if self._latest is not None:
+            label, conf = self._latest
+            color = (
+                (0, 255, 0)
+                if (label in self._valid_classes and conf >= self._threshold)
+                else (0, 200, 255)
+            )
+            cv2.putText(overlay, f"{label} ({conf:.2f})", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2, cv2.LINE_AA)
+        else:
+            cv2.putText(overlay, "Cargando modelo...", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 200, 255), 2, cv2.LINE_AA)
+        if self._roi is not None:
+            x, y, w, h = self._roi
+            cv2.rectangle(overlay, (x, y), (x + w, y + h), (255, 200, 0), 2)
+        cv2.imshow(self._window_name, overlay)
+
+    # ---------------------------------------------------------------- arranque
+
+    async def _main(self, root) -> None:
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        to_render = _StageQueue("render", self._queue_size, "drop_oldest")
+        to_preprocess = _StageQueue("preprocesado", self._queue_size, "drop_oldest")
+        to_infer = _StageQueue("inferencia", self._queue_size, "block")
+        to_decide = _StageQueue("decision", self._queue_size, "block")
+        self._queues = [to_render, to_preprocess, to_infer, to_decide]
+
+        io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="captura")
+        pre_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preprocesado")
+        infer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inferencia")
+        tasks = [
+            asyncio.create_task(self._capture(loop, io_pool, to_render, to_preprocess),
+                                name="captura"),
+            asyncio.create_task(self._preprocess(loop, pre_pool, to_preprocess, to_infer),
+                                name="preprocesado"),
+            asyncio.create_task(self._infer(loop, infer_pool, to_infer, to_decide),
+                                name="inferencia"),
+            asyncio.create_task(self._decide(root, to_decide), name="decision"),
+            asyncio.create_task(self._render(root, to_render), name="render"),
+        ]
+        try:
+            # Las etapas corren hasta que alguna termina: 'q', la cámara se cortó o hubo un error.
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if not t.cancelled() and t.exception() is not None:
+                    self.stage_error = t.exception()
+                    print(f"[ERROR] Ha ocurrido un error en la etapa {t.get_name()} del pipeline: "
+                          f"{self.stage_error}")
+        finally:
+            self._stop.set()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            io_pool.shutdown(wait=True)
+            pre_pool.shutdown(wait=True)
+            infer_pool.shutdown(wait=True)
+
+    def run(self, root) -> None:
+        try:
+            self._camera.open()
+        except Exception:
+            # El error ya se imprimió en la cámara
+            return
+
+        print("Ventana de cámara activa (pipeline asyncio). Pulsa 'q' para salir.")
+
+        try:
+            asyncio.run(self._main(root))
+        except KeyboardInterrupt:
+            print("Saliendo…")
+        finally:
+            try:
+                self._camera.release()
+            except Exception:
+                pass
+            cv2.destroyAllWindows()
+            try:
+                root.destroy()
+            except Exception:
+                pass
@@ -0,0 +1,196 @@
+'''
+ClassificationService expone el motor de inferencia por HTTP en localhost para que varias
+herramientas compartan un solo modelo cargado.
+    1.-POST /classify recibe los bytes de una imagen JPEG/PNG en el cuerpo y devuelve
+    {"label", "confidence", "probs"}.
+    2.-POST /classify/batch recibe {"images": [base64, ...]} y devuelve {"results": [...]} en el
+    mismo orden. Las imágenes del lote se decodifican en paralelo en un pool de hilos.
+    3.-Cada petición se atiende en su propio hilo (ThreadingHTTPServer); la decodificación ocurre
+    ahí y los frames se envían a un BatchingInferenceEngine, que junta las peticiones concurrentes
+    en lotes para el modelo.
+    4.-GET /stats devuelve peticiones, imágenes, errores, latencias p50/p95/p99 y el tamaño medio
+    de lote; GET /health indica si el modelo ya está listo.
+Las peticiones mal formadas (JSON, base64 o imagen inválidos) responden 400; cualquier fallo del
+preprocesador o del modelo responde 500.
+'''
+import base64
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from core.inference.batching_engine import BatchingInferenceEngine
+
+
+class LatencyStats:
+    """Guarda las últimas latencias (ms) y calcula percentiles bajo demanda."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, ms: float) -> None:
+        with self._lock:
+            self._samples.append(ms)
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            samples = np.array(self._samples, dtype=np.float64)
+        if samples.size == 0:
+            return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0}
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "mean_ms": round(float(samples.mean()), 2),
+        }
+
+
+class InvalidRequest(ValueError):
+    """La petición no se pudo interpretar; el servidor responde 400."""
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    """Decodifica bytes JPEG/PNG a un frame BGR; InvalidRequest si no es una imagen válida."""
+    frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise InvalidRequest("El cuerpo no es una imagen JPEG/PNG válida")
+    return frame
+
+
+def parse_batch(body: bytes) -> List[bytes]:
+    """Lee {"images": [base64, ...]}; InvalidRequest si el JSON o el base64 no son válidos."""
+    try:
+        return [base64.b64decode(item) for item in json.loads(body)["images"]]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidRequest(f"Lote inválido: {e}")
+
+
+class ClassificationService:
+    def __init__(self, engine: BatchingInferenceEngine, class_names: List[str],
+                 decode_workers: int = 4) -> None:
+        self._engine = engine
+        self._class_names = class_names
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=max(1, decode_workers), thread_name_prefix="decodificacion"
+        )
+        self._lock = threading.Lock()
+        self.latency = LatencyStats()
+        self.requests = 0
+        self.images = 0
+        self.errors = 0
+
+    def record(self, images: int = 0, error: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.images += images
+            self.errors += int(error)
+
+    def _to_json(self, result: Tuple[str, float, np.ndarray]) -> Dict[str, object]:
+        label, conf, probs = result
+        return {
+            "label": label,
+            "confidence": float(conf),
+            "probs": {name: float(p) for name, p in zip(self._class_names, probs)},
+        }
+
+    def classify(self, data: bytes) -> Dict[str, object]:
+        t0 = time.perf_counter()
+        frame = decode_image(data)
+        result = self._engine.submit(frame).result()
+        self.latency.add((time.perf_counter() - t0) * 1000.0)
+        return self._to_json(result)
+
+    def classify_batch(self, images: List[bytes]) -> List[Dict[str, object]]:
+        t0 = time.perf_counter()
+        frames = list(self._decode_pool.map(decode_image, images))
+        # Se envían todos antes de esperar para que el batcher los junte en un solo lote.
+        futures = [self._engine.submit(frame) for frame in frames]
+        results = [self._to_json(f.result()) for f in futures]
+        self.latency.add((time.perf_counter() - t0) * 1000.0)
+        return results
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            counts = {"requests": self.requests, "images": self.images, "errors": self.errors}
+        counts.update(self.latency.summary())
+        counts["mean_batch_size"] = round(self._engine.mean_batch_size, 2)
+        return counts
+
+    def is_ready(self) -> bool:
+        return self._engine.is_ready()
+
+    def close(self) -> None:
+        self._decode_pool.shutdown(wait=False)
+        self._engine.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: ClassificationService = None
+
+    def log_message(self, fmt, *args) -> None:
+        # Sin una línea por petición; los errores se imprimen aparte.
+        pass
+
+    def _send_json(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.service.stats())
+        elif self.path == "/health":
+            self._send_json(200, {"ready": self.service.is_ready()})
+        else:
+            self._send_json(404, {"error": f"Ruta desconocida {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path not in ("/classify", "/classify/batch"):
+            self._send_json(404, {"error": f"Ruta desconocida {self.path}"})
+            return
+        batch = self.path == "/classify/batch"
+        images = 0
+        try:
+            body = self._read_body()
+            if batch:
+                decoded = parse_batch(body)
+                images = len(decoded)
+                payload = {"results": self.service.classify_batch(decoded)}
+            else:
+                images = 1
+                payload = self.service.classify(body)
+        except InvalidRequest as e:
+            self.service.record(images, error=True)
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al clasificar una petición HTTP: {e}")
+            self.service.record(images, error=True)
+            self._send_json(500, {"error": str(e)})
+            return
+        self.service.record(images)
+        self._send_json(200, payload)
+
+
+def build_http_server(service: ClassificationService, host: str = "127.0.0.1",
+                      port: int = 8765) -> ThreadingHTTPServer:
+    """Crea el servidor HTTP (sin arrancarlo); port=0 elige un puerto libre."""
+    handler = type("ClassificationHandler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
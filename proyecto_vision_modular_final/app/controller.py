@@ -1,15 +1,72 @@
 import time
-from typing import Set, List
+from functools import partial
+from typing import Callable, Set, List, Optional, Tuple
 
 import cv2
+import numpy as np
 
+from core.decision.decision_strategies import StreakDecision
 from core.inference.inference_engine import InferenceEngine
-from interfaces import ICamera, IDetailUI, IController
+from interfaces import ICamera, IDetailUI, IController, IDecisionStrategy
+
+# Con la ventana de detalle abierta solo hace falta atender HighGUI de vez en cuando.
+PAUSED_TICK_MS = 50
+
+
+class FrameBudget:
+    """Calcula la espera hasta el próximo tick para no pasar de un frame cada budget_ms."""
+
+    def __init__(self, budget_ms: float = 0.0) -> None:
+        self._budget_ms = budget_ms
+        self.frames_over_budget = 0
+
+    def next_delay(self, started: float) -> int:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if self._budget_ms <= 0:
+            return 1
+        if elapsed_ms > self._budget_ms:
+            self.frames_over_budget += 1
+            return 1
+        return max(1, int(self._budget_ms - elapsed_ms))
+
+
+def run_tk_loop(root, tick: Callable[[], Optional[int]]) -> None:
+    """Ejecuta tick sobre el planificador de Tk (root.after) en lugar de un bucle con root.update.
+
+    tick devuelve los milisegundos hasta el próximo tick, o None para terminar. Entre ticks
+    Tk queda esperando eventos, así que no se gasta CPU. Los errores de tick se propagan.
+    """
+    errors: List[BaseException] = []
+
+    def wrapped() -> None:
+        try:
+            delay = tick()
+        except BaseException as e:
+            errors.append(e)
+            delay = None
+        if delay is None:
+            root.quit()
+        else:
+            root.after(delay, wrapped)
+
+    root.after(0, wrapped)
+    root.mainloop()
+    if errors:
+        raise errors[0]
 
 
 class AppController(IController):
     def __init__(self, camera: ICamera,engine: InferenceEngine,ui: IDetailUI,class_names: List[str],
-                 valid_classes: Set[str],no_object_class: str,threshold: float,confirm_frames: int,) -> None:
+                 valid_classes: Set[str],no_object_class: str,threshold: float,confirm_frames: int,
+                 roi: Optional[Tuple[int, int, int, int]] = None,
+                 window_name: str = "Teachable Machine - Cam",
+                 fps_report_every: float = 5.0,
+                 on_first_frame: Optional[Callable[[], None]] = None,
+                 decision: Optional[IDecisionStrategy] = None,
+                 headless: bool = False,
+                 display_fps: float = 0.0,
+                 on_confirm: Optional[Callable[[str, float], None]] = None,
+                 frame_budget_ms: float = 0.0,) -> None:
         self._camera = camera
         self._engine = engine
         self._ui = ui
@@ -18,95 +75,339 @@ class AppController(IController):
         self._no_object_class = no_object_class
         self._threshold = threshold
         self._confirm_frames = confirm_frames
+        self._roi = roi
+        self._window_name = window_name
+        self._fps_report_every = fps_report_every
+        self._on_first_frame = on_first_frame
+        self._headless = headless
+        self._display_interval = 1.0 / display_fps if display_fps > 0 else 0.0
+        self._last_render = 0.0
+        self._on_confirm = on_confirm
+        self._budget = FrameBudget(frame_budget_ms)
+        self._last_confirmed: Optional[str] = None
+        self._shown: Optional[Tuple[str, float]] = None
+
+        self._decision = decision or StreakDecision(
+            valid_classes, no_object_class, threshold, confirm_frames
+        )
 
         self._paused = False
-        self._last_label = None
-        self._streak = 0
+
+        self._fps = 0.0
+        self._fps_frames = 0
+        self._fps_since = time.perf_counter()
+        self._fps_reported = self._fps_since
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def window_name(self) -> str:
+        return self._window_name
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @property
+    def frames_over_budget(self) -> int:
+        return self._budget.frames_over_budget
 
     def _resume(self) -> None:
         self._paused = False
-        self._last_label = None
-        self._streak = 0
+        self._decision.reset()
 
-    def run(self, root) -> None:
+    def open(self) -> bool:
+        """Abre la cámara; devuelve False si no se pudo (el error ya se imprimió)."""
         try:
             self._camera.open()
         except Exception:
-            # El error ya se imprimió en la cámara
+            return False
+        self._fps_since = self._fps_reported = time.perf_counter()
+        return True
+
+    def close(self) -> None:
+        try:
+            self._camera.release()
+        except Exception:
+            pass
+
+    def read_frame(self) -> Optional[np.ndarray]:
+        """Lee un frame de la cámara; None si la cámara dejó de entregar frames."""
+        try:
+            return self._camera.read()
+        except Exception:
+            return None
+
+    def predict(self, frame: np.ndarray) -> Optional[Tuple[str, float, np.ndarray]]:
+        """Resultado del motor; None si el motor todavía no tiene uno nuevo para entregar."""
+        return self._engine.predict(frame)
+
+    def engine_ready(self) -> bool:
+        return self._engine.is_ready()
+
+    def _first_frame_shown(self) -> None:
+        if self._on_first_frame is not None:
+            callback, self._on_first_frame = self._on_first_frame, None
+            callback()
+
+    def _should_render(self) -> bool:
+        """True si toca dibujar este frame según DISPLAY_FPS (siempre False sin ventanas)."""
+        if self._headless:
+            return False
+        if self._display_interval <= 0:
+            return True
+        now = time.perf_counter()
+        if now - self._last_render < self._display_interval:
+            return False
+        self._last_render = now
+        return True
+
+    def show_loading(self, frame: np.ndarray) -> None:
+        """Muestra la cámara mientras el modelo termina de cargar en segundo plano."""
+        if self._should_render():
+            cv2.putText(
+                frame,
+                "Cargando modelo...",
+                (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 200, 255),
+                2,
+                cv2.LINE_AA,
+            )
+            cv2.imshow(self._window_name, frame)
+        self._first_frame_shown()
+
+    def _update_fps(self) -> None:
+        self._fps_frames += 1
+        now = time.perf_counter()
+        elapsed = now - self._fps_since
+        if elapsed >= 1.0:
+            self._fps = self._fps_frames / elapsed
+            self._fps_frames = 0
+            self._fps_since = now
+        if self._fps_report_every > 0 and now - self._fps_reported >= self._fps_report_every:
+            print(f"[{self._window_name}] {self._fps:.1f} FPS")
+            self._fps_reported = now
+
+    def _draw(self, frame: np.ndarray, label: str, conf: float) -> None:
+        # Se dibuja directamente sobre el frame: ya pasó por el modelo y la cámara entrega un
+        # arreglo nuevo en cada lectura, así que no hace falta copiarlo.
+        color = (
+            (0, 255, 0)
+            if (label in self._valid_classes and conf >= self._threshold)
+            else (0, 200, 255)
+        )
+        cv2.putText(
+            frame,
+            f"{label} ({conf:.2f})",
+            (10, 30),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1,
+            color,
+            2,
+            cv2.LINE_AA,
+        )
+        cv2.putText(
+            frame,
+            f"{self._fps:.1f} FPS",
+            (10, frame.shape[0] - 12),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            (255, 255, 255),
+            1,
+            cv2.LINE_AA,
+        )
+        if self._roi is not None:
+            x, y, w, h = self._roi
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 200, 0), 2)
+        cv2.imshow(self._window_name, frame)
+
+    def _confirm_headless(self, label: str, conf: float) -> None:
+        """Sin ventanas no hay pausa: se informa la confirmación y se sigue leyendo."""
+        self._decision.reset()
+        # El mismo objeto sigue frente a la cámara; solo se vuelve a confirmar cuando cambió.
+        if label == self._last_confirmed:
+            return
+        self._last_confirmed = label
+        if self._on_confirm is not None:
+            self._on_confirm(label, conf)
+        else:
+            print(f"[{self._window_name}] Confirmado: {label} ({conf:.2f})")
+
+    def handle(self, frame: np.ndarray, label: str, conf: float, probs: np.ndarray, root) -> None:
+        """Dibuja el resultado de un frame y se lo pasa a la estrategia de decisión."""
+        self._shown = (label, conf)
+        self.show_frame(frame)
+
+        if self._headless and label != self._last_confirmed and (
+            label == self._no_object_class or conf >= self._threshold
+        ):
+            self._last_confirmed = None
+
+        confirmed = self._decision.update(label, conf, probs)
+        if confirmed is not None:
+            confirmed_label, confirmed_conf = confirmed
+            if self._headless:
+                self._confirm_headless(confirmed_label, confirmed_conf)
+                return
+            self._paused = True
+            root.after(
+                0,
+                self._ui.show,
+                confirmed_label,
+                confirmed_conf,
+                self._resume,
+            )
+
+    def show_frame(self, frame: np.ndarray) -> None:
+        """Muestra el frame con el último resultado, sin pasarlo por la estrategia de decisión."""
+        if self._shown is None:
+            self.show_loading(frame)
+            return
+        self._update_fps()
+        if self._should_render():
+            self._draw(frame, *self._shown)
+        self._first_frame_shown()
+
+    def step(self, root) -> bool:
+        """Procesa un frame completo; devuelve False si la cámara dejó de responder."""
+        frame = self.read_frame()
+        if frame is None:
+            return False
+        if not self.engine_ready():
+            self.show_loading(frame)
+            return True
+        result = self.predict(frame)
+        if result is None:
+            self.show_frame(frame)
+            return True
+        label, conf, probs = result
+        self.handle(frame, label, conf, probs, root)
+        return True
+
+    def _tick(self, root) -> Optional[int]:
+        """Un frame del bucle con ventanas; devuelve la espera hasta el próximo o None."""
+        started = time.perf_counter()
+        if not self._paused and not self.step(root):
+            return None
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            return None
+        if self._paused:
+            return PAUSED_TICK_MS
+        return self._budget.next_delay(started)
+
+    def run(self, root) -> None:
+        if not self.open():
+            return
+
+        if self._headless:
+            print("Modo sin ventanas activo. Pulsa Ctrl+C para salir.")
+        else:
+            print("Ventana de cámara activa. Pulsa 'q' para salir.")
+
+        try:
+            if self._headless:
+                while self.step(root):
+                    pass
+            else:
+                run_tk_loop(root, partial(self._tick, root))
+
+        except KeyboardInterrupt:
+            print("Saliendo…")
+        finally:
+            self.close()
+            if not self._headless:
+                cv2.destroyAllWindows()
+                try:
+                    root.destroy()
+                except Exception:
+                    pass
+
+
+class MultiCameraController(IController):
+    """Atiende varias cámaras en un solo proceso compartiendo el modelo cargado.
+
+    Cada cámara conserva su propio AppController (racha, ventana y FPS). Si se pasa un engine
+    con predict_batch, los frames de todas las cámaras activas se infieren en una sola llamada.
+    """
+
+    def __init__(self, controllers: List[AppController], engine=None,
+                 frame_budget_ms: float = 0.0) -> None:
+        self._controllers = controllers
+        self._engine = engine
+        self._budget = FrameBudget(frame_budget_ms)
+        self._headless = all(c.headless for c in controllers)
+
+    def _predict_all(self, active: List[AppController], frames: List[np.ndarray]):
+        if self._engine is not None and hasattr(self._engine, "predict_batch"):
+            return self._engine.predict_batch(frames)
+        return [c.predict(f) for c, f in zip(active, frames)]
+
+    def _tick(self, root, live: List[AppController]) -> Optional[int]:
+        started = time.perf_counter()
+        active, frames = [], []
+        for c in list(live):
+            if c.paused:
+                continue
+            frame = c.read_frame()
+            if frame is None:
+                print(f"[ERROR] Ha ocurrido un error con {c.window_name}; se deja de leer.")
+                c.close()
+                live.remove(c)
+                continue
+            active.append(c)
+            frames.append(frame)
+        if not live:
+            return None
+
+        if frames and not all(c.engine_ready() for c in active):
+            for c, frame in zip(active, frames):
+                c.show_loading(frame)
+        elif frames:
+            results = self._predict_all(active, frames)
+            for c, frame, result in zip(active, frames, results):
+                if result is None:
+                    c.show_frame(frame)
+                else:
+                    c.handle(frame, *result, root)
+
+        if self._headless:
+            return 0
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            return None
+        if not frames:
+            return PAUSED_TICK_MS
+        return self._budget.next_delay(started)
+
+    def run(self, root) -> None:
+        live = [c for c in self._controllers if c.open()]
+        if not live:
             return
 
-        print("Ventana de cámara activa. Pulsa 'q' para salir.")
+        print(f"{len(live)} cámaras activas. Pulsa 'q' en cualquier ventana para salir.")
 
         try:
-            while True:
-                if not self._paused:
-                    try:
-                        frame = self._camera.read()
-                    except Exception:
-                        break
-
-                    label, conf, _ = self._engine.predict(frame)
-
-                    overlay = frame.copy()
-                    color = (
-                        (0, 255, 0)
-                        if (label in self._valid_classes and conf >= self._threshold)
-                        else (0, 200, 255)
-                    )
-                    cv2.putText(
-                        overlay,
-                        f"{label} ({conf:.2f})",
-                        (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        1,
-                        color,
-                        2,
-                        cv2.LINE_AA,
-                    )
-                    cv2.imshow("Teachable Machine - Cam", overlay)
-
-                    if label == self._no_object_class:
-                        self._last_label, self._streak = None, 0
-                    else:
-                        if label in self._valid_classes and conf >= self._threshold:
-                            if label == self._last_label:
-                                self._streak += 1
-                            else:
-                                self._last_label, self._streak = label, 1
-
-                            if self._streak >= self._confirm_frames:
-                                self._paused = True
-                                root.after(
-                                    0,
-                                    self._ui.show,
-                                    label,
-                                    conf,
-                                    self._resume,
-                                )
-                                while self._paused:
-                                    root.update()
-                                    if (cv2.waitKey(1) & 0xFF) == ord("q"):
-                                        self._paused = False
-                                        raise KeyboardInterrupt
-                                    time.sleep(0.01)
-                        else:
-                            self._last_label, self._streak = None, 0
-
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
-
-                root.update_idletasks()
-                root.update()
+            if self._headless:
+                while self._tick(root, live) is not None:
+                    pass
+            else:
+                run_tk_loop(root, partial(self._tick, root, live))
 
         except KeyboardInterrupt:
             print("Saliendo…")
         finally:
-            try:
-                self._camera.release()
-            except Exception:
-                pass
-            cv2.destroyAllWindows()
-            try:
-                root.destroy()
-            except Exception:
-                pass
+            for c in live:
+                c.close()
+            if not self._headless:
+                cv2.destroyAllWindows()
+                try:
+                    root.destroy()
+                except Exception:
+                    pass
@@ -0,0 +1,61 @@
+'''
+StartupProfiler mide cuánto tarda cada fase del arranque (--startup-profile).
+    1.-phase() es un context manager que mide una fase del hilo principal.
+    2.-record() registra una fase medida en otro hilo (por ejemplo la carga del modelo).
+    3.-mark() registra un hito respecto al inicio; cuando llegan todos los hitos esperados
+    (primer frame y modelo listo) imprime el reporte una sola vez.
+Si está desactivado no mide ni imprime nada.
+'''
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, List, Tuple
+
+
+class StartupProfiler:
+    def __init__(self, enabled: bool = False,
+                 expected_marks: Iterable[str] = ("primer frame", "modelo listo")) -> None:
+        self._enabled = enabled
+        self._t0 = time.perf_counter()
+        self._phases: List[Tuple[str, float]] = []
+        self._marks: List[Tuple[str, float]] = []
+        self._expected = set(expected_marks)
+        self._lock = threading.Lock()
+        self._reported = False
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self._enabled:
+            return
+        with self._lock:
+            self._phases.append((name, seconds))
+
+    def mark(self, name: str) -> None:
+        if not self._enabled:
+            return
+        with self._lock:
+            if any(n == name for n, _ in self._marks):
+                return
+            self._marks.append((name, time.perf_counter() - self._t0))
+            done = self._expected.issubset(n for n, _ in self._marks)
+        if done:
+            self.report()
+
+    def report(self) -> None:
+        with self._lock:
+            if self._reported:
+                return
+            self._reported = True
+            lines = ["===== Perfil de arranque ====="]
+            for name, seconds in self._phases:
+                lines.append(f"  {name:<28} {seconds * 1000:8.0f} ms")
+            for name, at in sorted(self._marks, key=lambda m: m[1]):
+                lines.append(f"  @ {name:<26} {at * 1000:8.0f} ms desde el inicio")
+        print("\n".join(lines))
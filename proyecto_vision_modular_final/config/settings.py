@@ -7,7 +7,7 @@ El archivo settings.py centraliza toda la configuración del proyecto.
     arrancar el programa, para evitar errores durante la ejecución.
 """
 import os
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, List, Optional, Tuple
 
 
 def _load_env_file(path: str = ".env") -> Dict[str, str]:
@@ -43,6 +43,38 @@ def _get(name: str, cast: Callable[[str], Any]):
     except Exception:
         raise ValueError(f"El valor de '{name}' en .env no pudo convertirse correctamente.")
 
+
+def _get_optional(name: str, cast: Callable[[str], Any], default: Any):
+    """Igual que _get, pero devuelve default si la variable no está en .env."""
+    if name not in _ENV:
+        return default
+    return _get(name, cast)
+
+
+def _to_roi(raw: str) -> Optional[Tuple[int, int, int, int]]:
+    """Convierte 'x,y,w,h' en una tupla de enteros; vacío significa sin ROI."""
+    if not raw.strip():
+        return None
+    x, y, w, h = (int(v) for v in raw.split(","))
+    if w <= 0 or h <= 0:
+        raise ValueError(raw)
+    return x, y, w, h
+
+
+def _to_int_list(raw: str) -> List[int]:
+    """Convierte '0,1,2' en [0, 1, 2]; vacío significa lista vacía."""
+    return [int(v) for v in raw.split(",") if v.strip()]
+
+
+def _to_bool(raw: str) -> bool:
+    """Convierte valores tipo 1/0, true/false, si/no en bool."""
+    value = raw.strip().lower()
+    if value in ("1", "true", "si", "sí", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(raw)
+
 # ================== VALORES EXTRAÍDOS DEL .env ==================
 
 SAVEDMODEL_DIR = _get("SAVEDMODEL_DIR", str)
@@ -57,6 +89,62 @@ CAM_INDEX       = _get("CAM_INDEX", int)
 FRAME_W         = _get("FRAME_W", int)
 FRAME_H         = _get("FRAME_H", int)
 
+# ================== VALORES OPCIONALES ==================
+
+CAM_THREADED    = _get_optional("CAM_THREADED", _to_bool, False)
+CAM_BUFFER_SIZE = _get_optional("CAM_BUFFER_SIZE", int, 2)
+CAM_INDEXES     = _get_optional("CAM_INDEXES", _to_int_list, [])
+
+CONTROLLER_MODE   = _get_optional("CONTROLLER_MODE", str, "sync")
+ASYNC_QUEUE_SIZE  = _get_optional("ASYNC_QUEUE_SIZE", int, 2)
+HEADLESS          = _get_optional("HEADLESS", _to_bool, False)
+DISPLAY_FPS       = _get_optional("DISPLAY_FPS", float, 0.0)
+FRAME_BUDGET_MS   = _get_optional("FRAME_BUDGET_MS", float, 0.0)
+
+DECISION_STRATEGY = _get_optional("DECISION_STRATEGY", str, "streak")
+EMA_ALPHA         = _get_optional("EMA_ALPHA", float, 0.5)
+SPRT_ALPHA        = _get_optional("SPRT_ALPHA", float, 0.01)
+
+REPLAY_SOURCE   = _get_optional("REPLAY_SOURCE", str, "")
+REPLAY_FPS      = _get_optional("REPLAY_FPS", float, 0.0)
+REPLAY_LOOP     = _get_optional("REPLAY_LOOP", _to_bool, False)
+
+INFER_WORKERS   = _get_optional("INFER_WORKERS", int, 0)
+PREPROCESS_MODE = _get_optional("PREPROCESS_MODE", str, "standard")
+
+GATE_THRESHOLD  = _get_optional("GATE_THRESHOLD", float, 0.0)
+GATE_MAX_SKIP   = _get_optional("GATE_MAX_SKIP", int, 30)
+
+ROI             = _get_optional("ROI", _to_roi, None)
+
+CACHE_SIZE         = _get_optional("CACHE_SIZE", int, 0)
+CACHE_MAX_DISTANCE = _get_optional("CACHE_MAX_DISTANCE", int, 4)
+
+MODEL_WARMUP_RUNS = _get_optional("MODEL_WARMUP_RUNS", int, 3)
+MODEL_JIT         = _get_optional("MODEL_JIT", _to_bool, False)
+MODEL_BACKEND     = _get_optional("MODEL_BACKEND", str, "savedmodel")
+TFLITE_PATH       = _get_optional("TFLITE_PATH", str, "")
+TFLITE_THREADS    = _get_optional("TFLITE_THREADS", int, 0)
+
+SERVER_HOST        = _get_optional("SERVER_HOST", str, "127.0.0.1")
+SERVER_PORT        = _get_optional("SERVER_PORT", int, 8765)
+SERVER_MAX_BATCH   = _get_optional("SERVER_MAX_BATCH", int, 8)
+SERVER_MAX_WAIT_MS = _get_optional("SERVER_MAX_WAIT_MS", float, 5.0)
+
+INVENTORY_BACKEND       = _get_optional("INVENTORY_BACKEND", str, "excel")
+INVENTORY_DB_PATH       = _get_optional("INVENTORY_DB_PATH", str, "")
+INVENTORY_JSON_PATH     = _get_optional("INVENTORY_JSON_PATH", str, "")
+INVENTORY_COMPACT_EVERY = _get_optional("INVENTORY_COMPACT_EVERY", int, 1000)
+INVENTORY_FLUSH_SECONDS = _get_optional("INVENTORY_FLUSH_SECONDS", float, 0.0)
+INVENTORY_SERVER_HOST   = _get_optional("INVENTORY_SERVER_HOST", str, "127.0.0.1")
+INVENTORY_SERVER_PORT   = _get_optional("INVENTORY_SERVER_PORT", int, 8766)
+INVENTORY_SERVER_FLUSH_SECONDS = _get_optional("INVENTORY_SERVER_FLUSH_SECONDS", float, 1.0)
+INVENTORY_SERVER_TOKEN  = _get_optional("INVENTORY_SERVER_TOKEN", str, "")
+
+IMAGE_CACHE_DIR = _get_optional("IMAGE_CACHE_DIR", str, "")
+IMAGE_CACHE_MB  = _get_optional("IMAGE_CACHE_MB", float, 64.0)
+DETAIL_DOCKED   = _get_optional("DETAIL_DOCKED", _to_bool, False)
+
 
 def ensure_paths() -> None:
     """Verifica rutas críticas y detiene el programa si algo está mal."""
@@ -66,6 +154,12 @@ def ensure_paths() -> None:
     if not os.path.isdir(IMG_DIR):
         raise FileNotFoundError(f"Ruta inválida en .env → IMG_DIR = {IMG_DIR}")
 
+    if MODEL_BACKEND == "tflite":
+        if not TFLITE_PATH:
+            raise ValueError("Variable 'TFLITE_PATH' vacía en .env: MODEL_BACKEND=tflite la necesita")
+        if not os.path.isfile(TFLITE_PATH):
+            raise FileNotFoundError(f"Ruta inválida en .env → TFLITE_PATH = {TFLITE_PATH}")
+
     excel_dir = os.path.dirname(EXCEL_PATH)
     if not os.path.isdir(excel_dir):
         raise FileNotFoundError(f"Ruta inválida en .env → EXCEL_PATH = {EXCEL_PATH}")
@@ -0,0 +1,155 @@
+'''
+Estrategias de decisión que confirman un componente a partir del vector de probabilidades que
+entrega InferenceEngine.predict en cada frame.
+    1.-StreakDecision replica el comportamiento original: CONFIRM_FRAMES frames seguidos con la
+    misma etiqueta válida sobre THRESHOLD; un frame ruidoso reinicia la racha.
+    2.-EmaDecision suaviza las probabilidades con una media móvil exponencial y confirma cuando la
+    clase líder supera el umbral; un frame ruidoso solo baja un poco la media.
+    3.-WindowVoteDecision guarda los últimos N frames y confirma cuando una etiqueta válida junta
+    suficientes votos dentro de la ventana.
+    4.-SprtDecision acumula evidencia log(p/(1-p)) por clase respecto al umbral (prueba secuencial
+    de razón de probabilidades, reiniciada en 0 como CUSUM) y confirma apenas cruza el límite de
+    Wald: las piezas muy claras se confirman en uno o dos frames y las dudosas no parpadean.
+Todas devuelven (label, confianza) al confirmar, o None mientras no haya decisión.
+'''
+import math
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from interfaces import IDecisionStrategy
+
+DECISION_STRATEGIES = ("streak", "ema", "vote", "sprt")
+
+
+class StreakDecision(IDecisionStrategy):
+    def __init__(self, valid_classes: Set[str], no_object_class: str, threshold: float,
+                 confirm_frames: int) -> None:
+        self._valid_classes = valid_classes
+        self._no_object_class = no_object_class
+        self._threshold = threshold
+        self._confirm_frames = confirm_frames
+        self._last_label = None
+        self._streak = 0
+
+    def update(self, label: str, conf: float, probs: np.ndarray) -> Optional[Tuple[str, float]]:
+        if label == self._no_object_class:
+            self._last_label, self._streak = None, 0
+            return None
+        if label not in self._valid_classes or conf < self._threshold:
+            self._last_label, self._streak = None, 0
+            return None
+        if label == self._last_label:
+            self._streak += 1
+        else:
+            self._last_label, self._streak = label, 1
+        if self._streak >= self._confirm_frames:
+            return label, conf
+        return None
+
+    def reset(self) -> None:
+        self._last_label = None
+        self._streak = 0
+
+
+class EmaDecision(IDecisionStrategy):
+    def __init__(self, class_names: List[str], valid_classes: Set[str], threshold: float,
+                 alpha: float = 0.5, min_frames: int = 2) -> None:
+        self._class_names = class_names
+        self._valid_classes = valid_classes
+        self._threshold = threshold
+        self._alpha = alpha
+        self._min_frames = max(1, min_frames)
+        self._ema: Optional[np.ndarray] = None
+        self._frames = 0
+
+    def update(self, label: str, conf: float, probs: np.ndarray) -> Optional[Tuple[str, float]]:
+        p = np.asarray(probs, dtype=np.float32)
+        if self._ema is None:
+            self._ema = p.copy()
+        else:
+            self._ema *= 1.0 - self._alpha
+            self._ema += self._alpha * p
+        self._frames += 1
+
+        idx = int(np.argmax(self._ema))
+        smoothed = float(self._ema[idx])
+        best = self._class_names[idx]
+        if self._frames >= self._min_frames and best in self._valid_classes \
+                and smoothed >= self._threshold:
+            return best, smoothed
+        return None
+
+    def reset(self) -> None:
+        self._ema = None
+        self._frames = 0
+
+
+class WindowVoteDecision(IDecisionStrategy):
+    def __init__(self, valid_classes: Set[str], threshold: float, window: int,
+                 min_votes: int) -> None:
+        self._valid_classes = valid_classes
+        self._threshold = threshold
+        self._min_votes = max(1, min_votes)
+        self._votes: deque = deque(maxlen=max(self._min_votes, window))
+
+    def update(self, label: str, conf: float, probs: np.ndarray) -> Optional[Tuple[str, float]]:
+        if label in self._valid_classes and conf >= self._threshold:
+            self._votes.append((label, conf))
+        else:
+            self._votes.append(None)
+
+        confs = [v[1] for v in self._votes if v is not None and v[0] == label]
+        if len(confs) >= self._min_votes:
+            return label, float(np.mean(confs))
+        return None
+
+    def reset(self) -> None:
+        self._votes.clear()
+
+
+class SprtDecision(IDecisionStrategy):
+    def __init__(self, class_names: List[str], valid_classes: Set[str], threshold: float,
+                 alpha: float = 0.01, beta: float = 0.01, eps: float = 1e-4) -> None:
+        self._valid_idx = [i for i, c in enumerate(class_names) if c in valid_classes]
+        self._class_names = class_names
+        self._eps = eps
+        # Evidencia nula justo en el umbral: solo suman los frames más seguros que THRESHOLD.
+        t = min(max(threshold, eps), 1.0 - eps)
+        self._baseline = math.log(t / (1.0 - t))
+        self._upper = math.log((1.0 - beta) / alpha)
+        self._llr: Dict[int, float] = {i: 0.0 for i in self._valid_idx}
+
+    def update(self, label: str, conf: float, probs: np.ndarray) -> Optional[Tuple[str, float]]:
+        p = np.clip(np.asarray(probs, dtype=np.float64), self._eps, 1.0 - self._eps)
+        for i in self._valid_idx:
+            evidence = math.log(p[i] / (1.0 - p[i])) - self._baseline
+            self._llr[i] = max(0.0, self._llr[i] + evidence)
+
+        best = max(self._valid_idx, key=lambda i: self._llr[i], default=None)
+        if best is not None and self._llr[best] >= self._upper:
+            return self._class_names[best], float(p[best])
+        return None
+
+    def reset(self) -> None:
+        for i in self._llr:
+            self._llr[i] = 0.0
+
+
+def build_decision_strategy(name: str, class_names: List[str], valid_classes: Set[str],
+                            no_object_class: str, threshold: float, confirm_frames: int,
+                            ema_alpha: float = 0.5, sprt_alpha: float = 0.01) -> IDecisionStrategy:
+    """Crea la estrategia indicada en DECISION_STRATEGY con los parámetros del .env."""
+    if name == "ema":
+        return EmaDecision(class_names, valid_classes, threshold, alpha=ema_alpha)
+    if name == "vote":
+        return WindowVoteDecision(valid_classes, threshold, window=confirm_frames * 2,
+                                  min_votes=confirm_frames)
+    if name == "sprt":
+        return SprtDecision(class_names, valid_classes, threshold, alpha=sprt_alpha,
+                            beta=sprt_alpha)
+    if name != "streak":
+        raise ValueError(f"Estrategia de decisión desconocida '{name}', usa una de "
+                         f"{DECISION_STRATEGIES}")
+    return StreakDecision(valid_classes, no_object_class, threshold, confirm_frames)
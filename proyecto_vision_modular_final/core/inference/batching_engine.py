@@ -0,0 +1,118 @@
+'''
+BatchingInferenceEngine agrupa frames de varios productores en lotes dinámicos.
+    1.-submit() encola el frame y devuelve un Future; se puede llamar desde varios hilos (varias
+    cámaras, herramientas offline, el servidor HTTP).
+    2.-Un hilo propio junta frames hasta max_batch o hasta que pase max_wait_ms desde el primero,
+    y ejecuta una sola llamada InferenceEngine.predict_batch sobre el tensor apilado.
+    3.-Cada Future recibe su (label, confianza, probs); si el lote falla (o devuelve otra cantidad
+    de resultados), todos reciben la excepción. Los Future cancelados se saltan.
+    4.-predict() conserva la firma de InferenceEngine y espera el resultado de su propio frame.
+El modelo MobileNet de Teachable Machine rinde bastante más por imagen con lotes de 8–16.
+'''
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple
+
+import numpy as np
+
+from core.inference.inference_engine import InferenceEngine
+
+_STOP = object()
+
+
+class BatchingInferenceEngine:
+    def __init__(self, engine: InferenceEngine, max_batch: int = 8,
+                 max_wait_ms: float = 5.0) -> None:
+        self._engine = engine
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self.batches_run = 0
+        self.frames_run = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        if self.batches_run == 0:
+            return 0.0
+        return self.frames_run / self.batches_run
+
+    def is_ready(self) -> bool:
+        return self._engine.is_ready()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="inference-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, frame: np.ndarray) -> Future:
+        """Encola un frame y devuelve un Future con (label, confianza, probs)."""
+        if self._thread is None:
+            self.start()
+        future: Future = Future()
+        self._queue.put((frame, future))
+        return future
+
+    def predict(self, frame: np.ndarray) -> Tuple[str, float, np.ndarray]:
+        """Devuelve (label, confianza, vector_de_probabilidades) del frame dado."""
+        return self.submit(frame).result()
+
+    def _collect_batch(self, first) -> List:
+        batch = [first]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 \
+                    else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect_batch(first)
+            # Los Future cancelados por quien los pidió se descartan antes de inferir.
+            batch = [(frame, future) for frame, future in batch
+                     if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            frames = [frame for frame, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                results = self._engine.predict_batch(frames)
+                if len(results) != len(frames):
+                    raise RuntimeError(
+                        f"predict_batch devolvió {len(results)} resultados para {len(frames)} frames"
+                    )
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al inferir un lote: {e}")
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            self.batches_run += 1
+            self.frames_run += len(frames)
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(_STOP)
+            self._thread.join(timeout=5.0)
+            self._thread = None
@@ -0,0 +1,91 @@
+'''
+ChangeGate detecta si la escena cambió comparando versiones reducidas del frame.
+    1.-Cada frame se reduce a una miniatura en escala de grises y se compara con la miniatura del
+    último frame que sí pasó por el modelo (diferencia absoluta media, en escala 0–255).
+    2.-Si la diferencia no supera el umbral, la escena se considera estática.
+
+GatedInferenceEngine envuelve un InferenceEngine con la misma firma de predict:
+    1.-Si la escena no cambió, devuelve el último (label, conf, probs) sin ejecutar el modelo.
+    2.-Cada max_skip frames seguidos se fuerza una inferencia real para no quedarse pegado.
+    3.-Lleva la cuenta de frames totales y saltados para reportar el skip ratio.
+Como igual devuelve un resultado por frame, el conteo de CONFIRM_FRAMES no cambia.
+'''
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class ChangeGate:
+    def __init__(self, threshold: float, thumb_size: int = 32) -> None:
+        self._threshold = threshold
+        self._thumb_size = thumb_size
+        self._thumb = np.empty((thumb_size, thumb_size), dtype=np.uint8)
+        self._reference: Optional[np.ndarray] = None
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        small = cv2.resize(frame, (self._thumb_size, self._thumb_size),
+                           interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self._thumb)
+            return self._thumb
+        return small
+
+    def changed(self, frame: np.ndarray) -> bool:
+        """True si el frame difiere de la referencia más que el umbral."""
+        thumb = self._thumbnail(frame)
+        if self._reference is None:
+            return True
+        diff = cv2.absdiff(thumb, self._reference)
+        return float(diff.mean()) > self._threshold
+
+    def accept(self, frame: np.ndarray) -> None:
+        """Fija el frame como nueva referencia (el que acaba de pasar por el modelo)."""
+        self._reference = self._thumbnail(frame).copy()
+
+    def reset(self) -> None:
+        self._reference = None
+
+
+class GatedInferenceEngine:
+    def __init__(self, engine, threshold: float, thumb_size: int = 32,
+                 max_skip: int = 30) -> None:
+        self._engine = engine
+        self._gate = ChangeGate(threshold, thumb_size)
+        self._max_skip = max_skip
+        self._last: Optional[Tuple[str, float, np.ndarray]] = None
+        self._consecutive_skips = 0
+
+        self.frames_total = 0
+        self.frames_skipped = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        if self.frames_total == 0:
+            return 0.0
+        return self.frames_skipped / self.frames_total
+
+    def is_ready(self) -> bool:
+        return self._engine.is_ready()
+
+    def predict(self, frame) -> Tuple[str, float, np.ndarray]:
+        """Devuelve (label, confianza, vector_de_probabilidades), reutilizando si no hubo cambio."""
+        self.frames_total += 1
+        if (
+            self._last is not None
+            and self._consecutive_skips < self._max_skip
+            and not self._gate.changed(frame)
+        ):
+            self._consecutive_skips += 1
+            self.frames_skipped += 1
+            return self._last
+
+        self._last = self._engine.predict(frame)
+        self._gate.accept(frame)
+        self._consecutive_skips = 0
+        return self._last
+
+    def reset(self) -> None:
+        self._gate.reset()
+        self._last = None
+        self._consecutive_skips = 0
@@ -2,14 +2,19 @@
 load_labels carga la lista de clases desde el modelo para saber qué nombre corresponde a cada índice.
     1.-InferenceEngine es el motor de predicción: preprocesa la imagen, ejecuta el modelo, convierte 
     los logits en probabilidades y devuelve la etiqueta final con su confianza.
+    2.-preprocess y predict_preprocessed separan las dos mitades de predict, para que otras capas
+    (como la caché de predicciones) puedan trabajar sobre el tensor ya preprocesado.
+    3.-predict_batch hace lo mismo para varios frames con una sola llamada al modelo sobre el
+    tensor apilado (N, S, S, 3).
+    4.-No importa TensorFlow: la conversión a tensor la hace cada modelo y el softmax se calcula
+    con numpy, así este módulo se puede importar sin pagar el arranque de TensorFlow.
     
 Si algo falla en la inferencia, el sistema corta y reporta el error para evitar decisiones incorrectas.
 """
 import os
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 import numpy as np
-import tensorflow as tf
 
 from interfaces import IPreprocessor, IModel
 
@@ -37,6 +42,12 @@ def load_labels(model_dir: str) -> List[str]:
     return ["Modulo Rele 2", "7404", "Diodo Zener", "7805", "No hay nada"]
 
 
+def _softmax(logits) -> np.ndarray:
+    x = np.asarray(logits, dtype=np.float32)
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
 class InferenceEngine:
     def __init__(self,preprocessor: IPreprocessor,model: IModel,
         class_names: List[str],) -> None:
@@ -44,14 +55,28 @@ class InferenceEngine:
         self._model = model
         self._class_names = class_names
 
+    def is_ready(self) -> bool:
+        return self._model.is_ready()
+
+    def preprocess(self, frame) -> np.ndarray:
+        return self._preprocessor.preprocess(frame)
+
     def predict(self, frame) -> Tuple[str, float, np.ndarray]:
         """Devuelve (label, confianza, vector_de_probabilidades)."""
         try:
             img = self._preprocessor.preprocess(frame)
-            outputs = self._model.predict(tf.constant(img))
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error durante la inferencia: {e}")
+            raise
+        return self.predict_preprocessed(img)
+
+    def predict_preprocessed(self, img: np.ndarray) -> Tuple[str, float, np.ndarray]:
+        """Igual que predict, pero con el tensor ya preprocesado (1, S, S, 3)."""
+        try:
+            outputs = self._model.predict(img)
             first_key = list(outputs.keys())[0]
             logits = outputs[first_key]
-            probs = tf.nn.softmax(logits, axis=-1).numpy()[0]
+            probs = _softmax(logits)[0]
             idx = int(np.argmax(probs))
             label = self._class_names[idx]
             conf = float(probs[idx])
@@ -59,3 +84,25 @@ class InferenceEngine:
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error durante la inferencia: {e}")
             raise
+
+    def predict_batch(self, frames: Sequence[np.ndarray]) -> List[Tuple[str, float, np.ndarray]]:
+        """Devuelve una lista de (label, confianza, probs) con una sola llamada al modelo."""
+        try:
+            batch = None
+            for i, frame in enumerate(frames):
+                img = self._preprocessor.preprocess(frame)
+                if batch is None:
+                    batch = np.empty((len(frames),) + img.shape[1:], dtype=img.dtype)
+                # Se copia a su fila porque el preprocesador puede reutilizar su buffer.
+                batch[i] = img[0]
+            outputs = self._model.predict(batch)
+            first_key = list(outputs.keys())[0]
+            probs = _softmax(outputs[first_key])
+            results = []
+            for row in probs:
+                idx = int(np.argmax(row))
+                results.append((self._class_names[idx], float(row[idx]), row))
+            return results
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error durante la inferencia por lotes: {e}")
+            raise
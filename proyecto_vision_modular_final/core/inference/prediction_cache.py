@@ -0,0 +1,82 @@
+'''
+CachedInferenceEngine guarda predicciones recientes indexadas por un hash perceptual del frame.
+    1.-Del tensor ya preprocesado calcula un dHash: escala de grises reducida a (N+1)xN y un bit
+    por cada par de pixeles vecinos según cuál es más claro (N*N bits en total).
+    2.-Si encuentra una entrada a distancia de Hamming <= max_distance devuelve ese resultado
+    sin ejecutar el modelo; si no, ejecuta el modelo y guarda el resultado.
+    3.-La caché tiene tamaño máximo con desalojo LRU y lleva estadísticas de aciertos, fallos y
+    desalojos.
+Mantiene la misma firma de predict que InferenceEngine.
+'''
+from collections import OrderedDict
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+from core.inference.inference_engine import InferenceEngine
+
+
+def dhash(img: np.ndarray, hash_size: int = 8) -> int:
+    """dHash de una imagen (H, W, 3) o (1, H, W, 3) como entero de hash_size² bits."""
+    if img.ndim == 4:
+        img = img[0]
+    gray = img.mean(axis=2, dtype=np.float32) if img.ndim == 3 else img.astype(np.float32)
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class CachedInferenceEngine:
+    def __init__(self, engine: InferenceEngine, max_entries: int = 256,
+                 max_distance: int = 4, hash_size: int = 8) -> None:
+        self._engine = engine
+        self._max_entries = max(1, max_entries)
+        self._max_distance = max_distance
+        self._hash_size = hash_size
+        self._entries: "OrderedDict[int, Tuple[str, float, np.ndarray]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def is_ready(self) -> bool:
+        return self._engine.is_ready()
+
+    def _lookup(self, key: int):
+        if key in self._entries:
+            return key
+        if self._max_distance <= 0:
+            return None
+        # Recorre de la más reciente a la más antigua: en la bandeja lo normal es repetir la última.
+        for cached in reversed(self._entries):
+            if (cached ^ key).bit_count() <= self._max_distance:
+                return cached
+        return None
+
+    def predict(self, frame) -> Tuple[str, float, np.ndarray]:
+        """Devuelve (label, confianza, vector_de_probabilidades), usando la caché si puede."""
+        img = self._engine.preprocess(frame)
+        key = dhash(img, self._hash_size)
+
+        hit = self._lookup(key)
+        if hit is not None:
+            self.hits += 1
+            self._entries.move_to_end(hit)
+            return self._entries[hit]
+
+        self.misses += 1
+        result = self._engine.predict_preprocessed(img)
+        self._entries[key] = result
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,236 @@
+'''
+ProcessPoolInferenceEngine reparte la inferencia entre varios procesos trabajadores.
+    1.-Los frames viajan por ranuras de multiprocessing.shared_memory: el proceso principal copia
+    el frame en una ranura libre y solo envía por la cola el id del frame y el número de ranura,
+    así nunca se serializan arreglos de 640x480x3.
+    2.-Cada trabajador crea su propio preprocesador y su propio modelo (por ejemplo TMSavedModel)
+    a partir de fábricas serializables, y arma un InferenceEngine local.
+    3.-submit() devuelve el id del frame y get() entrega los resultados en el mismo orden en que se
+    enviaron, aunque los trabajadores terminen desordenados.
+    4.-predict() recibe lo mismo que InferenceEngine.predict para usarlo desde el controlador: deja
+    hasta num_workers frames en vuelo y devuelve el resultado más reciente que todavía no se había
+    entregado, o None si no llegó ninguno nuevo. Así cada inferencia cuenta una sola vez para
+    CONFIRM_FRAMES y las estrategias de decisión.
+Si un trabajador falla, el error se propaga al proceso principal para no tomar decisiones con
+resultados incompletos. Si un trabajador muere o no responde en result_timeout segundos, la
+espera termina con un error en lugar de quedar colgada.
+'''
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_READY = "ready"
+
+
+def _worker_main(model_factory: Callable[[], Any], preprocessor_factory: Callable[[], Any],
+                 class_names: List[str], shm_name: str, slots_shape: Tuple[int, ...],
+                 tasks, results) -> None:
+    from core.inference.inference_engine import InferenceEngine
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray(slots_shape, dtype=np.uint8, buffer=shm.buf)
+    try:
+        try:
+            engine = InferenceEngine(preprocessor_factory(), model_factory(), class_names)
+        except Exception as e:
+            results.put((_READY, None, None, 0.0, None, str(e)))
+            return
+        results.put((_READY, None, None, 0.0, None, None))
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            frame_id, slot, h, w, c = task
+            try:
+                label, conf, probs = engine.predict(slots[slot, :h, :w, :c])
+                results.put((frame_id, slot, label, conf, probs, None))
+            except Exception as e:
+                results.put((frame_id, slot, None, 0.0, None, str(e)))
+    finally:
+        del slots
+        shm.close()
+
+
+class ProcessPoolInferenceEngine:
+    def __init__(self, model_factory: Callable[[], Any], preprocessor_factory: Callable[[], Any],
+                 class_names: List[str], num_workers: int = 2,
+                 frame_shape: Tuple[int, int, int] = (480, 640, 3),
+                 slots_per_worker: int = 2, start_timeout: float = 300.0,
+                 result_timeout: float = 30.0) -> None:
+        self._model_factory = model_factory
+        self._preprocessor_factory = preprocessor_factory
+        self._class_names = class_names
+        self._num_workers = max(1, num_workers)
+        self._frame_shape = tuple(frame_shape)
+        self._n_slots = self._num_workers * max(1, slots_per_worker)
+        self._start_timeout = start_timeout
+        self._result_timeout = result_timeout
+
+        self._ctx = mp.get_context("spawn")
+        self._shm = None
+        self._slots = None
+        self._tasks = None
+        self._results = None
+        self._workers: List[Any] = []
+
+        self._free_slots: deque = deque()
+        self._done: Dict[int, Tuple[str, float, np.ndarray]] = {}
+        self._pending: deque = deque()
+        self._next_id = 0
+
+    @property
+    def frames_in_flight(self) -> int:
+        return len(self._pending)
+
+    def is_ready(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Crea la memoria compartida y lanza los trabajadores; espera a que carguen el modelo."""
+        if self._workers:
+            return
+        slots_shape = (self._n_slots,) + self._frame_shape
+        size = int(np.prod(slots_shape))
+        try:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._slots = np.ndarray(slots_shape, dtype=np.uint8, buffer=self._shm.buf)
+            self._tasks = self._ctx.Queue()
+            self._results = self._ctx.Queue()
+            self._free_slots = deque(range(self._n_slots))
+
+            for i in range(self._num_workers):
+                p = self._ctx.Process(
+                    target=_worker_main,
+                    args=(self._model_factory, self._preprocessor_factory, self._class_names,
+                          self._shm.name, slots_shape, self._tasks, self._results),
+                    name=f"inference-worker-{i}",
+                    daemon=True,
+                )
+                p.start()
+                self._workers.append(p)
+
+            for _ in range(self._num_workers):
+                tag, _, _, _, _, error = self._next_result(self._start_timeout)
+                if tag == _READY and error is not None:
+                    raise RuntimeError(error)
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al iniciar los procesos de inferencia: {e}")
+            self.close()
+            raise
+
+    def _next_result(self, timeout: float):
+        """Espera un mensaje de los trabajadores revisando que sigan vivos."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._results.get(timeout=min(0.5, timeout))
+            except queue.Empty:
+                pass
+            dead = [p.name for p in self._workers if not p.is_alive()]
+            if dead:
+                raise RuntimeError(f"Terminó inesperadamente el proceso {', '.join(dead)}")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Los procesos de inferencia no respondieron en {timeout:.0f} s")
+
+    def _collect(self, block: bool = True) -> bool:
+        """Recibe un resultado de los trabajadores y libera su ranura."""
+        if block:
+            try:
+                message = self._next_result(self._result_timeout)
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al esperar a los procesos de inferencia: {e}")
+                raise
+        else:
+            try:
+                message = self._results.get_nowait()
+            except queue.Empty:
+                return False
+        frame_id, slot, label, conf, probs, error = message
+        self._free_slots.append(slot)
+        if error is not None:
+            # El frame no va a tener resultado: se saca de los pendientes para no esperarlo.
+            try:
+                self._pending.remove(frame_id)
+            except ValueError:
+                pass
+            print(f"[ERROR] Ha ocurrido un error durante la inferencia en un trabajador: {error}")
+            raise RuntimeError(error)
+        self._done[frame_id] = (label, conf, probs)
+        return True
+
+    def submit(self, frame: np.ndarray) -> int:
+        """Copia el frame en una ranura libre, lo encola y devuelve su id."""
+        if not self._workers:
+            self.start()
+        h, w = frame.shape[:2]
+        c = frame.shape[2] if frame.ndim == 3 else 1
+        fh, fw, fc = self._frame_shape
+        if h > fh or w > fw or c > fc or frame.dtype != np.uint8:
+            print("[ERROR] Ha ocurrido un error: el frame no cabe en la memoria compartida.")
+            raise ValueError(f"Frame {frame.shape} {frame.dtype} no cabe en ranuras {self._frame_shape}")
+
+        while not self._free_slots:
+            self._collect(block=True)
+
+        slot = self._free_slots.popleft()
+        self._slots[slot, :h, :w, :c] = frame.reshape(h, w, c)
+        frame_id = self._next_id
+        self._next_id += 1
+        self._pending.append(frame_id)
+        self._tasks.put((frame_id, slot, h, w, c))
+        return frame_id
+
+    def get(self) -> Tuple[int, str, float, np.ndarray]:
+        """Devuelve (frame_id, label, confianza, probs) del frame más antiguo pendiente."""
+        if not self._pending:
+            raise RuntimeError("No hay frames pendientes de inferencia")
+        frame_id = self._pending[0]
+        while frame_id not in self._done:
+            self._collect(block=True)
+        self._pending.popleft()
+        label, conf, probs = self._done.pop(frame_id)
+        return frame_id, label, conf, probs
+
+    def predict(self, frame: np.ndarray) -> Optional[Tuple[str, float, np.ndarray]]:
+        """Devuelve (label, confianza, vector_de_probabilidades) del resultado nuevo más reciente.
+
+        Con el pipeline lleno el resultado corresponde a un frame de hasta num_workers
+        posiciones atrás. Devuelve None si desde la última llamada no terminó ningún frame:
+        un mismo resultado nunca se entrega dos veces.
+        """
+        self.submit(frame)
+        while self._results is not None and self._collect(block=False):
+            pass
+        latest = None
+        while self._pending and (
+            self._pending[0] in self._done or len(self._pending) > self._num_workers
+        ):
+            _, label, conf, probs = self.get()
+            latest = (label, conf, probs)
+        return latest
+
+    def close(self) -> None:
+        for _ in self._workers:
+            try:
+                self._tasks.put(None)
+            except Exception:
+                pass
+        for p in self._workers:
+            p.join(timeout=5.0)
+            if p.is_alive():
+                p.terminate()
+        self._workers = []
+        self._slots = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al liberar la memoria compartida: {e}")
+            self._shm = None
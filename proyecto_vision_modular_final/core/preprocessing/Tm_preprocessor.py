@@ -3,20 +3,62 @@ TMPreprocessor es el módulo que toma la imagen cruda de la cámara y la convier
 para la IA.
     1.- Primero cambia de BGR a RGB, luego escala la imagen al tamaño adecuado, la normaliza en el
       rango 0–1 y finalmente agrega la dimensión batch.
+    2.- Con fused=True hace lo mismo sin reservar memoria por frame: primero escala (así el cambio
+      de color trabaja sobre SxS y no sobre el frame completo) y escribe directo en buffers
+      persistentes, terminando en un (1, S, S, 3) float32 que se reutiliza en cada llamada.
+    3.- Con uint8_output=True se salta la normalización y entrega el (1, S, S, 3) uint8; la división
+      entre 255 la hace el modelo dentro de su llamada.
+    4.- Si se indica roi=(x, y, w, h), antes de escalar se toma solo esa zona del frame con un slice
+      de numpy (una vista, sin copiar pixeles), así el modelo ve la bandeja con más resolución.
 
 El resultado es un tensor perfectamente compatible con el modelo TensorFlow para ejecutar la inferencia.
+En los modos con buffers el arreglo devuelto se sobrescribe en la siguiente llamada.
 '''
+from typing import Optional, Tuple
+
 import cv2
 import numpy as np
 from interfaces import IPreprocessor
 
 
 class TMPreprocessor(IPreprocessor):
-    def __init__(self, input_size: int) -> None:
+    def __init__(self, input_size: int, fused: bool = False, uint8_output: bool = False,
+                 roi: Optional[Tuple[int, int, int, int]] = None) -> None:
         self._size = input_size
+        self._roi = roi
+        self._fused = fused or uint8_output
+        self._uint8_output = uint8_output
+
+        if self._fused:
+            self._resized = np.empty((input_size, input_size, 3), dtype=np.uint8)
+            self._rgb = np.empty((1, input_size, input_size, 3), dtype=np.uint8)
+            self._out = np.empty((1, input_size, input_size, 3), dtype=np.float32)
+
+    def _crop(self, frame: np.ndarray) -> np.ndarray:
+        if self._roi is None:
+            return frame
+        x, y, w, h = self._roi
+        crop = frame[max(0, y):y + h, max(0, x):x + w]
+        if crop.size == 0:
+            print("[ERROR] Ha ocurrido un error en el preprocesado: el ROI queda fuera del frame.")
+            raise ValueError(f"ROI {self._roi} fuera del frame {frame.shape[1]}x{frame.shape[0]}")
+        return crop
 
     def preprocess(self, frame: np.ndarray) -> np.ndarray:
+        frame = self._crop(frame)
+        if self._fused:
+            return self._preprocess_fused(frame)
         img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         img = cv2.resize(img, (self._size, self._size), interpolation=cv2.INTER_LINEAR)
         img = img.astype(np.float32) / 255.0
         return np.expand_dims(img, axis=0)
+
+    def _preprocess_fused(self, frame: np.ndarray) -> np.ndarray:
+        # BGR→RGB solo permuta canales, así que da lo mismo hacerlo antes o después de escalar.
+        cv2.resize(frame, (self._size, self._size), dst=self._resized,
+                   interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb[0])
+        if self._uint8_output:
+            return self._rgb
+        np.divide(self._rgb, np.float32(255.0), out=self._out)
+        return self._out
@@ -4,19 +4,39 @@ OpenCVCamera es la capa de acceso a la cámara.
     2.-Con open() la inicializo validando que realmente se abra.
     3.-Con read() capturo cada frame y manejo los errores de lectura.
     4.-Con release() libero el dispositivo al final para no dejar la cámara tomada por el programa.
+    5.-Con threaded=True la captura corre en un hilo propio que llena un buffer circular pequeño;
+    read() entrega siempre el frame más reciente y descarta los viejos, contando los frames
+    capturados y descartados.
 '''
+import threading
+import time
+from collections import deque
+
 import cv2
 import numpy as np
 
 from interfaces import ICamera
 
 class OpenCVCamera(ICamera):
-    def __init__(self, index: int, width: int, height: int) -> None:
+    def __init__(self, index: int, width: int, height: int,
+                 threaded: bool = False, buffer_size: int = 2) -> None:
         self._index = index
         self._width = width
         self._height = height
         self._cap = None
 
+        self._threaded = threaded
+        self._buffer = deque(maxlen=max(1, buffer_size))
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._error = None
+        self._last_seq = 0
+        self._seq = 0
+
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
     def open(self) -> None:
         try:
             self._cap = cv2.VideoCapture(self._index, cv2.CAP_DSHOW)
@@ -29,17 +49,66 @@ class OpenCVCamera(ICamera):
             print(f"[ERROR] Ha ocurrido un error al inicializar la cámara: {e}")
             raise
 
+        if self._threaded:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._capture_loop, name=f"camera-{self._index}", daemon=True
+            )
+            self._thread.start()
+
+    def _capture_loop(self) -> None:
+        while self._running:
+            ok, frame = self._cap.read()
+            with self._cond:
+                if not ok:
+                    self._error = RuntimeError("No se pudo leer frame de la cámara")
+                    self._cond.notify_all()
+                    return
+                if len(self._buffer) == self._buffer.maxlen:
+                    self.frames_dropped += 1
+                self._buffer.append(frame)
+                self._seq += 1
+                self.frames_captured += 1
+                self._cond.notify_all()
+
     def read(self) -> np.ndarray:
         if self._cap is None:
             print("[ERROR] Ha ocurrido un error con la cámara: no está inicializada.")
             raise RuntimeError("Cámara no inicializada")
+        if self._threaded:
+            return self._read_latest()
         ok, frame = self._cap.read()
         if not ok:
             print("[ERROR] Ha ocurrido un error al leer un frame de la cámara.")
             raise RuntimeError("No se pudo leer frame de la cámara")
+        self.frames_captured += 1
         return frame
 
+    def _read_latest(self, timeout: float = 2.0) -> np.ndarray:
+        """Espera un frame nuevo y devuelve el más reciente, descartando los anteriores."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._seq == self._last_seq and self._error is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print("[ERROR] Ha ocurrido un error al leer un frame de la cámara: tiempo agotado.")
+                    raise RuntimeError("No se recibió ningún frame de la cámara")
+                self._cond.wait(remaining)
+            if self._seq == self._last_seq:
+                print("[ERROR] Ha ocurrido un error al leer un frame de la cámara.")
+                raise self._error
+            # Los frames que quedan en el buffer detrás del último ya no se van a usar.
+            self.frames_dropped += len(self._buffer) - 1
+            frame = self._buffer[-1]
+            self._buffer.clear()
+            self._last_seq = self._seq
+            return frame
+
     def release(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
         try:
             if self._cap is not None:
                 self._cap.release()
@@ -0,0 +1,116 @@
+'''
+ReplayCamera reproduce un video o una carpeta de imágenes como si fuera una cámara.
+    1.-Con __init__ indico la fuente (archivo de video o carpeta), el fps objetivo y si se repite.
+    2.-Con open() abro el video o listo las imágenes de la carpeta en orden alfabético.
+    3.-Con read() entrego el siguiente frame; si fps > 0 espera para respetar el ritmo real,
+    y con fps = 0 entrega los frames tan rápido como se pidan.
+    4.-Al llegar al final vuelve a empezar si loop=True; si no, lanza un error igual que la cámara
+    real cuando deja de entregar frames.
+Sirve para correr el pipeline completo en equipos sin webcam y reproducir grabaciones del campo.
+'''
+import os
+import time
+from typing import List
+
+import cv2
+import numpy as np
+
+from interfaces import ICamera
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp", ".tif", ".tiff")
+
+
+class ReplayCamera(ICamera):
+    def __init__(self, source: str, fps: float = 0.0, loop: bool = False,
+                 width: int = 0, height: int = 0) -> None:
+        self._source = source
+        self._fps = fps
+        self._loop = loop
+        self._width = width
+        self._height = height
+
+        self._cap = None
+        self._images: List[str] = []
+        self._pos = 0
+        self._next_due = None
+
+        self.frames_served = 0
+
+    def open(self) -> None:
+        try:
+            if os.path.isdir(self._source):
+                self._images = sorted(
+                    os.path.join(self._source, name)
+                    for name in os.listdir(self._source)
+                    if name.lower().endswith(IMAGE_EXTENSIONS)
+                )
+                if not self._images:
+                    raise RuntimeError(f"No hay imágenes en {self._source}")
+            else:
+                self._cap = cv2.VideoCapture(self._source)
+                if not self._cap.isOpened():
+                    raise RuntimeError(f"No se pudo abrir el video {self._source}")
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al abrir la fuente de reproducción: {e}")
+            raise
+        self._pos = 0
+        self._next_due = None
+
+    def _read_image(self) -> np.ndarray:
+        if self._pos >= len(self._images):
+            if not self._loop:
+                raise RuntimeError("Fin de la reproducción")
+            self._pos = 0
+        path = self._images[self._pos]
+        self._pos += 1
+        frame = cv2.imread(path, cv2.IMREAD_COLOR)
+        if frame is None:
+            raise RuntimeError(f"No se pudo leer la imagen {path}")
+        return frame
+
+    def _read_video(self) -> np.ndarray:
+        ok, frame = self._cap.read()
+        if not ok and self._loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._cap.read()
+        if not ok:
+            raise RuntimeError("Fin de la reproducción")
+        return frame
+
+    def _wait_for_slot(self) -> None:
+        """Duerme lo necesario para respetar el fps objetivo sin acumular deriva."""
+        if self._fps <= 0:
+            return
+        period = 1.0 / self._fps
+        now = time.perf_counter()
+        if self._next_due is None or now - self._next_due > period:
+            # Primer frame, o vamos tan atrasados que no tiene sentido recuperar.
+            self._next_due = now
+        elif self._next_due > now:
+            time.sleep(self._next_due - now)
+        self._next_due += period
+
+    def read(self) -> np.ndarray:
+        if self._cap is None and not self._images:
+            print("[ERROR] Ha ocurrido un error con la reproducción: no está inicializada.")
+            raise RuntimeError("Fuente de reproducción no inicializada")
+        try:
+            frame = self._read_image() if self._images else self._read_video()
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer un frame de la reproducción: {e}")
+            raise
+        if self._width and self._height and frame.shape[:2] != (self._height, self._width):
+            frame = cv2.resize(frame, (self._width, self._height), interpolation=cv2.INTER_AREA)
+        self._wait_for_slot()
+        self.frames_served += 1
+        return frame
+
+    def release(self) -> None:
+        try:
+            if self._cap is not None:
+                self._cap.release()
+                self._cap = None
+            self._images = []
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al liberar la reproducción: {e}")
+            raise
@@ -8,16 +8,27 @@ predict, para ejecutar la inferencia.
     luego son convertidas en probabilidades y etiquetas por el motor de inferencia.
     Si ocurre algún error durante la inferencia, también corta la ejecución para evitar decisiones 
     incorrectas.
+    3.-Si el tensor llega como uint8 (TMPreprocessor con uint8_output=True), la normalización
+    entre 255 se hace aquí dentro de TensorFlow en vez de en numpy.
+    4.-Si se conoce input_size, la firma se envuelve en un tf.function con firma fija
+    (None, S, S, 3) float32, opcionalmente compilado con XLA (jit_compile=True), para que no se
+    vuelva a trazar con cada llamada.
+    5.-warmup() ejecuta el modelo con tensores de ceros del tamaño configurado antes de abrir la
+    cámara, así la primera detección real ya corre a la latencia estable; imprime la latencia en
+    frío y en caliente.
 '''
 
 import os
+import time
+
 import tensorflow as tf
 
 from interfaces import IModel
 
 
 class TMSavedModel(IModel):
-    def __init__(self, model_dir: str) -> None:
+    def __init__(self, model_dir: str, input_size: int = 0, warmup_runs: int = 0,
+                 jit_compile: bool = False) -> None:
         sm_path = os.path.join(model_dir, "saved_model.pb")
         if not os.path.exists(sm_path):
             print(f"[ERROR] Ha ocurrido un error con el modelo, no se encontró: {sm_path}")
@@ -25,14 +36,54 @@ class TMSavedModel(IModel):
         try:
             print("Cargando modelo…")
             model = tf.saved_model.load(model_dir)
+            self._model = model
             self._infer = model.signatures["serving_default"]
+            self._input_size = input_size
+            self._call = self._infer
+            if input_size > 0:
+                signature = [tf.TensorSpec((None, input_size, input_size, 3), tf.float32)]
+                self._call = tf.function(
+                    lambda x: self._infer(x),
+                    input_signature=signature,
+                    jit_compile=jit_compile,
+                )
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al cargar el modelo: {e}")
             raise
 
+        self.cold_latency_ms = None
+        self.warm_latency_ms = None
+        if warmup_runs > 0 and input_size > 0:
+            self.warmup(warmup_runs)
+
+    def warmup(self, runs: int = 3) -> None:
+        """Ejecuta el modelo con tensores de ceros y mide la latencia en frío y en caliente."""
+        dummy = tf.zeros((1, self._input_size, self._input_size, 3), dtype=tf.float32)
+        try:
+            t0 = time.perf_counter()
+            self.predict(dummy)
+            self.cold_latency_ms = (time.perf_counter() - t0) * 1000.0
+
+            warm = []
+            for _ in range(max(1, runs)):
+                t0 = time.perf_counter()
+                self.predict(dummy)
+                warm.append((time.perf_counter() - t0) * 1000.0)
+            self.warm_latency_ms = sorted(warm)[len(warm) // 2]
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al calentar el modelo: {e}")
+            raise
+        print(
+            f"Modelo calentado: frío {self.cold_latency_ms:.1f} ms, "
+            f"estable {self.warm_latency_ms:.1f} ms"
+        )
+
     def predict(self, input_tensor):
         try:
-            return self._infer(input_tensor)
+            input_tensor = tf.convert_to_tensor(input_tensor)
+            if input_tensor.dtype == tf.uint8:
+                input_tensor = tf.cast(input_tensor, tf.float32) * (1.0 / 255.0)
+            return self._call(input_tensor)
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al ejecutar la inferencia del modelo: {e}")
             raise
@@ -0,0 +1,54 @@
+'''
+BackgroundModel carga el modelo en un hilo aparte mientras arranca el resto de la aplicación.
+    1.-En el constructor lanza el hilo que ejecuta la fábrica del modelo (importar TensorFlow,
+    cargar el SavedModel y calentarlo).
+    2.-is_ready() indica si ya terminó, para que el controlador muestre la cámara mientras tanto.
+    3.-predict espera a que termine la carga y delega en el modelo real; si la carga falló,
+    relanza ese mismo error.
+'''
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from interfaces import IModel
+
+
+class BackgroundModel(IModel):
+    def __init__(self, factory: Callable[[], IModel],
+                 on_ready: Optional[Callable[[float], None]] = None) -> None:
+        self._factory = factory
+        self._on_ready = on_ready
+        self._model: Optional[IModel] = None
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+        self.load_seconds = None
+
+        self._thread = threading.Thread(target=self._load, name="model-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self) -> None:
+        t0 = time.perf_counter()
+        try:
+            self._model = self._factory()
+        except BaseException as e:
+            print(f"[ERROR] Ha ocurrido un error al cargar el modelo en segundo plano: {e}")
+            self._error = e
+        finally:
+            self.load_seconds = time.perf_counter() - t0
+            self._done.set()
+        if self._error is None and self._on_ready is not None:
+            self._on_ready(self.load_seconds)
+
+    def is_ready(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> IModel:
+        """Espera a que termine la carga y devuelve el modelo real."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("El modelo todavía se está cargando")
+        if self._error is not None:
+            raise self._error
+        return self._model
+
+    def predict(self, input_tensor: Any) -> Any:
+        return self.wait().predict(input_tensor)
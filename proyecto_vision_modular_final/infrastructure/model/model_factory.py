@@ -0,0 +1,27 @@
+'''
+model_factory crea el modelo configurado importando su backend recién cuando hace falta.
+    1.-create_model elige entre TMSavedModel y TFLiteModel; TensorFlow solo se importa aquí
+    adentro, así quien importa este módulo no paga el arranque de TensorFlow.
+    2.-Al ser una función de módulo, functools.partial(create_model, ...) se puede enviar a otros
+    procesos (ProcessPoolInferenceEngine) o a un hilo de carga en segundo plano (BackgroundModel).
+'''
+from interfaces import IModel
+
+
+def create_model(backend: str, saved_model_dir: str, input_size: int = 0,
+                 warmup_runs: int = 0, jit_compile: bool = False,
+                 tflite_path: str = "", tflite_threads: int = 0) -> IModel:
+    if backend == "tflite":
+        if not tflite_path:
+            print("[ERROR] Ha ocurrido un error: MODEL_BACKEND=tflite sin TFLITE_PATH en .env.")
+            raise ValueError("Variable 'TFLITE_PATH' vacía en .env: MODEL_BACKEND=tflite la necesita")
+        from infrastructure.model.tflite_model import TFLiteModel
+        return TFLiteModel(tflite_path, num_threads=tflite_threads or None)
+
+    from infrastructure.model.Tm_saved_model import TMSavedModel
+    return TMSavedModel(
+        saved_model_dir,
+        input_size=input_size,
+        warmup_runs=warmup_runs,
+        jit_compile=jit_compile,
+    )
@@ -0,0 +1,157 @@
+'''
+TFLiteModel ejecuta una conversión TFLite del modelo de Teachable Machine con la misma interfaz
+que TMSavedModel.
+    1.-En el constructor carga el archivo .tflite con ai_edge_litert o tflite_runtime si están
+    instalados (más livianos) o, si no, con tf.lite de TensorFlow, y reserva los tensores una sola vez.
+    2.-predict recibe el tensor preprocesado (float32 0–1 o uint8 0–255), lo cuantiza si el modelo
+    es entero, ejecuta el intérprete y devuelve un dict {"output": ...} ya descuantizado, igual que
+    la firma serving_default, para que el motor de inferencia no note la diferencia.
+    3.-convert_saved_model convierte el SavedModel a .tflite en float32, float16 o entero completo
+    (int8), calibrando este último con imágenes de ejemplo de una carpeta.
+Si algo falla al cargar o ejecutar, corta con mensajes de error claros igual que TMSavedModel.
+'''
+import os
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from interfaces import IModel
+
+TFLITE_MODES = ("float32", "float16", "int8")
+
+
+def _load_interpreter_class():
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter
+
+
+def default_tflite_path(saved_model_dir: str, mode: str) -> str:
+    """Ruta del .tflite junto al SavedModel, dentro de la carpeta converted_savedmodel."""
+    base = os.path.dirname(os.path.normpath(saved_model_dir))
+    return os.path.join(base, f"model_{mode}.tflite")
+
+
+class TFLiteModel(IModel):
+    def __init__(self, model_path: str, num_threads: Optional[int] = None) -> None:
+        if not os.path.exists(model_path):
+            print(f"[ERROR] Ha ocurrido un error con el modelo, no se encontró: {model_path}")
+            raise FileNotFoundError(f"No se encontró el modelo TFLite: {model_path}")
+        try:
+            print("Cargando modelo TFLite…")
+            Interpreter = _load_interpreter_class()
+            self._interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+            self._input = self._interpreter.get_input_details()[0]
+            self._output = self._interpreter.get_output_details()[0]
+            self._resize_batch(int(self._input["shape"][0]))
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al cargar el modelo TFLite: {e}")
+            raise
+
+    def _resize_batch(self, batch: int) -> None:
+        shape = list(self._input["shape"])
+        shape[0] = batch
+        self._interpreter.resize_tensor_input(self._input["index"], shape)
+        self._interpreter.allocate_tensors()
+        self._batch = batch
+
+    def _prepare_input(self, x: np.ndarray) -> np.ndarray:
+        dtype = self._input["dtype"]
+        scale, zero_point = self._input["quantization"]
+        if dtype == np.float32:
+            if x.dtype == np.uint8:
+                return x.astype(np.float32) * (1.0 / 255.0)
+            return x.astype(np.float32, copy=False)
+
+        # Modelo entero: se lleva la entrada a la escala 0–1 y se cuantiza.
+        if x.dtype == np.uint8 and dtype == np.uint8 and zero_point == 0 \
+                and abs(scale * 255.0 - 1.0) < 1e-3:
+            return x
+        if x.dtype == np.uint8:
+            x = x.astype(np.float32) * (1.0 / 255.0)
+        info = np.iinfo(dtype)
+        q = np.round(x / scale + zero_point)
+        return np.clip(q, info.min, info.max).astype(dtype)
+
+    def predict(self, input_tensor):
+        try:
+            x = np.asarray(input_tensor)
+            if x.shape[0] != self._batch:
+                self._resize_batch(x.shape[0])
+            self._interpreter.set_tensor(self._input["index"], self._prepare_input(x))
+            self._interpreter.invoke()
+            out = self._interpreter.get_tensor(self._output["index"])
+            scale, zero_point = self._output["quantization"]
+            if self._output["dtype"] != np.float32 and scale:
+                out = (out.astype(np.float32) - zero_point) * scale
+            return {"output": out}
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al ejecutar la inferencia del modelo TFLite: {e}")
+            raise
+
+
+def _calibration_frames(calib_dir: str, limit: int) -> List[str]:
+    names = sorted(
+        n for n in os.listdir(calib_dir)
+        if n.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".webp"))
+    )
+    return [os.path.join(calib_dir, n) for n in names[:limit]]
+
+
+def convert_saved_model(saved_model_dir: str, output_path: str, mode: str = "float32",
+                        calib_dir: Optional[str] = None, input_size: int = 224,
+                        max_calib_images: int = 200,
+                        roi: Optional[Tuple[int, int, int, int]] = None) -> str:
+    """Convierte el SavedModel a .tflite y devuelve la ruta escrita.
+
+    Con roi las imágenes de calibración se recortan igual que los frames en la inferencia.
+    """
+    import cv2
+    import tensorflow as tf
+
+    from core.preprocessing.Tm_preprocessor import TMPreprocessor
+
+    if mode not in TFLITE_MODES:
+        raise ValueError(f"Modo TFLite desconocido '{mode}', usa uno de {TFLITE_MODES}")
+
+    converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir)
+    if mode == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif mode == "int8":
+        if not calib_dir or not os.path.isdir(calib_dir):
+            raise ValueError("La cuantización int8 necesita una carpeta de imágenes de calibración")
+        paths = _calibration_frames(calib_dir, max_calib_images)
+        if not paths:
+            raise ValueError(f"No hay imágenes de calibración en {calib_dir}")
+        preprocessor = TMPreprocessor(input_size, roi=roi)
+
+        def representative_dataset() -> Iterator[List[np.ndarray]]:
+            for p in paths:
+                frame = cv2.imread(p, cv2.IMREAD_COLOR)
+                if frame is not None:
+                    yield [preprocessor.preprocess(frame)]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.uint8
+        converter.inference_output_type = tf.uint8
+
+    try:
+        data = converter.convert()
+        with open(output_path, "wb") as f:
+            f.write(data)
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error al convertir el modelo a TFLite: {e}")
+        raise
+    return output_path
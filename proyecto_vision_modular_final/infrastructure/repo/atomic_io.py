@@ -0,0 +1,39 @@
+'''
+Escritura atómica de archivos para los repositorios de inventario.
+    1.-El contenido se escribe primero en un archivo temporal de la misma carpeta (mismo disco),
+    con la misma extensión para que pandas elija el motor correcto.
+    2.-Recién cuando la escritura terminó se reemplaza el archivo original con os.replace, que es
+    atómico: quien lea el archivo ve la versión vieja o la nueva, nunca una a medias.
+    3.-Si algo falla, el temporal se borra y el archivo original queda intacto.
+'''
+import os
+import tempfile
+from typing import Callable
+
+
+def atomic_write(path: str, write: Callable[[str], None]) -> None:
+    """Llama a write(ruta_temporal) y después reemplaza path por el temporal."""
+    folder = os.path.dirname(os.path.abspath(path))
+    base, ext = os.path.splitext(os.path.basename(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{base}.", suffix=f".tmp{ext}", dir=folder)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Escribe texto UTF-8 de forma atómica, forzando los datos a disco antes del reemplazo."""
+    def write(tmp_path: str) -> None:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+    atomic_write(path, write)
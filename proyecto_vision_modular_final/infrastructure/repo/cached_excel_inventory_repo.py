@@ -0,0 +1,180 @@
+'''
+CachedExcelInventoryRepo es un ExcelInventoryRepo con caché en memoria y escritura diferida.
+    1.-La hoja se lee una sola vez y se guarda en memoria junto con un índice nombre → fila; las
+    lecturas siguientes no tocan el disco.
+    2.-Antes de cada operación se compara la fecha de modificación del archivo: si otra persona
+    guardó el Excel, la hoja se vuelve a cargar y se le vuelven a aplicar los cambios propios
+    pendientes. Se guardan como operaciones (sumas de apply_deltas, valores de write_qty) y no
+    como cantidades finales, así un +1 propio se suma sobre lo que guardó la otra estación en
+    lugar de pisarlo.
+    3.-Las escrituras solo modifican la memoria y anotan el cambio como pendiente. Los pendientes
+    se guardan juntos flush_seconds después del primer cambio, al cerrar la ventana de detalle
+    (flush) y al salir de la aplicación (close). Si un guardado automático falla, se reintenta
+    flush_seconds después.
+    4.-Cada guardado es atómico (archivo temporal + os.replace).
+Un clic en +1 deja de leer el Excel tres veces y escribirlo una: la UI no se traba aunque la hoja
+tenga miles de filas.
+'''
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from infrastructure.repo.excel_inventory_repo import (
+    ExcelInventoryRepo,
+    _normalize_df_columns,
+    _pd,
+    _save_df,
+)
+
+
+class CachedExcelInventoryRepo(ExcelInventoryRepo):
+    def __init__(self, path: str, flush_seconds: float = 2.0) -> None:
+        self._lock = threading.RLock()
+        self._flush_seconds = flush_seconds
+        self._df = None
+        self._rows: Dict[str, int] = {}
+        self._mtime: Optional[int] = None
+        # Cambios aún no guardados por componente: ("set", cantidad) o ("add", diferencia).
+        self._dirty: Dict[str, List[Tuple[str, int]]] = {}
+        self._timer: Optional[threading.Timer] = None
+
+        self.loads = 0
+        self.flushes = 0
+        super().__init__(path)
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self._path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load_if_stale(self) -> None:
+        mtime = self._file_mtime()
+        if self._df is not None and mtime == self._mtime:
+            return
+        df = _normalize_df_columns(_pd().read_excel(self._path))
+        self._df = df
+        self._mtime = mtime
+        self._rows = {}
+        for i, name in zip(df.index, df["Componentes"].astype(str).str.strip()):
+            self._rows.setdefault(name, i)
+        self.loads += 1
+        # Los cambios propios que aún no se guardaron se aplican sobre la versión nueva.
+        for name, changes in self._dirty.items():
+            qty = self._current(name)
+            for op, value in changes:
+                qty = value if op == "set" else max(0, qty + value)
+            self._set(name, qty)
+
+    def _current(self, component_name: str) -> int:
+        row = self._rows.get(component_name)
+        return 0 if row is None else int(self._df.at[row, "Cantidad"])
+
+    def _set(self, component_name: str, qty: int) -> None:
+        row = self._rows.get(component_name)
+        if row is None:
+            row = len(self._df)
+            self._df.loc[row] = [component_name, qty]
+            self._rows[component_name] = row
+        else:
+            self._df.at[row, "Cantidad"] = qty
+
+    def _mark_dirty(self, component_name: str, change: Optional[Tuple[str, int]]) -> None:
+        changes = self._dirty.setdefault(component_name, [])
+        if change is not None:
+            if change[0] == "set":
+                # Un valor absoluto reemplaza todo lo anterior del componente.
+                changes.clear()
+            changes.append(change)
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        if self._timer is None and self._flush_seconds > 0 and self._dirty:
+            self._timer = threading.Timer(self._flush_seconds, self._timer_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timer_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # El error ya se imprimió en flush; los cambios siguen pendientes y se reintenta.
+            with self._lock:
+                self._arm_timer()
+
+    def read_qty(self, component_name: str) -> int:
+        try:
+            with self._lock:
+                self._load_if_stale()
+                row = self._rows.get(component_name)
+                if row is None:
+                    # La fila nueva se guarda con el próximo flush (sin cambio de cantidad).
+                    self._set(component_name, 0)
+                    self._mark_dirty(component_name, None)
+                    return 0
+                return int(self._df.at[row, "Cantidad"])
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer la cantidad desde el Excel: {e}")
+            raise
+
+    def write_qty(self, component_name: str, qty: int) -> None:
+        try:
+            qty = max(0, int(qty))
+            with self._lock:
+                self._load_if_stale()
+                self._set(component_name, qty)
+                self._mark_dirty(component_name, ("set", qty))
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al escribir la cantidad en el Excel: {e}")
+            raise
+
+    def read_all(self) -> Dict[str, int]:
+        try:
+            with self._lock:
+                self._load_if_stale()
+                return {
+                    name: int(self._df.at[row, "Cantidad"]) for name, row in self._rows.items()
+                }
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer el inventario desde el Excel: {e}")
+            raise
+
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        try:
+            with self._lock:
+                self._load_if_stale()
+                result = {}
+                for name, delta in deltas.items():
+                    qty = max(0, self._current(name) + int(delta))
+                    self._set(name, qty)
+                    self._mark_dirty(name, ("add", int(delta)))
+                    result[name] = qty
+                return result
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al aplicar cambios de inventario en el Excel: {e}")
+            raise
+
+    def flush(self) -> None:
+        """Guarda en el Excel todos los cambios pendientes en una sola escritura."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            try:
+                self._load_if_stale()
+                _save_df(self._path, self._df)
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al guardar el Excel: {e}")
+                raise
+            self._mtime = self._file_mtime()
+            self._dirty.clear()
+            self.flushes += 1
+
+    def close(self) -> None:
+        self.flush()
@@ -5,17 +5,28 @@ ExcelInventoryRepo es el módulo que conecta la aplicación con el inventario en
     la tabla, lo crea con cantidad 0.
     3.-write_qty actualiza o inserta la cantidad en el Excel, corrigiendo valores negativos y 
     guardando siempre la estructura normalizada.
+    4.-read_all devuelve todo el inventario y apply_deltas aplica un lote de sumas/restas con una
+    sola lectura y una sola escritura del archivo.
 Si algo falla en lectura o escritura, lanza errores claros y detiene el flujo para evitar 
 inconsistencias en los datos.
+pandas se importa recién en el primer uso para no alargar el arranque de la aplicación.
+Cada guardado se hace en un archivo temporal que después reemplaza al Excel (atomic_io), así un
+corte a mitad de escritura no deja el inventario corrupto.
 '''
 
 import os
-import pandas as pd
+from typing import Dict
 
+from infrastructure.repo.atomic_io import atomic_write
 from interfaces import IInventoryRepo
 
 
-def _normalize_df_columns(df: pd.DataFrame) -> pd.DataFrame:
+def _pd():
+    import pandas as pd
+    return pd
+
+
+def _normalize_df_columns(df: "pd.DataFrame") -> "pd.DataFrame":
     cols = [c.strip() for c in df.columns]
     df.columns = cols
     if "Componentes" not in df.columns or "Cantidad" not in df.columns:
@@ -23,12 +34,24 @@ def _normalize_df_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _save_df(path: str, df: "pd.DataFrame") -> None:
+    atomic_write(path, lambda tmp_path: df.to_excel(tmp_path, index=False))
+
+
+def _to_mapping(df: "pd.DataFrame") -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    for name, qty in zip(df["Componentes"].astype(str).str.strip(), df["Cantidad"].fillna(0)):
+        result.setdefault(name, int(qty))
+    return result
+
+
 class ExcelInventoryRepo(IInventoryRepo):
     def __init__(self, path: str) -> None:
         self._path = path
         self.ensure_schema()
 
     def ensure_schema(self) -> None:
+        pd = _pd()
         try:
             if not os.path.exists(self._path):
                 data = {
@@ -41,7 +64,7 @@ class ExcelInventoryRepo(IInventoryRepo):
                     "Cantidad": [0, 0, 0, 0],
                 }
                 df = pd.DataFrame(data)
-                df.to_excel(self._path, index=False)
+                _save_df(self._path, df)
             else:
                 try:
                     df = pd.read_excel(self._path)
@@ -56,19 +79,20 @@ class ExcelInventoryRepo(IInventoryRepo):
                         ],
                         "Cantidad": [0, 0, 0, 0],
                     }
-                    pd.DataFrame(data).to_excel(self._path, index=False)
+                    _save_df(self._path, pd.DataFrame(data))
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al verificar/crear el Excel: {e}")
             raise
 
     def read_qty(self, component_name: str) -> int:
+        pd = _pd()
         try:
             df = pd.read_excel(self._path)
             df = _normalize_df_columns(df)
             row = df.loc[df["Componentes"].astype(str).str.strip() == component_name]
             if row.empty:
                 df.loc[len(df)] = [component_name, 0]
-                df.to_excel(self._path, index=False)
+                _save_df(self._path, df)
                 return 0
             return int(row["Cantidad"].iloc[0])
         except Exception as e:
@@ -76,6 +100,7 @@ class ExcelInventoryRepo(IInventoryRepo):
             raise
 
     def write_qty(self, component_name: str, qty: int) -> None:
+        pd = _pd()
         try:
             if qty < 0:
                 qty = 0
@@ -86,7 +111,38 @@ class ExcelInventoryRepo(IInventoryRepo):
                 df.loc[len(df)] = [component_name, qty]
             else:
                 df.loc[mask, "Cantidad"] = int(qty)
-            df.to_excel(self._path, index=False)
+            _save_df(self._path, df)
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al escribir la cantidad en el Excel: {e}")
             raise
+
+    def read_all(self) -> Dict[str, int]:
+        pd = _pd()
+        try:
+            df = _normalize_df_columns(pd.read_excel(self._path))
+            return _to_mapping(df)
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer el inventario desde el Excel: {e}")
+            raise
+
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        pd = _pd()
+        try:
+            df = _normalize_df_columns(pd.read_excel(self._path))
+            names = df["Componentes"].astype(str).str.strip()
+            result = {}
+            for name, delta in deltas.items():
+                mask = names == name
+                if not mask.any():
+                    qty = max(0, int(delta))
+                    df.loc[len(df)] = [name, qty]
+                    names = df["Componentes"].astype(str).str.strip()
+                else:
+                    qty = max(0, int(df.loc[mask, "Cantidad"].iloc[0]) + int(delta))
+                    df.loc[mask, "Cantidad"] = qty
+                result[name] = qty
+            _save_df(self._path, df)
+            return result
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al aplicar cambios de inventario en el Excel: {e}")
+            raise
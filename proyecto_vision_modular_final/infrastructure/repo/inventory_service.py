@@ -0,0 +1,209 @@
+'''
+InventoryServer atiende a varias estaciones sobre un único repositorio de inventario.
+    1.-Escucha en un socket TCP local; el protocolo es una línea JSON por petición
+    {"id", "op", "args"} y una línea JSON por respuesta {"id", "ok", "result" | "error"}.
+    2.-Cada conexión puede enviar varias peticiones sin esperar respuesta (pipelining); las
+    respuestas vuelven en el mismo orden.
+    3.-Todas las peticiones de todas las conexiones pasan por una sola cola que atiende un único
+    hilo, así los cambios se aplican en un orden total y ninguna suma se pierde.
+    4.-El guardado a disco (repo.flush) se hace por lotes: como mucho una vez cada flush_seconds
+    con todos los cambios acumulados, y siempre al detener el servidor. Cuenta como cambio
+    cualquier operación que pueda escribir, incluso read_qty (Excel y SQLite agregan la fila si
+    el componente no existe).
+    5.-close() detiene el servidor, guarda y cierra el repositorio (compacta el diario JSON y
+    cierra las conexiones SQLite).
+    6.-El protocolo no cifra nada. Escuchando en localhost (lo recomendado) no hace falta más;
+    para escuchar en otra interfaz se exige un token compartido que cada petición debe traer en
+    el campo "token", y se avisa que solo conviene hacerlo en una red de confianza.
+Operaciones: ensure_schema, read_qty, write_qty, read_all, apply_deltas y flush.
+'''
+import hmac
+import ipaddress
+import json
+import queue
+import socket
+import socketserver
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+
+from interfaces import IInventoryRepo
+
+INVENTORY_OPS = ("ensure_schema", "read_qty", "write_qty", "read_all", "apply_deltas", "flush")
+_WRITING_OPS = ("ensure_schema", "read_qty", "write_qty", "apply_deltas")
+
+_STOP = object()
+
+
+def is_loopback(host: str) -> bool:
+    """True si host solo es accesible desde esta máquina (localhost, 127.x, ::1)."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    server: "_TCPServer"
+
+    def handle(self) -> None:
+        lock = threading.Lock()
+
+        def reply(response: Dict[str, object]) -> None:
+            data = (json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8")
+            with lock:
+                try:
+                    self.wfile.write(data)
+                    self.wfile.flush()
+                except OSError:
+                    pass
+
+        inventory = self.server.inventory
+        inventory.track(self.connection, True)
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    reply({"id": None, "ok": False, "error": f"Petición inválida: {e}"})
+                    continue
+                inventory.enqueue(request, reply)
+        except OSError:
+            pass
+        finally:
+            inventory.track(self.connection, False)
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    inventory: "InventoryServer"
+
+
+class InventoryServer:
+    def __init__(self, repo: IInventoryRepo, host: str = "127.0.0.1", port: int = 8766,
+                 flush_seconds: float = 1.0, token: str = "") -> None:
+        if not is_loopback(host):
+            if not token:
+                print(f"[ERROR] Ha ocurrido un error: el servidor de inventario en {host} "
+                      f"necesita INVENTORY_SERVER_TOKEN.")
+                raise ValueError(
+                    f"Escuchar en {host} (fuera de localhost) requiere INVENTORY_SERVER_TOKEN"
+                )
+            print(f"[AVISO] El servidor de inventario escucha en {host}: cualquiera en esa red con "
+                  f"el token puede cambiar cantidades. Úselo solo en una red de confianza.")
+        self._repo = repo
+        self._token = token
+        self._flush_seconds = flush_seconds
+        self._queue: "queue.Queue" = queue.Queue()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._tcp = _TCPServer((host, port), _ConnectionHandler)
+        self._tcp.inventory = self
+        self._worker: Optional[threading.Thread] = None
+        self._serve_thread: Optional[threading.Thread] = None
+        self._connections: Set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+        self.requests = 0
+        self.flushes = 0
+
+    @property
+    def address(self):
+        return self._tcp.server_address[:2]
+
+    def track(self, conn: socket.socket, alive: bool) -> None:
+        with self._connections_lock:
+            if alive:
+                self._connections.add(conn)
+            else:
+                self._connections.discard(conn)
+
+    def enqueue(self, request: Dict[str, object], reply: Callable[[Dict[str, object]], None]) -> None:
+        if self._token and not hmac.compare_digest(str(request.get("token", "")), self._token):
+            reply({"id": request.get("id"), "ok": False, "error": "Token inválido"})
+            return
+        self._queue.put((request, reply))
+
+    def _execute(self, request: Dict[str, object]):
+        op = request.get("op")
+        if op not in INVENTORY_OPS:
+            raise ValueError(f"Operación desconocida '{op}'")
+        args = request.get("args") or {}
+        if op in _WRITING_OPS:
+            self._dirty = True
+        if op == "flush":
+            self._flush()
+            return None
+        return getattr(self._repo, op)(**args)
+
+    def _flush(self) -> None:
+        if not self._dirty:
+            return
+        self._repo.flush()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self.flushes += 1
+
+    def _loop(self) -> None:
+        while True:
+            timeout = max(0.0, self._flush_seconds - (time.monotonic() - self._last_flush))
+            try:
+                item = self._queue.get(timeout=timeout if self._dirty else None)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                request, reply = item
+                self.requests += 1
+                try:
+                    result = self._execute(request)
+                    reply({"id": request.get("id"), "ok": True, "result": result})
+                except Exception as e:
+                    reply({"id": request.get("id"), "ok": False, "error": str(e)})
+            if time.monotonic() - self._last_flush >= self._flush_seconds:
+                try:
+                    self._flush()
+                except Exception as e:
+                    print(f"[ERROR] Ha ocurrido un error al guardar el inventario: {e}")
+        try:
+            self._flush()
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al guardar el inventario: {e}")
+
+    def start(self) -> None:
+        """Arranca el hilo que aplica los cambios y el hilo que acepta conexiones."""
+        if self._worker is not None:
+            return
+        self._worker = threading.Thread(target=self._loop, name="inventario", daemon=True)
+        self._worker.start()
+        self._serve_thread = threading.Thread(
+            target=self._tcp.serve_forever, name="inventario-tcp", daemon=True
+        )
+        self._serve_thread.start()
+
+    def close(self) -> None:
+        """Deja de aceptar conexiones, aplica lo que quedó en cola, guarda y cierra el repositorio."""
+        if self._worker is None:
+            return
+        self._tcp.shutdown()
+        self._tcp.server_close()
+        # Las conexiones abiertas se cortan para que los clientes reconecten al próximo servidor.
+        with self._connections_lock:
+            for conn in list(self._connections):
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self._queue.put(_STOP)
+        self._worker.join(timeout=10.0)
+        self._worker = None
+        try:
+            self._repo.close()
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al cerrar el inventario: {e}")
@@ -0,0 +1,152 @@
+'''
+JournaledJsonInventoryRepo es un JsonInventoryRepo que mantiene el inventario en memoria y
+registra cada cambio en un diario (journal) en lugar de reescribir todo el JSON.
+    1.-Al arrancar carga la foto (el mismo JSON de siempre) y reaplica el diario
+    <archivo>.journal, una línea JSON por cambio con la cantidad final del componente.
+    2.-Cada write_qty/apply_deltas agrega una línea al diario: la escritura tiene tamaño fijo sin
+    importar cuántos componentes haya en el inventario.
+    3.-Cada compact_every cambios (y al cerrar) el estado se compacta en una foto nueva escrita
+    de forma atómica, y recién después se vacía el diario. Si la compactación automática falla,
+    el cambio igual quedó guardado en el diario: se informa el error y se reintenta al llegar otra
+    vez a compact_every cambios o al cerrar, sin hacer fallar la escritura.
+    4.-Como cada línea guarda la cantidad final (no la diferencia), reaplicar una línea que ya
+    estaba en la foto no cambia nada. Una última línea cortada por un apagón se descarta y el
+    diario se recorta hasta la última línea completa, así lo que se agregue después queda en una
+    línea propia. Una línea dañada en medio del diario no se saltea: se informa y no se arranca.
+'''
+import json
+import os
+import threading
+from typing import Dict
+
+from infrastructure.repo.atomic_io import atomic_write_text
+from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+
+
+class JournaledJsonInventoryRepo(JsonInventoryRepo):
+    def __init__(self, path: str, compact_every: int = 1000, fsync: bool = False) -> None:
+        self._journal_path = path + ".journal"
+        self._compact_every = max(1, compact_every)
+        self._fsync = fsync
+        self._lock = threading.RLock()
+        self._state: Dict[str, int] = {}
+        self._journal = None
+        self._entries = 0
+        self._compact_at = self._compact_every
+        super().__init__(path)
+        self._load()
+
+    @property
+    def journal_entries(self) -> int:
+        return self._entries
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                self._state = {name: int(qty) for name, qty in json.load(f).items()}
+            if os.path.exists(self._journal_path):
+                self._replay()
+            self._journal = open(self._journal_path, 'a', encoding='utf-8')
+        except Exception as e:
+            raise RuntimeError(f"Error al cargar el inventario JSON con diario: {e}")
+
+    def _replay(self) -> None:
+        with open(self._journal_path, 'rb') as f:
+            data = f.read()
+        good = 0
+        while good < len(data):
+            end = data.find(b"\n", good)
+            line = data[good:] if end == -1 else data[good:end]
+            try:
+                entry = json.loads(line.decode('utf-8'))
+                name, qty = entry["n"], int(entry["q"])
+            except (ValueError, KeyError, TypeError):
+                if end != -1 and data[end + 1:].strip():
+                    print(f"[ERROR] Ha ocurrido un error: línea dañada en {self._journal_path} "
+                          f"(byte {good}); revise el diario antes de volver a arrancar.")
+                    raise ValueError(f"Línea dañada en el diario (byte {good})")
+                break
+            if end == -1:
+                # Última línea sin salto: se trata como cortada para no pegarle la siguiente.
+                break
+            self._state[name] = qty
+            self._entries += 1
+            good = end + 1
+        if good < len(data):
+            # Corte durante la última escritura: se recorta hasta la última línea completa.
+            with open(self._journal_path, 'r+b') as f:
+                f.truncate(good)
+
+    def _append(self, changes: Dict[str, int]) -> None:
+        lines = "".join(
+            json.dumps({"n": name, "q": qty}, ensure_ascii=False) + "\n"
+            for name, qty in changes.items()
+        )
+        self._journal.write(lines)
+        self._journal.flush()
+        if self._fsync:
+            os.fsync(self._journal.fileno())
+        self._state.update(changes)
+        self._entries += len(changes)
+        if self._entries >= self._compact_at:
+            try:
+                self.compact()
+            except RuntimeError as e:
+                # El cambio ya está en el diario y en memoria: la escritura no debe fallar, o quien
+                # la pidió la reenviaría y se contaría dos veces.
+                print(f"[ERROR] Ha ocurrido un error al compactar el inventario JSON: {e}")
+                self._compact_at = self._entries + self._compact_every
+
+    def read_qty(self, component_name: str) -> int:
+        with self._lock:
+            return self._state.get(component_name, 0)
+
+    def read_all(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._state)
+
+    def write_qty(self, component_name: str, qty: int) -> None:
+        try:
+            with self._lock:
+                self._append({component_name: max(0, int(qty))})
+        except Exception as e:
+            raise RuntimeError(f"Error al escribir la cantidad del componente '{component_name}': {e}")
+
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        try:
+            with self._lock:
+                result = {
+                    name: max(0, self._state.get(name, 0) + int(delta))
+                    for name, delta in deltas.items()
+                }
+                self._append(result)
+                return result
+        except Exception as e:
+            raise RuntimeError(f"Error al aplicar cambios al inventario: {e}")
+
+    def compact(self) -> None:
+        """Escribe la foto completa de forma atómica y vacía el diario."""
+        try:
+            with self._lock:
+                atomic_write_text(self._path, json.dumps(self._state, indent=4))
+                # La foto ya tiene todo: recién ahora se puede vaciar el diario.
+                self._journal.close()
+                self._journal = open(self._journal_path, 'w', encoding='utf-8')
+                self._entries = 0
+                self._compact_at = self._compact_every
+        except Exception as e:
+            raise RuntimeError(f"Error al compactar el inventario JSON: {e}")
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._journal is not None:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._journal is None:
+                return
+            self.compact()
+            self._journal.close()
+            self._journal = None
@@ -5,12 +5,19 @@ Json InventoryRepo es el módulo que conecta la aplicación con el inventario en
     3.-write_qty actualiza o inserta la cantidad en el json, corrigiendo valores negativos y 
     guardando siempre la estructura normalizada.
     4._read_qty permite leer la cantidad actual de un componente, y si el componente no está en
+    5.-read_all devuelve todo el inventario y apply_deltas aplica un lote de sumas/restas con una
+    sola lectura y una sola escritura del archivo.
+Cada escritura reemplaza el archivo de forma atómica (atomic_io), así un corte a mitad de
+escritura no deja un JSON a medias.
 Si algo falla en lectura o escritura, lanza errores claros y detiene el flujo para evitar 
 inconsistencias en los datos.
 '''
 
 import os
 import json
+from typing import Dict
+
+from infrastructure.repo.atomic_io import atomic_write_text
 from interfaces import IInventoryRepo
 class JsonInventoryRepo(IInventoryRepo):
     def __init__(self, path: str) -> None:
@@ -26,8 +33,7 @@ class JsonInventoryRepo(IInventoryRepo):
                     "7805": 0,
                     "7404": 0,
                 }
-                with open(self._path, 'w', encoding='utf-8') as f:
-                    json.dump(initial_data, f, indent=4)
+                atomic_write_text(self._path, json.dumps(initial_data, indent=4))
             else:
                 with open(self._path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -49,9 +55,25 @@ class JsonInventoryRepo(IInventoryRepo):
             with open(self._path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             data[component_name] = max(0, qty)
-            with open(self._path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            atomic_write_text(self._path, json.dumps(data, indent=4))
         except Exception as e:
             raise RuntimeError(f"Error al escribir la cantidad del componente '{component_name}': {e}")
 
+    def read_all(self) -> Dict[str, int]:
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                return {name: int(qty) for name, qty in json.load(f).items()}
+        except Exception as e:
+            raise RuntimeError(f"Error al leer el inventario: {e}")
 
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            result = {}
+            for name, delta in deltas.items():
+                data[name] = result[name] = max(0, int(data.get(name, 0)) + int(delta))
+            atomic_write_text(self._path, json.dumps(data, indent=4))
+            return result
+        except Exception as e:
+            raise RuntimeError(f"Error al aplicar cambios al inventario: {e}")
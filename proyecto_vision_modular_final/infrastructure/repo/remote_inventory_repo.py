@@ -0,0 +1,152 @@
+'''
+RemoteInventoryRepo es un IInventoryRepo que delega en un InventoryServer por socket.
+    1.-Mantiene un pool de conexiones abiertas: cada llamada toma una, envía la petición, lee la
+    respuesta y la devuelve al pool, sin abrir un socket nuevo por operación.
+    2.-pipeline() envía varias peticiones seguidas por la misma conexión y recién después lee
+    todas las respuestas, para pagar una sola ida y vuelta.
+    3.-Si una conexión reutilizada resulta cerrada (por ejemplo, el servidor se reinició), las
+    operaciones que se pueden repetir sin efecto doble se reintentan una vez con una conexión
+    nueva; apply_deltas no se reintenta para no sumar dos veces.
+    4.-Cada respuesta se valida contra el id de su petición; si no coincide, la conexión se
+    descarta como desincronizada.
+    5.-Si se indica token (INVENTORY_SERVER_TOKEN), viaja en cada petición.
+Los errores del servidor se imprimen y se lanzan como RuntimeError, igual que en el resto de repos.
+'''
+import json
+import queue
+import socket
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from interfaces import IInventoryRepo
+
+_IDEMPOTENT_OPS = ("ensure_schema", "read_qty", "write_qty", "read_all", "flush")
+
+
+class _Connection:
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+        self.used = False
+
+    def send(self, requests: Sequence[Dict[str, object]]) -> None:
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in requests)
+        self.sock.sendall(data.encode("utf-8"))
+
+    def receive(self) -> Dict[str, object]:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("El servidor de inventario cerró la conexión")
+        return json.loads(line)
+
+    def close(self) -> None:
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RemoteInventoryRepo(IInventoryRepo):
+    def __init__(self, host: str = "127.0.0.1", port: int = 8766, pool_size: int = 4,
+                 timeout: float = 5.0, token: str = "") -> None:
+        self._host = host
+        self._token = token
+        self._port = port
+        self._timeout = timeout
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=max(1, pool_size))
+        self._ids = 0
+        self._ids_lock = threading.Lock()
+        self.connections_opened = 0
+        self.ensure_schema()
+
+    def _next_id(self) -> int:
+        with self._ids_lock:
+            self._ids += 1
+            return self._ids
+
+    def _acquire(self) -> _Connection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            self.connections_opened += 1
+            return _Connection(self._host, self._port, self._timeout)
+
+    def _release(self, conn: _Connection) -> None:
+        conn.used = True
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _round_trip(self, calls: Sequence[Tuple[str, Dict[str, object]]]) -> List[Dict[str, object]]:
+        retry = all(op in _IDEMPOTENT_OPS for op, _ in calls)
+        while True:
+            conn = self._acquire()
+            requests = [{"id": self._next_id(), "op": op, "args": args} for op, args in calls]
+            if self._token:
+                for request in requests:
+                    request["token"] = self._token
+            try:
+                conn.send(requests)
+                responses = [conn.receive() for _ in requests]
+                for request, response in zip(requests, responses):
+                    if response.get("id") != request["id"]:
+                        raise ValueError(
+                            f"Respuesta {response.get('id')} para la petición {request['id']}"
+                        )
+            except (OSError, ConnectionError, ValueError):
+                conn.close()
+                if retry and conn.used:
+                    retry = False
+                    continue
+                raise
+            self._release(conn)
+            return responses
+
+    def pipeline(self, calls: Sequence[Tuple[str, Dict[str, object]]]) -> List[object]:
+        """Envía [(op, args), ...] por una sola conexión y devuelve los resultados en orden."""
+        try:
+            responses = self._round_trip(calls)
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al comunicarse con el servidor de inventario: {e}")
+            raise RuntimeError(f"Servidor de inventario no disponible: {e}")
+        results = []
+        for response in responses:
+            if not response.get("ok"):
+                error = response.get("error")
+                print(f"[ERROR] Ha ocurrido un error en el servidor de inventario: {error}")
+                raise RuntimeError(error)
+            results.append(response.get("result"))
+        return results
+
+    def _call(self, op: str, **args) -> object:
+        return self.pipeline([(op, args)])[0]
+
+    def ensure_schema(self) -> None:
+        self._call("ensure_schema")
+
+    def read_qty(self, component_name: str) -> int:
+        return int(self._call("read_qty", component_name=component_name))
+
+    def write_qty(self, component_name: str, qty: int) -> None:
+        self._call("write_qty", component_name=component_name, qty=int(qty))
+
+    def read_all(self) -> Dict[str, int]:
+        return {name: int(qty) for name, qty in self._call("read_all").items()}
+
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        result = self._call("apply_deltas", deltas={k: int(v) for k, v in deltas.items()})
+        return {name: int(qty) for name, qty in result.items()}
+
+    def flush(self) -> None:
+        self._call("flush")
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn: Optional[_Connection] = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
@@ -0,0 +1,65 @@
+'''
+repo_factory crea el repositorio de inventario configurado con INVENTORY_BACKEND.
+    1.-excel: ExcelInventoryRepo, o CachedExcelInventoryRepo si flush_seconds > 0.
+    2.-sqlite: SqliteInventoryRepo en db_path (por defecto, el Excel con extensión .db). Si la base
+    se acaba de crear y el Excel existe, se importan sus cantidades.
+    3.-json: JsonInventoryRepo en json_path (por defecto, el Excel con extensión .json).
+    4.-json_journal: JournaledJsonInventoryRepo sobre el mismo archivo, con diario y compactación
+    cada compact_every cambios.
+    5.-remote: RemoteInventoryRepo, cliente de un InventoryServer (inventory_server.py) en
+    server_host:server_port que atiende a todas las estaciones.
+pandas solo se importa si el backend elegido lo necesita.
+'''
+import os
+
+from interfaces import IInventoryRepo
+
+INVENTORY_BACKENDS = ("excel", "sqlite", "json", "json_journal", "remote")
+
+
+def default_db_path(excel_path: str) -> str:
+    return os.path.splitext(excel_path)[0] + ".db"
+
+
+def default_json_path(excel_path: str) -> str:
+    return os.path.splitext(excel_path)[0] + ".json"
+
+
+def create_inventory_repo(backend: str, excel_path: str, db_path: str = "",
+                          flush_seconds: float = 0.0, json_path: str = "",
+                          compact_every: int = 1000, server_host: str = "127.0.0.1",
+                          server_port: int = 8766, server_token: str = "") -> IInventoryRepo:
+    if backend not in INVENTORY_BACKENDS:
+        raise ValueError(
+            f"INVENTORY_BACKEND desconocido '{backend}', usa uno de {INVENTORY_BACKENDS}"
+        )
+
+    if backend == "remote":
+        from infrastructure.repo.remote_inventory_repo import RemoteInventoryRepo
+        return RemoteInventoryRepo(server_host, server_port, token=server_token)
+
+    if backend == "sqlite":
+        from infrastructure.repo.sqlite_inventory_repo import SqliteInventoryRepo
+
+        repo = SqliteInventoryRepo(db_path or default_db_path(excel_path))
+        if repo.created and os.path.exists(excel_path):
+            n = repo.import_excel(excel_path)
+            print(f"Inventario importado desde {excel_path} ({n} componentes)")
+        return repo
+
+    if backend == "json":
+        from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+        return JsonInventoryRepo(json_path or default_json_path(excel_path))
+
+    if backend == "json_journal":
+        from infrastructure.repo.journaled_json_inventory_repo import JournaledJsonInventoryRepo
+        return JournaledJsonInventoryRepo(
+            json_path or default_json_path(excel_path), compact_every=compact_every
+        )
+
+    if flush_seconds > 0:
+        from infrastructure.repo.cached_excel_inventory_repo import CachedExcelInventoryRepo
+        return CachedExcelInventoryRepo(excel_path, flush_seconds=flush_seconds)
+
+    from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+    return ExcelInventoryRepo(excel_path)
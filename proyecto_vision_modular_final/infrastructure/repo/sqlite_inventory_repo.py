@@ -0,0 +1,191 @@
+'''
+SqliteInventoryRepo guarda el inventario en una base SQLite en lugar de un Excel.
+    1.-La base usa journal_mode=WAL: las lecturas no bloquean a las escrituras y varias
+    estaciones pueden usar el mismo archivo a la vez.
+    2.-La tabla inventario tiene un índice único por nombre, así cada lectura o ajuste busca una
+    sola fila en lugar de leer todo el archivo.
+    3.-apply_deltas (y adjust_qty para un solo componente) suma o resta en la propia base con
+    UPDATE ... SET cantidad = max(0, cantidad + ?), todo el lote dentro de una transacción: dos
+    estaciones que suman a la vez no se pisan.
+    4.-import_excel y export_excel pasan los datos desde y hacia el Excel de siempre (columnas
+    Componentes y Cantidad) para que la oficina siga trabajando con la planilla.
+Cada hilo usa su propia conexión; close() cierra las de todos los hilos. Si algo falla, imprime
+el error y lo vuelve a lanzar.
+'''
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from interfaces import IInventoryRepo
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inventario (
+    id       INTEGER PRIMARY KEY,
+    nombre   TEXT    NOT NULL,
+    cantidad INTEGER NOT NULL DEFAULT 0 CHECK (cantidad >= 0)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_inventario_nombre ON inventario (nombre);
+"""
+
+_DEFAULT_COMPONENTS = (
+    "Modulos Rele de Doble canal",
+    "Diodo Zener",
+    "7805",
+    "7404",
+)
+
+
+class SqliteInventoryRepo(IInventoryRepo):
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self.created = not os.path.exists(path)
+        self.ensure_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: las transacciones se abren a mano con BEGIN IMMEDIATE.
+            # check_same_thread=False solo para que close() pueda cerrarla desde otro hilo; cada
+            # conexión la sigue usando únicamente el hilo que la abrió.
+            conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def ensure_schema(self) -> None:
+        try:
+            conn = self._conn()
+            conn.executescript(_SCHEMA)
+            if self.created:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO inventario (nombre, cantidad) VALUES (?, 0)",
+                    [(name,) for name in _DEFAULT_COMPONENTS],
+                )
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al verificar/crear la base SQLite: {e}")
+            raise
+
+    def read_qty(self, component_name: str) -> int:
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT cantidad FROM inventario WHERE nombre = ?", (component_name,)
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO inventario (nombre, cantidad) VALUES (?, 0)",
+                    (component_name,),
+                )
+                return 0
+            return int(row[0])
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer la cantidad desde SQLite: {e}")
+            raise
+
+    def write_qty(self, component_name: str, qty: int) -> None:
+        try:
+            self._conn().execute(
+                "INSERT INTO inventario (nombre, cantidad) VALUES (?, ?) "
+                "ON CONFLICT (nombre) DO UPDATE SET cantidad = excluded.cantidad",
+                (component_name, max(0, int(qty))),
+            )
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al escribir la cantidad en SQLite: {e}")
+            raise
+
+    def read_all(self) -> Dict[str, int]:
+        try:
+            rows = self._conn().execute(
+                "SELECT nombre, cantidad FROM inventario ORDER BY id"
+            ).fetchall()
+            return {name: int(qty) for name, qty in rows}
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al leer el inventario desde SQLite: {e}")
+            raise
+
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        """Aplica todos los ajustes en una sola transacción; nunca baja de 0."""
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR IGNORE INTO inventario (nombre, cantidad) VALUES (?, 0)",
+                [(name,) for name in deltas],
+            )
+            conn.executemany(
+                "UPDATE inventario SET cantidad = max(0, cantidad + ?) WHERE nombre = ?",
+                [(int(delta), name) for name, delta in deltas.items()],
+            )
+            result = {}
+            for name in deltas:
+                result[name] = int(conn.execute(
+                    "SELECT cantidad FROM inventario WHERE nombre = ?", (name,)
+                ).fetchone()[0])
+            conn.execute("COMMIT")
+            return result
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"[ERROR] Ha ocurrido un error al ajustar las cantidades en SQLite: {e}")
+            raise
+
+    def adjust_qty(self, component_name: str, delta: int) -> int:
+        """Suma delta (negativo para restar, nunca baja de 0) y devuelve la cantidad nueva."""
+        return self.apply_deltas({component_name: delta})[component_name]
+
+    def import_excel(self, excel_path: str) -> int:
+        """Copia las cantidades del Excel a la base (reemplaza las existentes); devuelve filas."""
+        from infrastructure.repo.excel_inventory_repo import _normalize_df_columns, _pd
+
+        conn = self._conn()
+        try:
+            df = _normalize_df_columns(_pd().read_excel(excel_path))
+            rows = [
+                (str(name).strip(), max(0, int(qty)))
+                for name, qty in zip(df["Componentes"], df["Cantidad"].fillna(0))
+            ]
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO inventario (nombre, cantidad) VALUES (?, ?) "
+                "ON CONFLICT (nombre) DO UPDATE SET cantidad = excluded.cantidad",
+                rows,
+            )
+            conn.execute("COMMIT")
+            return len(rows)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"[ERROR] Ha ocurrido un error al importar el Excel a SQLite: {e}")
+            raise
+
+    def export_excel(self, excel_path: str) -> int:
+        """Escribe el inventario en un Excel con columnas Componentes/Cantidad; devuelve filas."""
+        from infrastructure.repo.excel_inventory_repo import _pd, _save_df
+
+        try:
+            rows = self._conn().execute(
+                "SELECT nombre, cantidad FROM inventario ORDER BY id"
+            ).fetchall()
+            df = _pd().DataFrame(rows, columns=["Componentes", "Cantidad"])
+            _save_df(excel_path, df)
+            return len(rows)
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al exportar SQLite a Excel: {e}")
+            raise
+
+    def close(self) -> None:
+        """Cierra las conexiones abiertas por todos los hilos."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
@@ -2,16 +2,22 @@
 Interfaces que definen los contratos para cada componente del sistema.
     1.-ICamera define los métodos para abrir, leer y liberar la cámara.
     2.-IPreprocessor define el método para preprocesar imágenes antes de la infer
-    3.-IModel define el método para ejecutar la inferencia en el modelo de IA.
-    4.-IInventoryRepo define los métodos para leer y escribir cantidades en el inventario
+    3.-IModel define el método para ejecutar la inferencia en el modelo de IA; is_ready permite
+    saber si un modelo que carga en segundo plano ya está disponible.
+    4.-IInventoryRepo define los métodos para leer y escribir cantidades en el inventario;
+    read_all y apply_deltas trabajan con todo un lote en una sola lectura/escritura, y flush
+    guarda los cambios que un repositorio con caché todavía tenga en memoria; close libera sus
+    archivos y conexiones al salir.
     5.-IDetailUI define el método para mostrar la interfaz gráfica de detalle del componente.
     6.-IController define el método para iniciar el flujo principal de la aplicación.
+    7.-IDecisionStrategy define cómo se confirma un componente a partir de las predicciones
+    de cada frame.
 Cada interfaz usa métodos abstractos para garantizar que las implementaciones concretas cumplan
 con los contratos necesarios para la correcta interacción entre módulos.
 '''
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 import numpy as np
 
 
@@ -40,6 +46,9 @@ class IModel(ABC):
     def predict(self, input_tensor: Any) -> Any:
         ...
 
+    def is_ready(self) -> bool:
+        return True
+
 
 class IInventoryRepo(ABC):
     @abstractmethod
@@ -54,6 +63,20 @@ class IInventoryRepo(ABC):
     def write_qty(self, component_name: str, qty: int) -> None:
         ...
 
+    @abstractmethod
+    def read_all(self) -> Dict[str, int]:
+        """Devuelve {componente: cantidad} de todo el inventario con una sola lectura."""
+
+    @abstractmethod
+    def apply_deltas(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        """Suma cada delta (sin bajar de 0) en una sola escritura y devuelve las cantidades nuevas."""
+
+    def flush(self) -> None:
+        """Guarda los cambios pendientes; los repositorios que escriben al momento no hacen nada."""
+
+    def close(self) -> None:
+        """Libera archivos y conexiones al salir; los repositorios que no tienen nada no hacen nada."""
+
 
 class IDetailUI(ABC):
     @abstractmethod
@@ -65,3 +88,13 @@ class IController(ABC):
     @abstractmethod
     def run(self, root) -> None:
         ...
+
+
+class IDecisionStrategy(ABC):
+    @abstractmethod
+    def update(self, label: str, conf: float, probs: np.ndarray) -> Optional[Tuple[str, float]]:
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        ...
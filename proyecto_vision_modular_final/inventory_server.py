@@ -0,0 +1,82 @@
+'''
+Servidor de inventario para varias estaciones.
+    1.-Abre el repositorio configurado en INVENTORY_BACKEND (excel, sqlite, json o json_journal)
+    una sola vez; con excel usa la caché en memoria y el servidor decide cuándo guardar.
+    2.-Atiende en INVENTORY_SERVER_HOST:INVENTORY_SERVER_PORT; las estaciones lo usan con
+    INVENTORY_BACKEND=remote.
+    3.-Los cambios de todas las estaciones se aplican en un solo orden y se guardan a disco por
+    lotes cada INVENTORY_SERVER_FLUSH_SECONDS.
+    4.-El protocolo no tiene cifrado: lo recomendado es escuchar solo en localhost. Para atender
+    estaciones de otras máquinas, usar la interfaz de una red de confianza y definir el mismo
+    INVENTORY_SERVER_TOKEN en el servidor y en cada estación (sin token no arranca).
+
+Uso:
+    python inventory_server.py
+    python inventory_server.py --host 192.168.10.5 --port 8766
+'''
+import argparse
+import time
+
+from config.settings import (
+    EXCEL_PATH,
+    INVENTORY_BACKEND,
+    INVENTORY_DB_PATH,
+    INVENTORY_JSON_PATH,
+    INVENTORY_COMPACT_EVERY,
+    INVENTORY_SERVER_HOST,
+    INVENTORY_SERVER_PORT,
+    INVENTORY_SERVER_FLUSH_SECONDS,
+    INVENTORY_SERVER_TOKEN,
+)
+from infrastructure.repo.cached_excel_inventory_repo import CachedExcelInventoryRepo
+from infrastructure.repo.inventory_service import InventoryServer
+from infrastructure.repo.repo_factory import create_inventory_repo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor de inventario para varias estaciones")
+    parser.add_argument("--host", default=INVENTORY_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=INVENTORY_SERVER_PORT)
+    args = parser.parse_args()
+
+    repo = server = None
+    try:
+        if INVENTORY_BACKEND == "remote":
+            raise ValueError("El servidor necesita un INVENTORY_BACKEND local, no 'remote'")
+        if INVENTORY_BACKEND == "excel":
+            # Sin temporizador propio: el servidor guarda por lotes.
+            repo = CachedExcelInventoryRepo(EXCEL_PATH, flush_seconds=0)
+        else:
+            repo = create_inventory_repo(
+                INVENTORY_BACKEND,
+                EXCEL_PATH,
+                db_path=INVENTORY_DB_PATH,
+                json_path=INVENTORY_JSON_PATH,
+                compact_every=INVENTORY_COMPACT_EVERY,
+            )
+        server = InventoryServer(
+            repo,
+            args.host,
+            args.port,
+            flush_seconds=INVENTORY_SERVER_FLUSH_SECONDS,
+            token=INVENTORY_SERVER_TOKEN,
+        )
+        server.start()
+        host, port = server.address
+        print(f"Servidor de inventario ({INVENTORY_BACKEND}) en {host}:{port} (Ctrl+C para salir)")
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("Saliendo…")
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error en el servidor de inventario: {e}")
+    finally:
+        if server is not None:
+            # También guarda y cierra el repositorio.
+            server.close()
+        elif repo is not None:
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+'''
+Herramienta de línea de comandos para pasar el inventario entre SQLite y el Excel.
+    1.-import: copia las cantidades de EXCEL_PATH (o --excel) a la base SQLite.
+    2.-export: escribe la base SQLite en EXCEL_PATH (o --excel) con las columnas Componentes y
+    Cantidad, para que la oficina siga trabajando con la planilla.
+
+Uso:
+    python inventory_tool.py import
+    python inventory_tool.py export --excel Componentes_hoy.xlsx
+'''
+import argparse
+import sys
+
+from config.settings import EXCEL_PATH, INVENTORY_DB_PATH
+from infrastructure.repo.repo_factory import default_db_path
+from infrastructure.repo.sqlite_inventory_repo import SqliteInventoryRepo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Importar/exportar el inventario SQLite")
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("--excel", default=EXCEL_PATH)
+    parser.add_argument("--db", default=INVENTORY_DB_PATH or default_db_path(EXCEL_PATH))
+    args = parser.parse_args()
+
+    repo = None
+    try:
+        repo = SqliteInventoryRepo(args.db)
+        if args.command == "import":
+            n = repo.import_excel(args.excel)
+            print(f"{n} componentes importados de {args.excel} a {args.db}")
+        else:
+            n = repo.export_excel(args.excel)
+            print(f"{n} componentes exportados de {args.db} a {args.excel}")
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error en la herramienta de inventario: {e}")
+        # Código de salida distinto de 0 para que una tarea programada note el fallo.
+        sys.exit(1)
+    finally:
+        if repo is not None:
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,22 @@ por computadora.
     3.-Crea el motor de inferencia y el controlador de la aplicación.
     4.-Arranca el bucle principal de la aplicación, manejando errores globales para evitar 
     fallos silenciosos.      
+    5.-Con HEADLESS=1 no se abren ventanas de OpenCV ni Tk: cada confirmación suma una unidad al
+    inventario y se informa por consola.
+    6.-El modelo se carga en un hilo aparte mientras se abren Tk y la cámara; TensorFlow, pandas y
+    PIL se importan recién cuando se usan. Con --startup-profile se imprime cuánto tardó cada fase.
 '''
 
+import time
+
+_T0 = time.perf_counter()
+
+import argparse
+import os
+from functools import partial
 from tkinter import Tk
 
+from config.assets import ASSETS, EXCEL_NAME_MAP
 from config.settings import (
     SAVEDMODEL_DIR,
     EXCEL_PATH,
@@ -21,54 +33,308 @@ from config.settings import (
     THRESHOLD,
     NO_OBJECT_CLASS,
     CONFIRM_FRAMES,
+    CAM_THREADED,
+    CAM_BUFFER_SIZE,
+    REPLAY_SOURCE,
+    REPLAY_FPS,
+    REPLAY_LOOP,
+    INFER_WORKERS,
+    PREPROCESS_MODE,
+    GATE_THRESHOLD,
+    GATE_MAX_SKIP,
+    ROI,
+    MODEL_WARMUP_RUNS,
+    MODEL_JIT,
+    MODEL_BACKEND,
+    TFLITE_PATH,
+    TFLITE_THREADS,
+    CAM_INDEXES,
+    DECISION_STRATEGY,
+    EMA_ALPHA,
+    SPRT_ALPHA,
+    CACHE_SIZE,
+    CACHE_MAX_DISTANCE,
+    CONTROLLER_MODE,
+    ASYNC_QUEUE_SIZE,
+    HEADLESS,
+    DISPLAY_FPS,
+    FRAME_BUDGET_MS,
+    INVENTORY_BACKEND,
+    INVENTORY_DB_PATH,
+    INVENTORY_FLUSH_SECONDS,
+    INVENTORY_JSON_PATH,
+    INVENTORY_COMPACT_EVERY,
+    INVENTORY_SERVER_HOST,
+    INVENTORY_SERVER_PORT,
+    INVENTORY_SERVER_TOKEN,
+    IMAGE_CACHE_DIR,
+    IMAGE_CACHE_MB,
+    DETAIL_DOCKED,
+    IMG_DIR,
     ensure_paths,
 )
+from interfaces import IInventoryRepo
+from core.decision.decision_strategies import build_decision_strategy
+from core.inference.change_gate import GatedInferenceEngine
 from core.inference.inference_engine import InferenceEngine, load_labels
+from core.inference.prediction_cache import CachedInferenceEngine
+from core.inference.process_pool_engine import ProcessPoolInferenceEngine
 from core.preprocessing.Tm_preprocessor import TMPreprocessor
 from infrastructure.camera.opencv_camera import OpenCVCamera
-from infrastructure.model.Tm_saved_model import TMSavedModel
-from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+from infrastructure.camera.replay_camera import ReplayCamera
+from infrastructure.model.background_model import BackgroundModel
+from infrastructure.model.model_factory import create_model
+from infrastructure.repo.repo_factory import create_inventory_repo
+from ui.image_cache import ImageCache
 from ui.tk_detail_ui import TkDetailUI
-from app.controller import AppController
+from app.async_controller import AsyncAppController
+from app.controller import AppController, MultiCameraController
+from app.startup_profile import StartupProfiler
+
+
+def _build_camera(index: int):
+    if REPLAY_SOURCE:
+        return ReplayCamera(
+            source=REPLAY_SOURCE,
+            fps=REPLAY_FPS,
+            loop=REPLAY_LOOP,
+            width=FRAME_W,
+            height=FRAME_H,
+        )
+    return OpenCVCamera(
+        index=index,
+        width=FRAME_W,
+        height=FRAME_H,
+        threaded=CAM_THREADED,
+        buffer_size=CAM_BUFFER_SIZE,
+    )
+
+
+def _headless_confirm(repo: IInventoryRepo, label: str, conf: float) -> None:
+    """Sin UI: cada confirmación suma una unidad al inventario y queda en la consola."""
+    excel_name = EXCEL_NAME_MAP.get(label, label)
+    try:
+        qty = repo.apply_deltas({excel_name: 1})[excel_name]
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error al actualizar el inventario de {label}: {e}")
+        return
+    print(f"Confirmado: {label} ({conf:.2f}) → cantidad {qty}")
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Reconocimiento de componentes electrónicos")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Imprime el tiempo de cada fase del arranque",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
+    args = _parse_args()
+    profiler = StartupProfiler(enabled=args.startup_profile)
+    profiler.record("imports", time.perf_counter() - _T0)
+
+    pool_engine = None
+    repo = None
+    detail_ui = None
     try:
-        ensure_paths()
-
-        root = Tk()
-        root.withdraw()
-
-        camera = OpenCVCamera(index=CAM_INDEX, width=FRAME_W, height=FRAME_H)
-        model = TMSavedModel(SAVEDMODEL_DIR)
-        preprocessor = TMPreprocessor(INPUT_SIZE)
-        repo = ExcelInventoryRepo(EXCEL_PATH)
-        detail_ui = TkDetailUI(root=root, repo=repo)
-
-        class_names = load_labels(SAVEDMODEL_DIR)
-        engine = InferenceEngine(
-            preprocessor=preprocessor,
-            model=model,
-            class_names=class_names,
+        with profiler.phase("configuración y labels"):
+            ensure_paths()
+            class_names = load_labels(SAVEDMODEL_DIR)
+            cam_indexes = CAM_INDEXES or [CAM_INDEX]
+            multi_camera = len(cam_indexes) > 1
+
+        make_preprocessor = partial(
+            TMPreprocessor,
+            INPUT_SIZE,
+            fused=PREPROCESS_MODE in ("fused", "uint8"),
+            uint8_output=PREPROCESS_MODE == "uint8",
+            roi=ROI,
+        )
+        make_model = partial(
+            create_model,
+            MODEL_BACKEND,
+            SAVEDMODEL_DIR,
+            input_size=INPUT_SIZE,
+            warmup_runs=MODEL_WARMUP_RUNS,
+            jit_compile=MODEL_JIT,
+            tflite_path=TFLITE_PATH,
+            tflite_threads=TFLITE_THREADS,
         )
 
+        if INFER_WORKERS > 0 and multi_camera:
+            print("[ERROR] INFER_WORKERS no se usa con varias cámaras; se comparte un solo modelo.")
+        if INFER_WORKERS > 0 and not multi_camera:
+            # Cada proceso carga su propio modelo; aquí solo se pasan las fábricas.
+            with profiler.phase("procesos de inferencia"):
+                engine = pool_engine = ProcessPoolInferenceEngine(
+                    model_factory=make_model,
+                    preprocessor_factory=make_preprocessor,
+                    class_names=class_names,
+                    num_workers=INFER_WORKERS,
+                    frame_shape=(FRAME_H, FRAME_W, 3),
+                )
+                pool_engine.start()
+            profiler.mark("modelo listo")
+        else:
+            def on_model_ready(seconds: float) -> None:
+                profiler.record("modelo (segundo plano)", seconds)
+                profiler.mark("modelo listo")
+
+            # La carga arranca ya y corre en paralelo con Tk, el inventario y la cámara.
+            engine = InferenceEngine(
+                preprocessor=make_preprocessor(),
+                model=BackgroundModel(make_model, on_ready=on_model_ready),
+                class_names=class_names,
+            )
+
+        cached_engine = None
+        if CACHE_SIZE > 0 and pool_engine is None:
+            # La caché se comparte entre cámaras: la clave es el contenido, no la cámara.
+            engine = cached_engine = CachedInferenceEngine(
+                engine, max_entries=CACHE_SIZE, max_distance=CACHE_MAX_DISTANCE
+            )
+
+        root = detail_ui = None
+        if not HEADLESS:
+            with profiler.phase("Tk"):
+                root = Tk()
+                root.withdraw()
+
+        with profiler.phase("inventario y UI"):
+            repo = create_inventory_repo(
+                INVENTORY_BACKEND,
+                EXCEL_PATH,
+                db_path=INVENTORY_DB_PATH,
+                flush_seconds=INVENTORY_FLUSH_SECONDS,
+                json_path=INVENTORY_JSON_PATH,
+                compact_every=INVENTORY_COMPACT_EVERY,
+                server_host=INVENTORY_SERVER_HOST,
+                server_port=INVENTORY_SERVER_PORT,
+                server_token=INVENTORY_SERVER_TOKEN,
+            )
+            if not HEADLESS:
+                # Las imágenes se decodifican y escalan en segundo plano mientras arranca la cámara;
+                # la versión escalada queda en disco para los próximos arranques.
+                images = ImageCache(
+                    max_width=720,
+                    max_bytes=int(IMAGE_CACHE_MB * 1024 * 1024),
+                    disk_dir=IMAGE_CACHE_DIR or os.path.join(IMG_DIR, ".cache"),
+                )
+                images.preload(info["img"] for info in ASSETS.values() if info.get("img"))
+                detail_ui = TkDetailUI(
+                    root=root, repo=repo, images=images, docked=DETAIL_DOCKED
+                )
+
         valid_classes = set(class_names[:4])
 
-        controller = AppController(
-            camera=camera,
-            engine=engine,
-            ui=detail_ui,
-            class_names=class_names,
-            valid_classes=valid_classes,
-            no_object_class=NO_OBJECT_CLASS,
-            threshold=THRESHOLD,
-            confirm_frames=CONFIRM_FRAMES,
-        )
+        # Cada cámara tiene su propia compuerta de cambios (la escena es distinta por cámara),
+        # pero todas comparten el mismo motor y modelo cargado.
+        gated_engines = []
+        controllers = []
+        for index in cam_indexes:
+            cam_engine = engine
+            if GATE_THRESHOLD > 0:
+                cam_engine = GatedInferenceEngine(
+                    engine, threshold=GATE_THRESHOLD, max_skip=GATE_MAX_SKIP
+                )
+                gated_engines.append(cam_engine)
+            controllers.append(
+                AppController(
+                    camera=_build_camera(index),
+                    engine=cam_engine,
+                    ui=detail_ui,
+                    class_names=class_names,
+                    valid_classes=valid_classes,
+                    no_object_class=NO_OBJECT_CLASS,
+                    threshold=THRESHOLD,
+                    confirm_frames=CONFIRM_FRAMES,
+                    roi=ROI,
+                    window_name=(
+                        f"Teachable Machine - Cam {index}" if multi_camera
+                        else "Teachable Machine - Cam"
+                    ),
+                    on_first_frame=partial(profiler.mark, "primer frame"),
+                    decision=build_decision_strategy(
+                        DECISION_STRATEGY,
+                        class_names,
+                        valid_classes,
+                        NO_OBJECT_CLASS,
+                        THRESHOLD,
+                        CONFIRM_FRAMES,
+                        ema_alpha=EMA_ALPHA,
+                        sprt_alpha=SPRT_ALPHA,
+                    ),
+                    headless=HEADLESS,
+                    display_fps=DISPLAY_FPS,
+                    frame_budget_ms=FRAME_BUDGET_MS,
+                    on_confirm=partial(_headless_confirm, repo) if HEADLESS else None,
+                )
+            )
+
+        if multi_camera:
+            controller = MultiCameraController(
+                controllers,
+                engine=None if gated_engines else engine,
+                frame_budget_ms=FRAME_BUDGET_MS,
+            )
+        elif CONTROLLER_MODE == "async" and not HEADLESS:
+            controller = AsyncAppController(
+                camera=_build_camera(cam_indexes[0]),
+                engine=gated_engines[0] if gated_engines else engine,
+                ui=detail_ui,
+                valid_classes=valid_classes,
+                no_object_class=NO_OBJECT_CLASS,
+                threshold=THRESHOLD,
+                confirm_frames=CONFIRM_FRAMES,
+                decision=build_decision_strategy(
+                    DECISION_STRATEGY,
+                    class_names,
+                    valid_classes,
+                    NO_OBJECT_CLASS,
+                    THRESHOLD,
+                    CONFIRM_FRAMES,
+                    ema_alpha=EMA_ALPHA,
+                    sprt_alpha=SPRT_ALPHA,
+                ),
+                roi=ROI,
+                queue_size=ASYNC_QUEUE_SIZE,
+            )
+        else:
+            controller = controllers[0]
 
         controller.run(root)
 
+        for gated in gated_engines:
+            print(f"Frames sin inferencia (escena estática): {gated.skip_ratio:.0%}")
+        if cached_engine is not None:
+            print(
+                f"Caché de predicciones: {cached_engine.hits} aciertos, "
+                f"{cached_engine.misses} fallos, {cached_engine.evictions} desalojos "
+                f"({cached_engine.hit_ratio:.0%} de aciertos)"
+            )
+
     except Exception as e:
         print(f"[ERROR] Ha ocurrido un error en la aplicación principal: {e}")
+    finally:
+        if detail_ui is not None:
+            # Escrituras de la ventana de detalle que todavía estén en el hilo del inventario.
+            detail_ui.close()
+        if repo is not None:
+            try:
+                repo.flush()
+            except Exception:
+                # El error ya se imprimió en el repositorio
+                pass
+            try:
+                # Compacta el diario JSON, cierra las conexiones SQLite o las del servidor.
+                repo.close()
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al cerrar el inventario: {e}")
+        if pool_engine is not None:
+            pool_engine.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+'''
+Servicio local de clasificación por HTTP.
+    1.-Carga el modelo (SavedModel o TFLite según MODEL_BACKEND) y el InferenceEngine una sola vez.
+    2.-Lo envuelve en un BatchingInferenceEngine para juntar en lotes las peticiones que llegan a
+    la vez desde distintas herramientas.
+    3.-Atiende en SERVER_HOST:SERVER_PORT (por defecto 127.0.0.1:8765) hasta Ctrl+C; las rutas
+    están descritas en app/classification_service.py.
+
+Uso:
+    python server.py
+    curl --data-binary @foto.jpg http://127.0.0.1:8765/classify
+    curl http://127.0.0.1:8765/stats
+'''
+import argparse
+
+from config.settings import (
+    SAVEDMODEL_DIR,
+    INPUT_SIZE,
+    PREPROCESS_MODE,
+    MODEL_WARMUP_RUNS,
+    MODEL_JIT,
+    MODEL_BACKEND,
+    TFLITE_PATH,
+    TFLITE_THREADS,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_MAX_BATCH,
+    SERVER_MAX_WAIT_MS,
+)
+from core.inference.batching_engine import BatchingInferenceEngine
+from core.inference.inference_engine import InferenceEngine, load_labels
+from core.preprocessing.Tm_preprocessor import TMPreprocessor
+from infrastructure.model.model_factory import create_model
+from app.classification_service import ClassificationService, build_http_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servicio HTTP local de clasificación")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    args = parser.parse_args()
+
+    service = None
+    try:
+        class_names = load_labels(SAVEDMODEL_DIR)
+        # Sin ROI: las imágenes que llegan por HTTP ya vienen recortadas por el cliente.
+        engine = InferenceEngine(
+            preprocessor=TMPreprocessor(
+                INPUT_SIZE,
+                fused=PREPROCESS_MODE in ("fused", "uint8"),
+                uint8_output=PREPROCESS_MODE == "uint8",
+            ),
+            model=create_model(
+                MODEL_BACKEND,
+                SAVEDMODEL_DIR,
+                input_size=INPUT_SIZE,
+                warmup_runs=MODEL_WARMUP_RUNS,
+                jit_compile=MODEL_JIT,
+                tflite_path=TFLITE_PATH,
+                tflite_threads=TFLITE_THREADS,
+            ),
+            class_names=class_names,
+        )
+        service = ClassificationService(
+            BatchingInferenceEngine(
+                engine, max_batch=SERVER_MAX_BATCH, max_wait_ms=SERVER_MAX_WAIT_MS
+            ),
+            class_names,
+        )
+        server = build_http_server(service, args.host, args.port)
+        host, port = server.server_address[:2]
+        print(f"Servicio de clasificación en http://{host}:{port} (Ctrl+C para salir)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("Saliendo…")
+        finally:
+            server.server_close()
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error en el servicio de clasificación: {e}")
+    finally:
+        if service is not None:
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
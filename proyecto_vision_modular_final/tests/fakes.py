@@ -0,0 +1,81 @@
+'''
+Dobles de prueba compartidos por varios archivos de tests.
+    1.-FakeCamera, FakePre y FakeModel simulan cámara, preprocesador y modelo con datos fijos
+    (el modelo siempre responde la clase "B").
+    2.-FakeRoot simula Tk: after() encola callbacks y mainloop() los ejecuta en orden.
+    3.-RecordingUI registra las etiquetas que se mostrarían en el detalle.
+    4.-PixelPre y PixelModel usan el valor del primer pixel como clase para seguir cada frame, y
+    PixelModel registra el tamaño de cada lote.
+'''
+from collections import deque
+
+import numpy as np
+
+from interfaces import ICamera, IDetailUI, IModel, IPreprocessor
+
+
+class FakeCamera(ICamera):
+    def open(self): pass
+    def read(self): return np.zeros((480, 640, 3), dtype=np.uint8)
+    def release(self): pass
+
+
+class FakePre(IPreprocessor):
+    def preprocess(self, frame): return np.zeros((1, 224, 224, 3), dtype=np.float32)
+
+
+class FakeModel(IModel):
+    def predict(self, t): return {"logits": np.array([[0.1, 0.9, 0.0]])}
+
+
+class FakeRoot:
+    """Simula Tk: after() encola callbacks y mainloop() los ejecuta en orden hasta quit()."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.delays = []
+        self._pending = deque()
+        self._running = False
+
+    def after(self, ms, fn, *args):
+        self.scheduled.append((fn, args))
+        self.delays.append(ms)
+        self._pending.append((fn, args))
+
+    def mainloop(self):
+        self._running = True
+        while self._running and self._pending:
+            fn, args = self._pending.popleft()
+            fn(*args)
+
+    def quit(self):
+        self._running = False
+
+    def update(self): pass
+    def update_idletasks(self): pass
+    def destroy(self): pass
+
+
+class RecordingUI(IDetailUI):
+    def __init__(self):
+        self.shown = []
+
+    def show(self, label_str, conf, on_resume):
+        self.shown.append(label_str)
+
+
+class PixelPre(IPreprocessor):
+    def preprocess(self, frame):
+        return np.full((1, 2), float(frame[0, 0, 0]), dtype=np.float32)
+
+
+class PixelModel(IModel):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, t):
+        x = np.asarray(t)
+        self.batch_sizes.append(x.shape[0])
+        logits = np.zeros((x.shape[0], 3), dtype=np.float32)
+        logits[np.arange(x.shape[0]), x[:, 0].astype(int) % 3] = 10.0
+        return {"logits": logits}
@@ -0,0 +1,92 @@
+'''
+Tests del pipeline asyncio por etapas.
+    1.-test_stage_queue_policies valida las políticas block, drop_oldest y drop_newest.
+    2.-test_async_controller_confirms corre el pipeline completo con cámara, motor y UI falsos y
+    valida que los frames lleguen a la decisión y que la confirmación se agende en Tk.
+    3.-test_stage_error_stops_pipeline valida que si la inferencia falla el pipeline se detenga
+    e informe el error en lugar de seguir mostrando la cámara sin detecciones.
+'''
+import asyncio
+
+import pytest
+
+import app.async_controller as async_module
+from app.async_controller import AsyncAppController, _StageQueue
+from core.inference.inference_engine import InferenceEngine
+from tests.fakes import FakeCamera, FakeModel, FakePre, FakeRoot, RecordingUI
+
+
+def test_stage_queue_policies():
+    async def scenario():
+        oldest = _StageQueue("a", 2, "drop_oldest")
+        newest = _StageQueue("b", 2, "drop_newest")
+        for i in range(3):
+            await oldest.put(i)
+            await newest.put(i)
+        return (
+            [oldest.queue.get_nowait() for _ in range(2)], oldest.dropped,
+            [newest.queue.get_nowait() for _ in range(2)], newest.dropped,
+        )
+
+    assert asyncio.run(scenario()) == ([1, 2], 1, [0, 1], 1)
+
+    with pytest.raises(ValueError):
+        _StageQueue("c", 1, "lifo")
+
+
+def test_async_controller_confirms(monkeypatch):
+    root = FakeRoot()
+    calls = {"n": 0}
+
+    def fake_wait_key(ms):
+        calls["n"] += 1
+        return ord("q") if root.scheduled or calls["n"] > 500 else -1
+
+    monkeypatch.setattr(async_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(async_module.cv2, "destroyAllWindows", lambda: None)
+    monkeypatch.setattr(async_module.cv2, "waitKey", fake_wait_key)
+
+    engine = InferenceEngine(FakePre(), FakeModel(), ["A", "B", "C"])
+    ui = RecordingUI()
+    controller = AsyncAppController(
+        camera=FakeCamera(), engine=engine, ui=ui, valid_classes={"B"},
+        no_object_class="A", threshold=0.4, confirm_frames=2, stats_every=0,
+    )
+
+    controller.run(root)
+
+    assert controller.frames_inferred >= 2
+    assert controller.frames_rendered >= 1
+    assert len(root.scheduled) == 1
+    fn, args = root.scheduled[0]
+    assert args[0] == "B"
+    assert set(controller.queue_stats()) == {"render", "preprocesado", "inferencia", "decision"}
+
+
+class BrokenModel(FakeModel):
+    def predict(self, t):
+        raise ValueError("modelo roto")
+
+
+def test_stage_error_stops_pipeline(monkeypatch, capsys):
+    calls = {"n": 0}
+
+    def fake_wait_key(ms):
+        calls["n"] += 1
+        return ord("q") if calls["n"] > 2000 else -1
+
+    monkeypatch.setattr(async_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(async_module.cv2, "destroyAllWindows", lambda: None)
+    monkeypatch.setattr(async_module.cv2, "waitKey", fake_wait_key)
+
+    controller = AsyncAppController(
+        camera=FakeCamera(), engine=InferenceEngine(FakePre(), BrokenModel(), ["A", "B", "C"]),
+        ui=RecordingUI(), valid_classes={"B"}, no_object_class="A", threshold=0.4,
+        confirm_frames=2, stats_every=0,
+    )
+
+    controller.run(FakeRoot())
+
+    assert isinstance(controller.stage_error, ValueError)
+    assert calls["n"] < 2000
+    assert "[ERROR]" in capsys.readouterr().out
@@ -0,0 +1,53 @@
+'''
+Test de BackgroundModel con fábricas falsas.
+    1.-test_predict_waits_for_background_load valida que is_ready cambie al terminar la carga y
+      que predict espere al modelo real.
+    2.-test_load_error_is_raised_on_predict valida que un error de carga se relance en predict.
+'''
+import threading
+
+import numpy as np
+import pytest
+
+from core.inference.inference_engine import InferenceEngine
+from infrastructure.model.background_model import BackgroundModel
+from interfaces import IModel, IPreprocessor
+
+
+class FakePre(IPreprocessor):
+    def preprocess(self, frame): return np.zeros((1, 2), dtype=np.float32)
+
+
+class FakeModel(IModel):
+    def predict(self, t): return {"logits": np.array([[0.0, 3.0]])}
+
+
+def test_predict_waits_for_background_load():
+    release = threading.Event()
+    ready = []
+
+    def slow_factory():
+        release.wait(5)
+        return FakeModel()
+
+    model = BackgroundModel(slow_factory, on_ready=ready.append)
+    engine = InferenceEngine(FakePre(), model, ["A", "B"])
+    assert not engine.is_ready()
+
+    release.set()
+    label, _, _ = engine.predict(None)
+
+    assert label == "B"
+    assert engine.is_ready()
+    model._thread.join(5)
+    assert len(ready) == 1
+
+
+def test_load_error_is_raised_on_predict():
+    def broken_factory():
+        raise FileNotFoundError("sin modelo")
+
+    model = BackgroundModel(broken_factory)
+    with pytest.raises(FileNotFoundError):
+        model.predict(None)
+    assert model.is_ready()
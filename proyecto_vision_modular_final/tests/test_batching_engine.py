@@ -0,0 +1,76 @@
+'''
+Test de BatchingInferenceEngine con un modelo falso que registra el tamaño de cada lote.
+    1.-PixelPre (tests/fakes.py) usa el valor del primer pixel como clase para seguir cada frame.
+    2.-test_frames_are_batched valida que frames enviados juntos se ejecuten en un solo lote y que
+      cada Future reciba el resultado de su propio frame.
+    3.-test_predict_batch_matches_predict valida que predict_batch dé lo mismo que predict.
+    4.-test_cancelled_and_short_batches_do_not_stall valida que un Future cancelado no detenga el
+      hilo del lote y que un predict_batch con resultados de menos falle todos los Future.
+'''
+import numpy as np
+import pytest
+
+from core.inference.batching_engine import BatchingInferenceEngine
+from core.inference.inference_engine import InferenceEngine
+from tests.fakes import PixelModel, PixelPre
+
+
+def _frame(value):
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def test_frames_are_batched():
+    model = PixelModel()
+    engine = BatchingInferenceEngine(
+        InferenceEngine(PixelPre(), model, ["A", "B", "C"]), max_batch=4, max_wait_ms=200
+    )
+    try:
+        futures = [engine.submit(_frame(i)) for i in range(4)]
+        labels = [f.result(timeout=5)[0] for f in futures]
+    finally:
+        engine.close()
+
+    assert labels == ["A", "B", "C", "A"]
+    assert model.batch_sizes == [4]
+    assert engine.mean_batch_size == 4
+
+
+def test_predict_batch_matches_predict():
+    engine = InferenceEngine(PixelPre(), PixelModel(), ["A", "B", "C"])
+    frames = [_frame(i) for i in range(3)]
+
+    batched = engine.predict_batch(frames)
+    single = [engine.predict(f) for f in frames]
+
+    assert [r[0] for r in batched] == [r[0] for r in single]
+    for (_, c1, p1), (_, c2, p2) in zip(batched, single):
+        assert abs(c1 - c2) < 1e-6
+        np.testing.assert_allclose(p1, p2, rtol=1e-6)
+
+
+class ShortEngine(InferenceEngine):
+    def predict_batch(self, frames):
+        return super().predict_batch(frames)[:-1]
+
+
+def test_cancelled_and_short_batches_do_not_stall():
+    engine = BatchingInferenceEngine(
+        InferenceEngine(PixelPre(), PixelModel(), ["A", "B", "C"]), max_batch=4, max_wait_ms=50.0
+    )
+    try:
+        cancelled = engine.submit(np.full((4, 4, 3), 0, dtype=np.uint8))
+        assert cancelled.cancel()
+        assert engine.predict(np.full((4, 4, 3), 1, dtype=np.uint8))[0] == "B"
+    finally:
+        engine.close()
+
+    short = BatchingInferenceEngine(
+        ShortEngine(PixelPre(), PixelModel(), ["A", "B", "C"]), max_batch=2, max_wait_ms=50.0
+    )
+    try:
+        futures = [short.submit(np.full((4, 4, 3), i, dtype=np.uint8)) for i in range(2)]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=5.0)
+    finally:
+        short.close()
@@ -0,0 +1,132 @@
+'''
+Tests de CachedExcelInventoryRepo sobre un Excel temporal.
+    1.-test_writes_are_batched valida que varios cambios no toquen el disco hasta flush y que se
+      guarden en una sola escritura que ve ExcelInventoryRepo.
+    2.-test_external_change_invalidates valida que si otro proceso guarda el Excel la caché se
+      recargue sin perder los cambios propios pendientes.
+    3.-test_timer_flush valida el guardado automático a los flush_seconds.
+    4.-test_atomic_write_keeps_original valida que un guardado fallido no toque el archivo.
+    5.-test_pending_deltas_keep_other_station_changes valida que un +1 pendiente se sume sobre lo
+      que guardó otra estación en el mismo componente en lugar de pisarlo.
+    6.-test_failed_timer_flush_is_retried valida que si el guardado automático falla se vuelva a
+      intentar sin esperar otra escritura.
+'''
+import os
+import time
+
+import pytest
+
+import infrastructure.repo.cached_excel_inventory_repo as cached_module
+from infrastructure.repo.atomic_io import atomic_write
+from infrastructure.repo.cached_excel_inventory_repo import CachedExcelInventoryRepo
+from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_writes_are_batched(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    repo = CachedExcelInventoryRepo(path, flush_seconds=0)
+    mtime = os.stat(path).st_mtime_ns
+
+    repo.write_qty("7805", repo.read_qty("7805") + 1)
+    repo.write_qty("7805", repo.read_qty("7805") + 1)
+    repo.write_qty("Nuevo", 5)
+
+    assert os.stat(path).st_mtime_ns == mtime
+    assert repo.loads == 1
+    assert repo.pending == 2
+
+    repo.flush()
+    plain = ExcelInventoryRepo(path)
+    assert plain.read_qty("7805") == 2
+    assert plain.read_qty("Nuevo") == 5
+    assert repo.flushes == 1
+    assert repo.pending == 0
+
+
+def test_external_change_invalidates(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    repo = CachedExcelInventoryRepo(path, flush_seconds=0)
+    repo.write_qty("7404", 3)
+
+    ExcelInventoryRepo(path).write_qty("Diodo Zener", 9)
+    _bump_mtime(path)
+
+    assert repo.read_qty("Diodo Zener") == 9
+    assert repo.read_qty("7404") == 3
+    assert repo.loads == 2
+
+    repo.close()
+    plain = ExcelInventoryRepo(path)
+    assert plain.read_qty("Diodo Zener") == 9
+    assert plain.read_qty("7404") == 3
+
+
+def test_timer_flush(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    repo = CachedExcelInventoryRepo(path, flush_seconds=0.05)
+    repo.write_qty("7805", 4)
+
+    deadline = time.monotonic() + 5.0
+    while repo.pending and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert repo.pending == 0
+    assert ExcelInventoryRepo(path).read_qty("7805") == 4
+
+
+def test_atomic_write_keeps_original(tmp_path):
+    path = tmp_path / "datos.txt"
+    path.write_text("original", encoding="utf-8")
+
+    def failing(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("a medias")
+        raise IOError("disco lleno")
+
+    with pytest.raises(IOError):
+        atomic_write(str(path), failing)
+
+    assert path.read_text(encoding="utf-8") == "original"
+    assert os.listdir(tmp_path) == ["datos.txt"]
+
+
+def test_pending_deltas_keep_other_station_changes(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    repo = CachedExcelInventoryRepo(path, flush_seconds=0)
+    assert repo.apply_deltas({"7805": 1}) == {"7805": 1}
+
+    ExcelInventoryRepo(path).apply_deltas({"7805": 5})
+    _bump_mtime(path)
+
+    assert repo.read_qty("7805") == 6
+    repo.close()
+    assert ExcelInventoryRepo(path).read_qty("7805") == 6
+
+
+def test_failed_timer_flush_is_retried(tmp_path, monkeypatch):
+    path = str(tmp_path / "inv.xlsx")
+    repo = CachedExcelInventoryRepo(path, flush_seconds=0.05)
+    real_save = cached_module._save_df
+    attempts = []
+
+    def flaky_save(target, df):
+        attempts.append(target)
+        if len(attempts) == 1:
+            raise IOError("archivo bloqueado")
+        real_save(target, df)
+
+    monkeypatch.setattr(cached_module, "_save_df", flaky_save)
+    repo.write_qty("7805", 4)
+
+    deadline = time.monotonic() + 5.0
+    while repo.pending and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert len(attempts) >= 2
+    assert repo.pending == 0
+    assert ExcelInventoryRepo(path).read_qty("7805") == 4
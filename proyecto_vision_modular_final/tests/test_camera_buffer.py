@@ -0,0 +1,44 @@
+'''
+Test del modo con hilo de captura de OpenCVCamera usando un VideoCapture falso.
+    1.-FakeCapture entrega frames numerados para poder saber cuál devolvió read().
+    2.-test_threaded_read_returns_latest valida que read() entregue el frame más reciente y que
+      los contadores de capturados/descartados cuadren.
+'''
+
+import time
+
+import numpy as np
+
+import infrastructure.camera.opencv_camera as cam_module
+from infrastructure.camera.opencv_camera import OpenCVCamera
+
+
+class FakeCapture:
+    def __init__(self, *args, **kwargs):
+        self._n = 0
+
+    def set(self, prop, value): return True
+    def isOpened(self): return True
+    def release(self): pass
+
+    def read(self):
+        time.sleep(0.002)
+        self._n += 1
+        return True, np.full((4, 4, 3), self._n % 256, dtype=np.uint8)
+
+
+def test_threaded_read_returns_latest(monkeypatch):
+    monkeypatch.setattr(cam_module.cv2, "VideoCapture", FakeCapture)
+    camera = OpenCVCamera(index=0, width=4, height=4, threaded=True, buffer_size=2)
+    camera.open()
+    try:
+        first = camera.read()
+        time.sleep(0.05)
+        second = camera.read()
+
+        assert int(second[0, 0, 0]) > int(first[0, 0, 0])
+        assert camera.frames_captured >= 2
+        assert camera.frames_dropped > 0
+        assert camera.frames_dropped <= camera.frames_captured
+    finally:
+        camera.release()
@@ -0,0 +1,44 @@
+'''
+Test de GatedInferenceEngine con un motor falso que cuenta sus llamadas.
+    1.-test_static_frames_reuse_prediction valida que frames iguales no ejecuten el modelo y que
+      el skip ratio lo refleje.
+    2.-test_max_skip_forces_inference valida que se fuerce una inferencia cada max_skip frames.
+'''
+import numpy as np
+
+from core.inference.change_gate import GatedInferenceEngine
+
+
+class CountingEngine:
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, frame):
+        self.calls += 1
+        return "B", 0.9, np.array([0.05, 0.9, 0.05])
+
+
+def test_static_frames_reuse_prediction():
+    inner = CountingEngine()
+    engine = GatedInferenceEngine(inner, threshold=2.0, max_skip=100)
+    empty = np.zeros((480, 640, 3), dtype=np.uint8)
+    part = empty.copy()
+    part[100:300, 200:400] = 255
+
+    results = [engine.predict(empty) for _ in range(5)] + [engine.predict(part)]
+
+    assert inner.calls == 2
+    assert all(r[0] == "B" for r in results)
+    assert engine.frames_skipped == 4
+    assert abs(engine.skip_ratio - 4 / 6) < 1e-9
+
+
+def test_max_skip_forces_inference():
+    inner = CountingEngine()
+    engine = GatedInferenceEngine(inner, threshold=2.0, max_skip=3)
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    for _ in range(8):
+        engine.predict(frame)
+
+    assert inner.calls == 2
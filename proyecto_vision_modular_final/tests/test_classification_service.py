@@ -0,0 +1,94 @@
+'''
+Test del servicio HTTP de clasificación levantado en un puerto libre (port=0).
+    1.-test_classify_single_and_batch envía una imagen PNG sola y un lote en base64, y valida las
+      etiquetas, que el lote se haya inferido junto y que /stats cuente peticiones e imágenes.
+    2.-test_invalid_image_returns_400 valida que un cuerpo que no es imagen (o un lote con JSON
+      inválido) responda 400.
+    3.-test_model_error_returns_500 valida que un ValueError del modelo responda 500 y no 400.
+'''
+import base64
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import cv2
+import numpy as np
+import pytest
+
+from app.classification_service import ClassificationService, build_http_server
+from core.inference.batching_engine import BatchingInferenceEngine
+from core.inference.inference_engine import InferenceEngine
+from tests.fakes import PixelModel, PixelPre
+
+
+def _png(value):
+    ok, buf = cv2.imencode(".png", np.full((8, 8, 3), value, dtype=np.uint8))
+    assert ok
+    return buf.tobytes()
+
+
+@pytest.fixture
+def server():
+    model = PixelModel()
+    engine = BatchingInferenceEngine(
+        InferenceEngine(PixelPre(), model, ["A", "B", "C"]), max_batch=8, max_wait_ms=50
+    )
+    service = ClassificationService(engine, ["A", "B", "C"])
+    httpd = build_http_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = "http://127.0.0.1:%d" % httpd.server_address[1]
+    yield url, model
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _post(url, body, content_type="application/octet-stream"):
+    req = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+def test_classify_single_and_batch(server):
+    url, model = server
+
+    single = _post(url + "/classify", _png(1))
+    assert single["label"] == "B"
+    assert set(single["probs"]) == {"A", "B", "C"}
+
+    images = [base64.b64encode(_png(v)).decode("ascii") for v in (0, 1, 2)]
+    batch = _post(url + "/classify/batch", json.dumps({"images": images}).encode("utf-8"),
+                  "application/json")
+    assert [r["label"] for r in batch["results"]] == ["A", "B", "C"]
+    assert 3 in model.batch_sizes
+
+    with urllib.request.urlopen(url + "/stats", timeout=10) as resp:
+        stats = json.loads(resp.read())
+    assert stats["requests"] == 2
+    assert stats["images"] == 4
+    assert stats["p95_ms"] > 0
+
+
+def test_invalid_image_returns_400(server):
+    url, _ = server
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        _post(url + "/classify", b"no es una imagen")
+    assert excinfo.value.code == 400
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        _post(url + "/classify/batch", b"{no es json", "application/json")
+    assert excinfo.value.code == 400
+
+
+def test_model_error_returns_500(server):
+    url, model = server
+
+    def broken(t):
+        raise ValueError("forma de tensor inesperada")
+
+    model.predict = broken
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        _post(url + "/classify", _png(1))
+    assert excinfo.value.code == 500
@@ -2,21 +2,25 @@
 Test del controlador usando mocks para cámara, UI, preprocesador y modelo.
     1.-FakeCamera simula la cámara devolviendo un frame
     2.-FakeUI simula la UI llamando al callback on_resume inmediatamente
-    3.-FakePre y FakeModel simulan el preprocesador y modelo devolviendo datos fijos
+    3.-FakePre y FakeModel (de tests/fakes.py) simulan el preprocesador y modelo devolviendo
+      datos fijos
     4.-test_controller_logic valida que el controlador use todos los mocks correctamente
       y procese un frame simulando una detección válida.
+    5.-test_multi_camera_shares_engine valida que varias cámaras se infieran en un solo lote con
+      el mismo motor y que cada una confirme por su cuenta.
+    6.-test_headless_reports_once valida que sin ventanas no se llame a OpenCV ni a Tk y que el
+      mismo objeto solo se confirme de nuevo después de que cambie la escena.
+    7.-test_display_throttle valida que DISPLAY_FPS limite las llamadas a imshow.
+    8.-test_paused_loop_idles valida que con la ventana de detalle abierta el bucle de Tk espere
+      PAUSED_TICK_MS entre ticks en lugar de leer la cámara.
 '''
 
 import numpy as np
 from interfaces import ICamera, IDetailUI, IModel, IPreprocessor
-from app.controller import AppController
+import app.controller as controller_module
+from app.controller import AppController, MultiCameraController
 from core.inference.inference_engine import InferenceEngine
-
-
-class FakeCamera(ICamera):
-    def open(self): pass
-    def read(self): return np.zeros((480, 640, 3), dtype=np.uint8)
-    def release(self): pass
+from tests.fakes import FakeCamera, FakeModel, FakePre, FakeRoot, RecordingUI
 
 
 class FakeUI(IDetailUI):
@@ -24,14 +28,6 @@ class FakeUI(IDetailUI):
         on_resume()
 
 
-class FakePre(IPreprocessor):
-    def preprocess(self, frame): return np.zeros((1, 224, 224, 3), dtype=np.float32)
-
-
-class FakeModel(IModel):
-    def predict(self, t): return {"logits": np.array([[0.1, 0.9, 0.0]])}
-
-
 def test_controller_logic(monkeypatch):
     fake_camera = FakeCamera()
     fake_ui = FakeUI()
@@ -57,3 +53,137 @@ def test_controller_logic(monkeypatch):
 
     monkeypatch.setattr(controller, "run", fake_run)
     controller.run(None)
+
+
+class FakeBatchModel(IModel):
+    def predict(self, t):
+        return {"logits": np.tile([[0.1, 0.9, 0.0]], (np.asarray(t).shape[0], 1))}
+
+
+def test_multi_camera_shares_engine(monkeypatch):
+    keys = iter([-1, -1, ord("q")])
+    monkeypatch.setattr(controller_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", lambda: None)
+    monkeypatch.setattr(controller_module.cv2, "waitKey", lambda ms: next(keys))
+
+    batch_sizes = []
+    engine = InferenceEngine(FakePre(), FakeBatchModel(), ["A", "B", "C"])
+    original = engine.predict_batch
+
+    def recording_predict_batch(frames):
+        batch_sizes.append(len(frames))
+        return original(frames)
+
+    engine.predict_batch = recording_predict_batch
+    ui = RecordingUI()
+    controllers = [
+        AppController(
+            camera=FakeCamera(), engine=engine, ui=ui, class_names=["A", "B", "C"],
+            valid_classes={"B"}, no_object_class="A", threshold=0.4, confirm_frames=2,
+            window_name=f"Cam {i}", fps_report_every=0,
+        )
+        for i in range(2)
+    ]
+    root = FakeRoot()
+
+    MultiCameraController(controllers, engine=engine).run(root)
+
+    assert batch_sizes == [2, 2]
+    assert all(c.paused for c in controllers)
+    assert len(ui.shown) == 2
+
+
+class ScriptedCamera(ICamera):
+    """Entrega frames cuyo primer píxel indica qué clase debe predecir ScriptedModel."""
+
+    def __init__(self, script):
+        self._script = list(script)
+
+    def open(self): pass
+
+    def read(self):
+        if not self._script:
+            raise RuntimeError("fin")
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        frame[0, 0, 0] = self._script.pop(0)
+        return frame
+
+    def release(self): pass
+
+
+class PassPre(IPreprocessor):
+    def preprocess(self, frame): return frame[None, ...]
+
+
+class ScriptedModel(IModel):
+    def predict(self, t):
+        logits = np.full((1, 3), -10.0)
+        logits[0, int(np.asarray(t)[0, 0, 0, 0])] = 10.0
+        return {"logits": logits}
+
+
+def test_headless_reports_once(monkeypatch):
+    def fail(*a):
+        raise AssertionError("no debe usarse OpenCV HighGUI en modo headless")
+
+    monkeypatch.setattr(controller_module.cv2, "imshow", fail)
+    monkeypatch.setattr(controller_module.cv2, "waitKey", fail)
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", fail)
+
+    confirmed = []
+    controller = AppController(
+        camera=ScriptedCamera([1, 1, 1, 1, 1, 1, 0, 0, 1, 1]),
+        engine=InferenceEngine(PassPre(), ScriptedModel(), ["A", "B", "C"]),
+        ui=None, class_names=["A", "B", "C"], valid_classes={"B"}, no_object_class="A",
+        threshold=0.5, confirm_frames=2, fps_report_every=0,
+        headless=True, on_confirm=lambda label, conf: confirmed.append(label),
+    )
+
+    controller.run(None)
+
+    assert confirmed == ["B", "B"]
+    assert not controller.paused
+
+
+def test_display_throttle(monkeypatch):
+    shown = []
+    monkeypatch.setattr(controller_module.cv2, "imshow", lambda name, img: shown.append(img))
+    monkeypatch.setattr(controller_module.cv2, "waitKey", lambda ms: -1)
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", lambda: None)
+
+    controller = AppController(
+        camera=ScriptedCamera([0] * 20),
+        engine=InferenceEngine(PassPre(), ScriptedModel(), ["A", "B", "C"]),
+        ui=RecordingUI(), class_names=["A", "B", "C"], valid_classes={"B"},
+        no_object_class="A", threshold=0.5, confirm_frames=2, fps_report_every=0,
+        display_fps=1.0,
+    )
+
+    controller.run(FakeRoot())
+
+    assert len(shown) == 1
+
+
+def test_paused_loop_idles(monkeypatch):
+    keys = iter([-1, -1, -1, -1, ord("q")])
+    monkeypatch.setattr(controller_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(controller_module.cv2, "waitKey", lambda ms: next(keys))
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", lambda: None)
+
+    ui = RecordingUI()
+    camera = ScriptedCamera([1] * 10)
+    controller = AppController(
+        camera=camera,
+        engine=InferenceEngine(PassPre(), ScriptedModel(), ["A", "B", "C"]),
+        ui=ui, class_names=["A", "B", "C"], valid_classes={"B"}, no_object_class="A",
+        threshold=0.5, confirm_frames=2, fps_report_every=0,
+    )
+    root = FakeRoot()
+
+    controller.run(root)
+
+    assert ui.shown == ["B"]
+    assert controller.paused
+    # Dos frames hasta confirmar; después la cámara ya no se lee.
+    assert len(camera._script) == 8
+    assert root.delays[-2:] == [controller_module.PAUSED_TICK_MS] * 2
@@ -0,0 +1,75 @@
+'''
+Tests de las estrategias de decisión con secuencias de probabilidades simuladas.
+    1.-test_streak_resets_on_noisy_frame valida el comportamiento original de la racha.
+    2.-test_ema_tolerates_single_noisy_frame valida que un frame ruidoso no reinicie la decisión.
+    3.-test_vote_confirms_with_enough_votes valida el voto por ventana.
+    4.-test_sprt_confirms_confident_part_early valida que una pieza clara se confirme antes que
+      con la racha y que una dudosa no se confirme.
+'''
+import numpy as np
+
+from core.decision.decision_strategies import (
+    EmaDecision,
+    SprtDecision,
+    StreakDecision,
+    WindowVoteDecision,
+)
+
+CLASSES = ["A", "B", "nada"]
+VALID = {"A", "B"}
+
+
+def _frame(pa, pb):
+    probs = np.array([pa, pb, 1.0 - pa - pb])
+    idx = int(np.argmax(probs))
+    return CLASSES[idx], float(probs[idx]), probs
+
+
+def _feed(strategy, frames):
+    for i, f in enumerate(frames, start=1):
+        result = strategy.update(*f)
+        if result is not None:
+            return i, result
+    return None, None
+
+
+def test_streak_resets_on_noisy_frame():
+    strategy = StreakDecision(VALID, "nada", threshold=0.8, confirm_frames=3)
+    frames = [_frame(0.9, 0.05), _frame(0.9, 0.05), _frame(0.5, 0.4), _frame(0.9, 0.05),
+              _frame(0.9, 0.05), _frame(0.9, 0.05)]
+
+    n, result = _feed(strategy, frames)
+
+    assert n == 6
+    assert result[0] == "A"
+
+
+def test_ema_tolerates_single_noisy_frame():
+    strategy = EmaDecision(CLASSES, VALID, threshold=0.8, alpha=0.5, min_frames=3)
+    frames = [_frame(0.95, 0.02), _frame(0.6, 0.3), _frame(0.95, 0.02), _frame(0.95, 0.02)]
+
+    n, result = _feed(strategy, frames)
+
+    assert n == 3
+    assert result[0] == "A"
+
+
+def test_vote_confirms_with_enough_votes():
+    strategy = WindowVoteDecision(VALID, threshold=0.8, window=5, min_votes=3)
+    frames = [_frame(0.05, 0.9), _frame(0.3, 0.5), _frame(0.05, 0.9), _frame(0.05, 0.9)]
+
+    n, result = _feed(strategy, frames)
+
+    assert n == 4
+    assert result[0] == "B"
+
+
+def test_sprt_confirms_confident_part_early():
+    confident = SprtDecision(CLASSES, VALID, threshold=0.8, alpha=0.01, beta=0.01)
+    n, result = _feed(confident, [_frame(0.995, 0.004)] * 5)
+    assert n == 2
+    assert result[0] == "A"
+
+    borderline = SprtDecision(CLASSES, VALID, threshold=0.8, alpha=0.01, beta=0.01)
+    n, _ = _feed(borderline, [_frame(0.6, 0.35), _frame(0.35, 0.6)] * 10)
+    assert n is None
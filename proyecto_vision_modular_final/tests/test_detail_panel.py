@@ -0,0 +1,127 @@
+'''
+Tests del panel de detalle reutilizable con widgets de Tk falsos (no hace falta pantalla).
+    1.-test_panel_is_built_once valida que varias detecciones usen el mismo Toplevel, que solo
+      se cambie su contenido y que el PhotoImage de cada componente se cree una sola vez.
+    2.-test_second_detection_resumes_previous valida que si otra cámara confirma con el panel
+      abierto, la detección anterior se cierre y retome su captura.
+    3.-test_docked_panel_stays_visible valida que en modo fijo el panel no se oculte ni bloquee
+      las demás ventanas, y que en espera no muestre los datos del componente anterior.
+'''
+import importlib
+import sys
+import types
+
+import pytest
+
+from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+
+
+@pytest.fixture
+def detail_module(monkeypatch):
+    try:
+        import config.assets  # noqa: F401
+        fake = False
+    except FileNotFoundError:
+        # Sin .env no se puede importar config.assets; solo para este test se usa uno vacío
+        # (los tests reemplazan ASSETS de todos modos).
+        assets = types.ModuleType("config.assets")
+        assets.ASSETS, assets.EXCEL_NAME_MAP = {}, {}
+        monkeypatch.setitem(sys.modules, "config.assets", assets)
+        fake = True
+    module = importlib.import_module("ui.tk_detail_ui")
+    yield module
+    if fake:
+        # El módulo quedó importado con el config.assets falso: se descarta para el resto.
+        sys.modules.pop("ui.tk_detail_ui", None)
+        import ui
+        if getattr(ui, "tk_detail_ui", None) is module:
+            delattr(ui, "tk_detail_ui")
+
+
+class FakeWidget:
+    created = 0
+
+    def __init__(self, master=None, **options):
+        FakeWidget.created += 1
+        self.options = dict(options)
+        self.calls = []
+
+    def pack(self, **kw): pass
+    def config(self, **kw): self.options.update(kw)
+    def protocol(self, name, fn): self.options[name] = fn
+    def title(self, text): self.options["title"] = text
+    def geometry(self, spec): self.calls.append("geometry")
+    def withdraw(self): self.calls.append("withdraw")
+    def deiconify(self): self.calls.append("deiconify")
+    def lift(self): self.calls.append("lift")
+    def grab_set(self): self.calls.append("grab_set")
+    def grab_release(self): self.calls.append("grab_release")
+
+
+class FakeRoot:
+    def after(self, ms, fn, *args): return None
+    def after_cancel(self, timer_id): pass
+
+
+def _panel(detail_module, monkeypatch, tmp_path, docked=False):
+    for name in ("Toplevel", "Label", "Button"):
+        monkeypatch.setattr(detail_module, name, FakeWidget)
+    monkeypatch.setattr(detail_module, "ASSETS", {
+        "A": {"img": "a.png", "url": "http://a"},
+        "B": {"img": "b.png"},
+    })
+    FakeWidget.created = 0
+    ui = detail_module.TkDetailUI(
+        FakeRoot(), JsonInventoryRepo(str(tmp_path / "inv.json")), docked=docked
+    )
+    photos = []
+    monkeypatch.setattr(ui, "_photo", lambda path: photos.append(path) or f"photo:{path}")
+    return ui, photos
+
+
+def test_panel_is_built_once(detail_module, monkeypatch, tmp_path):
+    ui, photos = _panel(detail_module, monkeypatch, tmp_path)
+    resumed = []
+
+    for label in ("A", "B", "A"):
+        ui.show(label, 0.9, lambda: resumed.append(label))
+        ui._resume()
+    widgets = FakeWidget.created
+    ui.show("B", 0.8, lambda: None)
+
+    assert FakeWidget.created == widgets
+    assert photos == ["a.png", "b.png"]
+    assert resumed == ["A", "B", "A"]
+    assert ui._img_label.options["image"] == "photo:b.png"
+    assert ui._datasheet_btn.options["state"] == detail_module.DISABLED
+    assert ui._top.calls[-2:] == ["deiconify", "grab_set"]
+    ui.close()
+
+
+def test_second_detection_resumes_previous(detail_module, monkeypatch, tmp_path):
+    ui, _ = _panel(detail_module, monkeypatch, tmp_path)
+    resumed = []
+
+    ui.show("A", 0.9, lambda: resumed.append("cam0"))
+    ui.show("B", 0.9, lambda: resumed.append("cam1"))
+    assert resumed == ["cam0"]
+
+    ui._resume()
+    assert resumed == ["cam0", "cam1"]
+    assert ui._top.calls[-1] == "withdraw"
+    ui.close()
+
+
+def test_docked_panel_stays_visible(detail_module, monkeypatch, tmp_path):
+    ui, _ = _panel(detail_module, monkeypatch, tmp_path, docked=True)
+
+    ui.show("A", 0.9, lambda: None)
+    ui._resume()
+
+    assert "withdraw" not in ui._top.calls
+    assert "grab_set" not in ui._top.calls
+    assert all(b.options["state"] == detail_module.DISABLED for b in ui._qty_buttons)
+    assert ui._img_label.options["image"] == ""
+    assert ui._qty_label.options["text"] == "Esperando detección…"
+    assert ui._datasheet_btn.options["state"] == detail_module.DISABLED
+    ui.close()
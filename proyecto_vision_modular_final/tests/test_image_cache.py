@@ -0,0 +1,58 @@
+'''
+Tests de ImageCache con imágenes generadas en una carpeta temporal.
+    1.-test_scales_and_reuses_disk_cache valida el escalado a max_width, el acierto en memoria y
+      que otra instancia lea la versión escalada desde disco sin volver a escalar.
+    2.-test_lru_byte_budget valida que al pasarse del presupuesto se descarte la menos usada.
+    3.-test_preload_fills_memory valida la precarga en segundo plano.
+'''
+import os
+
+from PIL import Image
+
+from ui.image_cache import ImageCache
+
+
+def _make(tmp_path, name, size=(1440, 900)):
+    path = str(tmp_path / name)
+    Image.new("RGB", size, (200, 30, 30)).save(path)
+    return path
+
+
+def test_scales_and_reuses_disk_cache(tmp_path):
+    src = _make(tmp_path, "grande.jpg")
+    disk = str(tmp_path / "cache")
+
+    cache = ImageCache(max_width=720, disk_dir=disk)
+    img = cache.get(src)
+    assert img.size == (720, 450)
+    assert cache.get(src) is img
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert len(os.listdir(disk)) == 1
+
+    second = ImageCache(max_width=720, disk_dir=disk)
+    assert second.get(src).size == (720, 450)
+    assert (second.misses, second.disk_hits) == (0, 1)
+
+
+def test_lru_byte_budget(tmp_path):
+    paths = [_make(tmp_path, f"{i}.png", (100, 100)) for i in range(3)]
+    cache = ImageCache(max_width=100, max_bytes=2 * 100 * 100 * 3)
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+
+    assert paths[0] in cache
+    assert paths[1] not in cache
+    assert cache.size_bytes <= 2 * 100 * 100 * 3
+
+
+def test_preload_fills_memory(tmp_path):
+    paths = [_make(tmp_path, f"{i}.png", (300, 200)) for i in range(3)]
+    cache = ImageCache(max_width=150)
+
+    cache.preload(paths + [str(tmp_path / "no_existe.png")]).join(timeout=10)
+
+    assert all(p in cache for p in paths)
+    assert cache.get(paths[0]).size == (150, 100)
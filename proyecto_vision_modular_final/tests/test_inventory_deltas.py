@@ -0,0 +1,50 @@
+'''
+Tests de read_all y apply_deltas en todos los repositorios de inventario.
+    1.-test_read_all_and_apply_deltas corre el mismo escenario sobre Excel, Excel con caché, JSON,
+      JSON con diario y SQLite: lote con sumas, restas que no bajan de 0 y componentes nuevos.
+    2.-test_excel_batch_saves_once valida que un lote de N cambios escriba el Excel una sola vez.
+'''
+import pytest
+
+import infrastructure.repo.excel_inventory_repo as excel_module
+from infrastructure.repo.cached_excel_inventory_repo import CachedExcelInventoryRepo
+from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+from infrastructure.repo.journaled_json_inventory_repo import JournaledJsonInventoryRepo
+from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+from infrastructure.repo.sqlite_inventory_repo import SqliteInventoryRepo
+
+BACKENDS = {
+    "excel": lambda tmp: ExcelInventoryRepo(str(tmp / "inv.xlsx")),
+    "excel_cache": lambda tmp: CachedExcelInventoryRepo(str(tmp / "inv.xlsx"), flush_seconds=0),
+    "json": lambda tmp: JsonInventoryRepo(str(tmp / "inv.json")),
+    "json_journal": lambda tmp: JournaledJsonInventoryRepo(str(tmp / "inv.json")),
+    "sqlite": lambda tmp: SqliteInventoryRepo(str(tmp / "inv.db")),
+}
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_read_all_and_apply_deltas(tmp_path, backend):
+    repo = BACKENDS[backend](tmp_path)
+    repo.write_qty("7805", 3)
+
+    result = repo.apply_deltas({"7805": 2, "7404": -5, "Nuevo": 4})
+
+    assert result == {"7805": 5, "7404": 0, "Nuevo": 4}
+    repo.flush()
+    snapshot = repo.read_all()
+    assert snapshot["7805"] == 5
+    assert snapshot["7404"] == 0
+    assert snapshot["Nuevo"] == 4
+    assert snapshot["Diodo Zener"] == 0
+
+
+def test_excel_batch_saves_once(tmp_path, monkeypatch):
+    repo = ExcelInventoryRepo(str(tmp_path / "inv.xlsx"))
+    saves = []
+    original = excel_module._save_df
+    monkeypatch.setattr(excel_module, "_save_df", lambda p, df: (saves.append(p), original(p, df)))
+
+    repo.apply_deltas({name: 1 for name in ("7805", "7404", "Diodo Zener", "Nuevo")})
+
+    assert len(saves) == 1
+    assert repo.read_all()["Nuevo"] == 1
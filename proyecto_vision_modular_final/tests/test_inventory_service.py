@@ -0,0 +1,165 @@
+'''
+Tests del servidor de inventario y del cliente RemoteInventoryRepo (puerto 0 en localhost).
+    1.-test_concurrent_stations_lose_nothing valida que varias estaciones sumando a la vez sobre
+      el mismo Excel no pierdan cuentas y que el guardado a disco se haga por lotes.
+    2.-test_pipeline_and_connection_reuse valida el orden de las respuestas en pipeline, que las
+      conexiones se reutilicen y que un error del servidor llegue como RuntimeError.
+    3.-test_reconnects_after_server_restart valida el reintento de lecturas con una conexión nueva.
+    4.-test_read_inserts_are_flushed_and_repo_closed valida que la fila que agrega read_qty se
+      guarde y que al cerrar el servidor se cierre el repositorio (diario compactado).
+    5.-test_mismatched_response_id_is_rejected valida que una respuesta con otro id no se acepte.
+    6.-test_token_is_required_off_localhost y test_requests_need_the_token validan que fuera de
+      localhost se exija token y que las peticiones sin el token correcto se rechacen.
+'''
+import json
+import os
+import socketserver
+import threading
+import time
+
+import pytest
+
+from infrastructure.repo.cached_excel_inventory_repo import CachedExcelInventoryRepo
+from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+from infrastructure.repo.inventory_service import InventoryServer, is_loopback
+from infrastructure.repo.journaled_json_inventory_repo import JournaledJsonInventoryRepo
+from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+from infrastructure.repo.remote_inventory_repo import RemoteInventoryRepo
+
+
+def _start(repo, port=0, flush_seconds=0.05):
+    server = InventoryServer(repo, "127.0.0.1", port, flush_seconds=flush_seconds)
+    server.start()
+    return server
+
+
+def test_concurrent_stations_lose_nothing(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    server = _start(CachedExcelInventoryRepo(path, flush_seconds=0))
+    host, port = server.address
+
+    def station():
+        client = RemoteInventoryRepo(host, port, pool_size=2)
+        for _ in range(25):
+            client.apply_deltas({"7805": 1})
+        client.close()
+
+    threads = [threading.Thread(target=station) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    deadline = time.monotonic() + 5.0
+    while server.flushes == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    server.close()
+
+    assert ExcelInventoryRepo(path).read_qty("7805") == 100
+    assert 1 <= server.flushes < 100
+
+
+def test_pipeline_and_connection_reuse(tmp_path):
+    server = _start(JsonInventoryRepo(str(tmp_path / "inv.json")))
+    client = RemoteInventoryRepo(*server.address, pool_size=2)
+
+    results = client.pipeline([
+        ("write_qty", {"component_name": "7404", "qty": 2}),
+        ("apply_deltas", {"deltas": {"7404": 3}}),
+        ("read_qty", {"component_name": "7404"}),
+    ])
+    assert results == [None, {"7404": 5}, 5]
+
+    for _ in range(10):
+        client.read_qty("7404")
+    assert client.connections_opened == 1
+    assert client.read_all()["7404"] == 5
+
+    with pytest.raises(RuntimeError):
+        client.pipeline([("borrar_todo", {})])
+
+    client.close()
+    server.close()
+
+
+def test_reconnects_after_server_restart(tmp_path):
+    repo = JsonInventoryRepo(str(tmp_path / "inv.json"))
+    server = _start(repo)
+    host, port = server.address
+    client = RemoteInventoryRepo(host, port)
+    client.write_qty("Diodo Zener", 4)
+    server.close()
+
+    server = _start(repo, port=port)
+    assert client.read_qty("Diodo Zener") == 4
+    assert client.connections_opened == 2
+
+    client.close()
+    server.close()
+
+
+def test_read_inserts_are_flushed_and_repo_closed(tmp_path):
+    path = str(tmp_path / "inv.xlsx")
+    server = _start(CachedExcelInventoryRepo(path, flush_seconds=0))
+    client = RemoteInventoryRepo(*server.address)
+    assert client.read_qty("Nuevo") == 0
+    client.close()
+    server.close()
+    assert "Nuevo" in ExcelInventoryRepo(path).read_all()
+
+    json_path = str(tmp_path / "inv.json")
+    server = _start(JournaledJsonInventoryRepo(json_path))
+    client = RemoteInventoryRepo(*server.address)
+    client.apply_deltas({"7805": 2})
+    client.close()
+    server.close()
+    assert os.path.getsize(json_path + ".journal") == 0
+    with open(json_path, encoding="utf-8") as f:
+        assert json.load(f)["7805"] == 2
+
+
+class _WrongIdHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            reply = {"id": request["id"] + 1000, "ok": True, "result": None}
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+
+def test_mismatched_response_id_is_rejected():
+    fake = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _WrongIdHandler)
+    fake.daemon_threads = True
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+    try:
+        with pytest.raises(RuntimeError):
+            RemoteInventoryRepo(*fake.server_address[:2], timeout=2.0)
+    finally:
+        fake.shutdown()
+        fake.server_close()
+
+
+def test_token_is_required_off_localhost(tmp_path):
+    repo = JsonInventoryRepo(str(tmp_path / "inv.json"))
+
+    assert is_loopback("localhost") and is_loopback("127.0.0.1") and is_loopback("::1")
+    assert not is_loopback("0.0.0.0") and not is_loopback("192.168.10.5")
+    with pytest.raises(ValueError):
+        InventoryServer(repo, "0.0.0.0", 0)
+
+
+def test_requests_need_the_token(tmp_path):
+    server = InventoryServer(JsonInventoryRepo(str(tmp_path / "inv.json")), "127.0.0.1", 0,
+                             flush_seconds=0.05, token="s3creto")
+    server.start()
+    host, port = server.address
+
+    with pytest.raises(RuntimeError):
+        RemoteInventoryRepo(host, port, pool_size=1)
+    with pytest.raises(RuntimeError):
+        RemoteInventoryRepo(host, port, pool_size=1, token="otro")
+    client = RemoteInventoryRepo(host, port, pool_size=1, token="s3creto")
+    client.apply_deltas({"7805": 3})
+    assert client.read_qty("7805") == 3
+
+    client.close()
+    server.close()
@@ -0,0 +1,104 @@
+'''
+Tests de JournaledJsonInventoryRepo sobre archivos temporales.
+    1.-test_changes_go_to_journal valida que los cambios se agreguen al diario sin reescribir el
+      JSON y que otra instancia los recupere al arrancar (foto + diario).
+    2.-test_compaction valida que al llegar a compact_every el JSON tenga todo y el diario quede vacío.
+    3.-test_torn_last_line_is_ignored valida que una última línea incompleta no impida arrancar y
+      que los cambios escritos después no se peguen a ella y se recuperen al volver a arrancar.
+    4.-test_corrupt_middle_line_stops_load valida que una línea dañada en medio del diario no se
+      saltee en silencio.
+    5.-test_failed_compaction_does_not_fail_the_write valida que si la compactación falla el
+      cambio se aplique una sola vez, apply_deltas no lance y se reintente al cerrar.
+'''
+import json
+import os
+
+import pytest
+
+import infrastructure.repo.journaled_json_inventory_repo as journaled_module
+from infrastructure.repo.journaled_json_inventory_repo import JournaledJsonInventoryRepo
+
+
+def test_changes_go_to_journal(tmp_path):
+    path = str(tmp_path / "inv.json")
+    repo = JournaledJsonInventoryRepo(path, compact_every=100)
+    snapshot = open(path, encoding="utf-8").read()
+
+    repo.write_qty("7805", 3)
+    repo.apply_deltas({"7805": 2, "Nuevo": 1})
+
+    assert open(path, encoding="utf-8").read() == snapshot
+    assert repo.journal_entries == 3
+
+    reopened = JournaledJsonInventoryRepo(path, compact_every=100)
+    assert reopened.read_qty("7805") == 5
+    assert reopened.read_qty("Nuevo") == 1
+
+
+def test_compaction(tmp_path):
+    path = str(tmp_path / "inv.json")
+    repo = JournaledJsonInventoryRepo(path, compact_every=3)
+
+    for i in range(3):
+        repo.apply_deltas({"7404": 1})
+
+    assert repo.journal_entries == 0
+    assert os.path.getsize(path + ".journal") == 0
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["7404"] == 3
+
+    repo.write_qty("7404", 7)
+    repo.close()
+    assert JournaledJsonInventoryRepo(path).read_qty("7404") == 7
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = str(tmp_path / "inv.json")
+    repo = JournaledJsonInventoryRepo(path)
+    repo.write_qty("Diodo Zener", 4)
+    repo.flush()
+    with open(path + ".journal", "a", encoding="utf-8") as f:
+        f.write('{"n": "Diodo Zener", "q"')
+
+    reopened = JournaledJsonInventoryRepo(path)
+    assert reopened.read_qty("Diodo Zener") == 4
+    reopened.write_qty("7805", 10)
+    reopened.write_qty("7404", 2)
+    reopened.flush()
+
+    again = JournaledJsonInventoryRepo(path)
+    assert again.read_qty("Diodo Zener") == 4
+    assert again.read_qty("7805") == 10
+    assert again.read_qty("7404") == 2
+
+
+def test_corrupt_middle_line_stops_load(tmp_path):
+    path = str(tmp_path / "inv.json")
+    repo = JournaledJsonInventoryRepo(path)
+    repo.write_qty("7805", 1)
+    repo.flush()
+    with open(path + ".journal", "a", encoding="utf-8") as f:
+        f.write('{"n": "7805", basura\n{"n": "7805", "q": 9}\n')
+
+    with pytest.raises(RuntimeError):
+        JournaledJsonInventoryRepo(path)
+
+
+def test_failed_compaction_does_not_fail_the_write(tmp_path, monkeypatch):
+    path = str(tmp_path / "inv.json")
+    repo = JournaledJsonInventoryRepo(path, compact_every=2)
+    real_write = journaled_module.atomic_write_text
+
+    def full_disk(target, text):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(journaled_module, "atomic_write_text", full_disk)
+    repo.apply_deltas({"7805": 1})
+    assert repo.apply_deltas({"7805": 2}) == {"7805": 3}
+    assert repo.read_qty("7805") == 3
+    assert repo.journal_entries == 2
+
+    monkeypatch.setattr(journaled_module, "atomic_write_text", real_write)
+    repo.close()
+    assert repo.journal_entries == 0
+    assert JournaledJsonInventoryRepo(path).read_qty("7805") == 3
@@ -0,0 +1,61 @@
+'''
+Test de CachedInferenceEngine con un modelo falso que cuenta sus llamadas.
+    1.-test_near_duplicate_frames_hit_cache valida que un frame casi igual use la caché y que uno
+      distinto ejecute el modelo.
+    2.-test_lru_eviction valida el desalojo del menos usado y las estadísticas.
+'''
+import numpy as np
+
+from core.inference.inference_engine import InferenceEngine
+from core.inference.prediction_cache import CachedInferenceEngine, dhash
+from interfaces import IModel, IPreprocessor
+
+
+class IdentityPre(IPreprocessor):
+    def preprocess(self, frame):
+        return (frame.astype(np.float32) / 255.0)[None]
+
+
+class CountingModel(IModel):
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, t):
+        self.calls += 1
+        return {"logits": np.array([[0.0, 2.0]])}
+
+
+def _gradient(direction):
+    ramp = np.tile(np.linspace(0, 255, 64, dtype=np.float32), (64, 1))
+    img = ramp if direction == "h" else ramp.T
+    return np.repeat(img[:, :, None], 3, axis=2).astype(np.uint8)
+
+
+def test_near_duplicate_frames_hit_cache():
+    model = CountingModel()
+    engine = CachedInferenceEngine(InferenceEngine(IdentityPre(), model, ["A", "B"]),
+                                   max_entries=8, max_distance=4)
+    frame = _gradient("h")
+    noisy = np.clip(frame.astype(int) + np.random.default_rng(0).integers(-2, 3, frame.shape),
+                    0, 255).astype(np.uint8)
+
+    engine.predict(frame)
+    engine.predict(noisy)
+    engine.predict(_gradient("v"))
+
+    assert model.calls == 2
+    assert engine.hits == 1 and engine.misses == 2
+
+
+def test_lru_eviction():
+    model = CountingModel()
+    engine = CachedInferenceEngine(InferenceEngine(IdentityPre(), model, ["A", "B"]),
+                                   max_entries=1, max_distance=0)
+
+    engine.predict(_gradient("h"))
+    engine.predict(_gradient("v"))
+    engine.predict(_gradient("h"))
+
+    assert model.calls == 3
+    assert engine.evictions == 2
+    assert dhash(_gradient("h")) != dhash(_gradient("v"))
@@ -0,0 +1,54 @@
+'''
+Tests que comparan los modos con buffers persistentes de TMPreprocessor contra el camino original.
+    1.-test_fused_matches_standard valida que el modo fused dé exactamente el mismo tensor.
+    2.-test_fused_reuses_buffer valida que no se reserve un arreglo nuevo por frame.
+    3.-test_uint8_output_matches_after_scaling valida que el modo uint8 más la división entre 255
+      coincida con el camino original.
+    4.-test_roi_crops_before_resize valida que el ROI equivalga a recortar el frame a mano.
+'''
+import numpy as np
+
+from core.preprocessing.Tm_preprocessor import TMPreprocessor
+
+
+def _frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(480, 640, 3), dtype=np.uint8)
+
+
+def test_fused_matches_standard():
+    frame = _frame()
+    expected = TMPreprocessor(224).preprocess(frame)
+    out = TMPreprocessor(224, fused=True).preprocess(frame)
+
+    assert out.shape == (1, 224, 224, 3)
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_fused_reuses_buffer():
+    prep = TMPreprocessor(96, fused=True)
+    first = prep.preprocess(_frame(1))
+    second = prep.preprocess(_frame(2))
+
+    assert first is second
+    np.testing.assert_array_equal(second, TMPreprocessor(96).preprocess(_frame(2)))
+
+
+def test_uint8_output_matches_after_scaling():
+    frame = _frame(3)
+    expected = TMPreprocessor(128).preprocess(frame)
+    out = TMPreprocessor(128, uint8_output=True).preprocess(frame)
+
+    assert out.dtype == np.uint8
+    np.testing.assert_allclose(out.astype(np.float32) * (1.0 / 255.0), expected, atol=1e-6)
+
+
+def test_roi_crops_before_resize():
+    frame = _frame(4)
+    roi = (100, 50, 300, 200)
+    x, y, w, h = roi
+    expected = TMPreprocessor(64).preprocess(np.ascontiguousarray(frame[y:y + h, x:x + w]))
+
+    np.testing.assert_array_equal(TMPreprocessor(64, roi=roi).preprocess(frame), expected)
+    np.testing.assert_array_equal(TMPreprocessor(64, fused=True, roi=roi).preprocess(frame), expected)
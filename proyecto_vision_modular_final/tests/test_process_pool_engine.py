@@ -0,0 +1,99 @@
+'''
+Test de ProcessPoolInferenceEngine con fábricas falsas (sin TensorFlow real en los trabajadores).
+    1.-FakePre usa el valor del primer pixel del frame como "clase" para poder seguir cada frame.
+    2.-test_results_come_back_in_order valida que get() devuelva los ids y etiquetas en el mismo
+      orden en que se enviaron los frames por la memoria compartida.
+    3.-test_predict_never_repeats_a_result valida que predict() entregue cada resultado una sola vez
+      (None cuando no hay uno nuevo), para que una inferencia no cuente dos veces al confirmar.
+    4.-test_dead_worker_raises valida que si un trabajador muere la espera termine con un error en
+      lugar de quedar colgada.
+'''
+
+import os
+
+import numpy as np
+import pytest
+
+from core.inference.process_pool_engine import ProcessPoolInferenceEngine
+from interfaces import IModel, IPreprocessor
+
+
+class FakePre(IPreprocessor):
+    def preprocess(self, frame):
+        return np.full((1, 1), float(frame[0, 0, 0]), dtype=np.float32)
+
+
+class FakeModel(IModel):
+    def predict(self, t):
+        logits = np.zeros((1, 3), dtype=np.float32)
+        logits[0, int(np.asarray(t)[0, 0]) % 3] = 10.0
+        return {"logits": logits}
+
+
+class RampModel(IModel):
+    def predict(self, t):
+        # La confianza depende del valor del frame, así cada frame tiene un resultado distinto.
+        logits = np.zeros((1, 3), dtype=np.float32)
+        logits[0, 0] = float(np.asarray(t)[0, 0]) / 10.0
+        return {"logits": logits}
+
+
+class DyingModel(IModel):
+    def predict(self, t):
+        os._exit(1)
+
+
+def test_results_come_back_in_order():
+    engine = ProcessPoolInferenceEngine(
+        model_factory=FakeModel,
+        preprocessor_factory=FakePre,
+        class_names=["A", "B", "C"],
+        num_workers=2,
+        frame_shape=(8, 8, 3),
+    )
+    engine.start()
+    try:
+        ids = [engine.submit(np.full((8, 8, 3), i, dtype=np.uint8)) for i in range(6)]
+        results = [engine.get() for _ in ids]
+    finally:
+        engine.close()
+
+    assert [r[0] for r in results] == ids
+    assert [r[1] for r in results] == ["A", "B", "C", "A", "B", "C"]
+
+
+def test_predict_never_repeats_a_result():
+    engine = ProcessPoolInferenceEngine(
+        model_factory=RampModel,
+        preprocessor_factory=FakePre,
+        class_names=["A", "B", "C"],
+        num_workers=2,
+        frame_shape=(8, 8, 3),
+    )
+    engine.start()
+    try:
+        results = [engine.predict(np.full((8, 8, 3), i, dtype=np.uint8)) for i in range(12)]
+    finally:
+        engine.close()
+
+    confs = [r[1] for r in results if r is not None]
+    assert confs
+    assert confs == sorted(set(confs))
+
+
+def test_dead_worker_raises():
+    engine = ProcessPoolInferenceEngine(
+        model_factory=DyingModel,
+        preprocessor_factory=FakePre,
+        class_names=["A", "B", "C"],
+        num_workers=1,
+        frame_shape=(8, 8, 3),
+        result_timeout=5.0,
+    )
+    engine.start()
+    try:
+        engine.submit(np.zeros((8, 8, 3), dtype=np.uint8))
+        with pytest.raises(RuntimeError):
+            engine.get()
+    finally:
+        engine.close()
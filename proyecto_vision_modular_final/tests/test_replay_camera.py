@@ -0,0 +1,40 @@
+'''
+Test de ReplayCamera reproduciendo una carpeta de imágenes temporal.
+    1.-test_replay_folder_loops valida el orden de las imágenes y que loop vuelva al inicio.
+    2.-test_replay_folder_ends valida que sin loop se lance un error al terminar.
+'''
+
+import cv2
+import numpy as np
+import pytest
+
+from infrastructure.camera.replay_camera import ReplayCamera
+
+
+def _write_images(folder, n):
+    for i in range(n):
+        img = np.full((8, 8, 3), i * 10, dtype=np.uint8)
+        cv2.imwrite(str(folder / f"{i:03d}.png"), img)
+
+
+def test_replay_folder_loops(tmp_path):
+    _write_images(tmp_path, 3)
+    camera = ReplayCamera(str(tmp_path), fps=0, loop=True)
+    camera.open()
+
+    values = [int(camera.read()[0, 0, 0]) for _ in range(5)]
+    camera.release()
+
+    assert values == [0, 10, 20, 0, 10]
+    assert camera.frames_served == 5
+
+
+def test_replay_folder_ends(tmp_path):
+    _write_images(tmp_path, 2)
+    camera = ReplayCamera(str(tmp_path), fps=0, loop=False, width=16, height=12)
+    camera.open()
+
+    assert camera.read().shape == (12, 16, 3)
+    camera.read()
+    with pytest.raises(RuntimeError):
+        camera.read()
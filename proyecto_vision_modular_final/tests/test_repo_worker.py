@@ -0,0 +1,143 @@
+'''
+Tests de RepoWorker y QuantityUpdater con un root falso que ejecuta los after a mano.
+    1.-test_rapid_clicks_are_coalesced valida que diez clics seguidos terminen en una sola
+      escritura y que la cantidad mostrada sea optimista mientras tanto.
+    2.-test_clicks_during_write_go_in_next_batch valida que los clics que llegan mientras se
+      guarda se junten en la escritura siguiente.
+    3.-test_close_sends_pending_and_flushes valida que al cerrar se guarde lo pendiente.
+    4.-test_each_click_is_clamped_at_zero valida que "–1" y luego "+1" con 0 unidades termine en 1,
+      igual que si se guardaran de a uno.
+    5.-test_clicks_survive_a_failed_write valida que los clics que llegan durante una escritura
+      que falla se guarden en la siguiente y que el error se informe.
+'''
+import threading
+import time
+
+from infrastructure.repo.json_inventory_repo import JsonInventoryRepo
+from ui.repo_worker import QuantityUpdater, RepoWorker
+
+
+class ManualRoot:
+    def __init__(self):
+        self._timers = {}
+        self._next = 0
+
+    def after(self, ms, fn, *args):
+        self._next += 1
+        self._timers[self._next] = (fn, args)
+        return self._next
+
+    def after_cancel(self, timer_id):
+        self._timers.pop(timer_id, None)
+
+    def pump(self, until, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            timers, self._timers = self._timers, {}
+            for fn, args in timers.values():
+                fn(*args)
+            time.sleep(0.005)
+        assert until()
+
+
+class SlowRepo(JsonInventoryRepo):
+    def __init__(self, path):
+        super().__init__(path)
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = []
+        self.flushed = False
+        self.fail_next = False
+
+    def apply_deltas(self, deltas):
+        self.calls.append(dict(deltas))
+        self.release.wait(5.0)
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("disco lleno")
+        return super().apply_deltas(deltas)
+
+    def flush(self):
+        self.flushed = True
+
+
+def _updater(tmp_path, repo=None, errors=None):
+    root = ManualRoot()
+    repo = repo or SlowRepo(str(tmp_path / "inv.json"))
+    shown = []
+    updater = QuantityUpdater(root, RepoWorker(root, poll_ms=1), repo, "7805",
+                              on_display=lambda q, p: shown.append((q, p)),
+                              on_error=None if errors is None else errors.append)
+    updater.load()
+    root.pump(lambda: updater.quantity is not None)
+    return root, repo, updater, shown
+
+
+def test_rapid_clicks_are_coalesced(tmp_path):
+    root, repo, updater, shown = _updater(tmp_path)
+
+    for _ in range(10):
+        updater.add(1)
+    assert shown[-1] == (10, True)
+
+    root.pump(lambda: not updater.pending)
+    assert repo.calls == [{"7805": 10}]
+    assert repo.read_qty("7805") == 10
+    assert shown[-1] == (10, False)
+
+
+def test_clicks_during_write_go_in_next_batch(tmp_path):
+    root, repo, updater, _ = _updater(tmp_path)
+    repo.release.clear()
+
+    updater.add(1)
+    root.pump(lambda: len(repo.calls) == 1)
+    for _ in range(5):
+        updater.add(1)
+    assert updater.quantity == 6
+    repo.release.set()
+
+    root.pump(lambda: not updater.pending)
+    assert repo.calls == [{"7805": 1}, {"7805": 5}]
+    assert repo.read_qty("7805") == 6
+
+
+def test_close_sends_pending_and_flushes(tmp_path):
+    root, repo, updater, _ = _updater(tmp_path)
+
+    updater.add(3)
+    updater.close()
+    root.pump(lambda: repo.flushed)
+
+    assert repo.read_qty("7805") == 3
+
+
+def test_each_click_is_clamped_at_zero(tmp_path):
+    root, repo, updater, shown = _updater(tmp_path)
+
+    updater.add(-1)
+    assert shown[-1] == (0, False)
+    updater.add(1)
+    assert shown[-1] == (1, True)
+
+    root.pump(lambda: not updater.pending)
+    assert updater.writes == 1
+    assert repo.read_qty("7805") == 1
+
+
+def test_clicks_survive_a_failed_write(tmp_path):
+    errors = []
+    root, repo, updater, _ = _updater(tmp_path, errors=errors)
+    repo.release.clear()
+    repo.fail_next = True
+
+    updater.add(2)
+    root.pump(lambda: len(repo.calls) == 1)
+    updater.add(3)
+    repo.release.set()
+
+    root.pump(lambda: not updater.pending)
+    assert len(errors) == 1
+    assert repo.calls == [{"7805": 2}, {"7805": 3}]
+    assert repo.read_qty("7805") == 3
+    assert updater.quantity == 3
@@ -0,0 +1,40 @@
+'''
+Test de TMSavedModel con un SavedModel mínimo exportado en una carpeta temporal.
+    1.-_export_tiny_model guarda un modelo con firma serving_default que promedia la imagen.
+    2.-test_warmup_records_latencies valida que el calentamiento mida frío/caliente.
+    3.-test_uint8_input_is_normalized valida que la entrada uint8 se divida entre 255 dentro
+      de la llamada al modelo.
+'''
+import numpy as np
+import tensorflow as tf
+
+from infrastructure.model.Tm_saved_model import TMSavedModel
+
+
+class _TinyModule(tf.Module):
+    @tf.function(input_signature=[tf.TensorSpec([None, 8, 8, 3], tf.float32)])
+    def serve(self, x):
+        return {"logits": tf.reduce_mean(x, axis=[1, 2])}
+
+
+def _export_tiny_model(path):
+    module = _TinyModule()
+    tf.saved_model.save(module, str(path), signatures={"serving_default": module.serve})
+    return str(path)
+
+
+def test_warmup_records_latencies(tmp_path):
+    model = TMSavedModel(_export_tiny_model(tmp_path / "sm"), input_size=8, warmup_runs=2,
+                         jit_compile=True)
+
+    assert model.cold_latency_ms is not None
+    assert model.warm_latency_ms is not None
+
+
+def test_uint8_input_is_normalized(tmp_path):
+    model = TMSavedModel(_export_tiny_model(tmp_path / "sm"), input_size=8)
+    img = np.full((1, 8, 8, 3), 255, dtype=np.uint8)
+
+    logits = model.predict(tf.constant(img))["logits"].numpy()
+
+    np.testing.assert_allclose(logits, np.ones((1, 3)), rtol=1e-6)
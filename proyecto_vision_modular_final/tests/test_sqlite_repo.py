@@ -0,0 +1,84 @@
+'''
+Tests de SqliteInventoryRepo sobre una base temporal.
+    1.-test_read_write_and_adjust valida lectura, escritura y ajustes que nunca bajan de 0.
+    2.-test_concurrent_adjust_loses_nothing valida que varios hilos sumando a la vez (cada uno con
+      su conexión) no pierdan actualizaciones y que close() cierre las conexiones de todos los hilos.
+    3.-test_excel_round_trip valida importar y exportar el Excel con columnas Componentes/Cantidad.
+    4.-test_factory_imports_excel valida que create_inventory_repo importe el Excel al crear la base.
+'''
+import sqlite3
+import threading
+
+import pytest
+
+from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
+from infrastructure.repo.repo_factory import create_inventory_repo
+from infrastructure.repo.sqlite_inventory_repo import SqliteInventoryRepo
+
+
+def test_read_write_and_adjust(tmp_path):
+    repo = SqliteInventoryRepo(str(tmp_path / "inv.db"))
+
+    assert repo.read_qty("7805") == 0
+    assert repo.read_qty("Nuevo") == 0
+    repo.write_qty("7805", 5)
+    assert repo.adjust_qty("7805", 2) == 7
+    assert repo.adjust_qty("7805", -10) == 0
+    assert repo.adjust_qty("Otro", 3) == 3
+    repo.write_qty("Otro", -4)
+    assert repo.read_qty("Otro") == 0
+
+    mode = sqlite3.connect(str(tmp_path / "inv.db")).execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_concurrent_adjust_loses_nothing(tmp_path):
+    repo = SqliteInventoryRepo(str(tmp_path / "inv.db"))
+
+    def worker():
+        for _ in range(50):
+            repo.adjust_qty("7404", 1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert repo.read_qty("7404") == 200
+
+    conns = list(repo._conns)
+    assert len(conns) == 5
+    repo.close()
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_excel_round_trip(tmp_path):
+    excel = str(tmp_path / "inv.xlsx")
+    ExcelInventoryRepo(excel).write_qty("Diodo Zener", 8)
+
+    repo = SqliteInventoryRepo(str(tmp_path / "inv.db"))
+    assert repo.import_excel(excel) == 4
+    assert repo.read_qty("Diodo Zener") == 8
+
+    repo.adjust_qty("Diodo Zener", 1)
+    repo.write_qty("Nuevo", 2)
+    out = str(tmp_path / "salida.xlsx")
+    assert repo.export_excel(out) == 5
+
+    exported = ExcelInventoryRepo(out)
+    assert exported.read_qty("Diodo Zener") == 9
+    assert exported.read_qty("Nuevo") == 2
+
+
+def test_factory_imports_excel(tmp_path):
+    excel = str(tmp_path / "inv.xlsx")
+    ExcelInventoryRepo(excel).write_qty("7805", 6)
+
+    repo = create_inventory_repo("sqlite", excel)
+
+    assert isinstance(repo, SqliteInventoryRepo)
+    assert repo.read_qty("7805") == 6
+    assert (tmp_path / "inv.db").exists()
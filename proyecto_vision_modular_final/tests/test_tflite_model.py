@@ -0,0 +1,75 @@
+'''
+Test del backend TFLite con un SavedModel mínimo convertido en una carpeta temporal.
+    1.-test_float_conversion_matches_saved_model valida que el .tflite float32 dé las mismas
+      salidas que el SavedModel.
+    2.-test_int8_conversion_is_close valida la conversión entera calibrada con imágenes y que la
+      salida descuantizada quede cerca de la original.
+    3.-test_tflite_backend_needs_path valida que MODEL_BACKEND=tflite sin TFLITE_PATH falle con un
+      error que nombra la variable.
+'''
+import cv2
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from infrastructure.model.model_factory import create_model
+from infrastructure.model.Tm_saved_model import TMSavedModel
+from infrastructure.model.tflite_model import TFLiteModel, convert_saved_model
+
+
+class _TinyModule(tf.Module):
+    def __init__(self):
+        super().__init__()
+        self.w = tf.Variable(tf.random.stateless_uniform([3, 4], seed=(1, 2)))
+
+    @tf.function(input_signature=[tf.TensorSpec([None, 8, 8, 3], tf.float32)])
+    def serve(self, x):
+        return {"logits": tf.nn.softmax(tf.reduce_mean(x, axis=[1, 2]) @ self.w * 4.0)}
+
+
+def _export(path):
+    module = _TinyModule()
+    tf.saved_model.save(module, str(path), signatures={"serving_default": module.serve})
+    return str(path)
+
+
+def _batch(seed):
+    rng = np.random.default_rng(seed)
+    return rng.random((1, 8, 8, 3), dtype=np.float32)
+
+
+def test_float_conversion_matches_saved_model(tmp_path):
+    sm_dir = _export(tmp_path / "sm")
+    tflite_path = convert_saved_model(sm_dir, str(tmp_path / "m.tflite"), mode="float32")
+
+    reference = TMSavedModel(sm_dir)
+    candidate = TFLiteModel(tflite_path)
+    x = _batch(0)
+
+    expected = reference.predict(tf.constant(x))["logits"].numpy()
+    out = candidate.predict(tf.constant(x))["output"]
+    np.testing.assert_allclose(out, expected, atol=1e-5)
+
+
+def test_int8_conversion_is_close(tmp_path):
+    sm_dir = _export(tmp_path / "sm")
+    calib = tmp_path / "calib"
+    calib.mkdir()
+    rng = np.random.default_rng(1)
+    for i in range(10):
+        cv2.imwrite(str(calib / f"{i}.png"), rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+
+    tflite_path = convert_saved_model(sm_dir, str(tmp_path / "q.tflite"), mode="int8",
+                                      calib_dir=str(calib), input_size=8)
+    candidate = TFLiteModel(tflite_path)
+    x = _batch(2)
+
+    expected = TMSavedModel(sm_dir).predict(tf.constant(x))["logits"].numpy()
+    out = candidate.predict(x)["output"]
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, atol=0.05)
+
+
+def test_tflite_backend_needs_path():
+    with pytest.raises(ValueError, match="TFLITE_PATH"):
+        create_model("tflite", "", tflite_path="")
@@ -0,0 +1,112 @@
+'''
+Herramienta de línea de comandos para el backend TFLite.
+    1.-convert: convierte el SavedModel de SAVEDMODEL_DIR a .tflite (float32, float16 o int8) y lo
+    escribe junto a la carpeta converted_savedmodel. El modo int8 se calibra con una carpeta de
+    imágenes de ejemplo (por defecto IMG_DIR); si hay ROI en .env, se recortan igual que los
+    frames de la cámara.
+    2.-compare: ejecuta el SavedModel y el .tflite sobre las mismas imágenes y reporta cuántas
+    etiquetas coinciden, la diferencia media de probabilidades y la latencia de cada uno.
+
+Uso:
+    python tflite_tool.py convert --mode int8 --calib Imagenes_codigo
+    python tflite_tool.py compare --tflite "converted_savedmodel (2)/model_int8.tflite"
+'''
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from config.settings import SAVEDMODEL_DIR, IMG_DIR, INPUT_SIZE, ROI
+from core.inference.inference_engine import InferenceEngine, load_labels
+from core.preprocessing.Tm_preprocessor import TMPreprocessor
+from infrastructure.model.Tm_saved_model import TMSavedModel
+from infrastructure.model.tflite_model import (
+    TFLITE_MODES,
+    TFLiteModel,
+    convert_saved_model,
+    default_tflite_path,
+)
+
+
+def _load_frames(folder: str) -> List[np.ndarray]:
+    frames = []
+    for name in sorted(os.listdir(folder)):
+        frame = cv2.imread(os.path.join(folder, name), cv2.IMREAD_COLOR)
+        if frame is not None:
+            frames.append(frame)
+    return frames
+
+
+def _run(engine: InferenceEngine, frames: List[np.ndarray]) -> Dict[str, object]:
+    engine.predict(frames[0])  # calentamiento, no se mide
+    labels, probs, times = [], [], []
+    for frame in frames:
+        t0 = time.perf_counter()
+        label, _, p = engine.predict(frame)
+        times.append((time.perf_counter() - t0) * 1000.0)
+        labels.append(label)
+        probs.append(p)
+    return {"labels": labels, "probs": np.stack(probs), "ms": float(np.mean(times))}
+
+
+def compare(tflite_path: str, images_dir: str) -> None:
+    frames = _load_frames(images_dir)
+    if not frames:
+        raise ValueError(f"No hay imágenes para comparar en {images_dir}")
+    class_names = load_labels(SAVEDMODEL_DIR)
+
+    reference = _run(
+        InferenceEngine(TMPreprocessor(INPUT_SIZE, roi=ROI),
+                        TMSavedModel(SAVEDMODEL_DIR, INPUT_SIZE), class_names),
+        frames,
+    )
+    candidate = _run(
+        InferenceEngine(TMPreprocessor(INPUT_SIZE, roi=ROI), TFLiteModel(tflite_path),
+                        class_names),
+        frames,
+    )
+
+    agree = sum(a == b for a, b in zip(reference["labels"], candidate["labels"]))
+    diff = float(np.mean(np.abs(reference["probs"] - candidate["probs"])))
+    print(f"Imágenes comparadas:        {len(frames)}")
+    print(f"Etiquetas iguales:          {agree}/{len(frames)} ({agree / len(frames):.0%})")
+    print(f"Diferencia media de probs:  {diff:.4f}")
+    print(f"Latencia SavedModel:        {reference['ms']:.1f} ms/frame")
+    print(f"Latencia TFLite:            {candidate['ms']:.1f} ms/frame "
+          f"(x{reference['ms'] / max(candidate['ms'], 1e-6):.1f})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Conversión y comparación del modelo TFLite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_convert = sub.add_parser("convert", help="Convierte el SavedModel a .tflite")
+    p_convert.add_argument("--mode", choices=TFLITE_MODES, default="float32")
+    p_convert.add_argument("--calib", default=IMG_DIR, help="Carpeta de imágenes para int8")
+    p_convert.add_argument("--output", default=None)
+
+    p_compare = sub.add_parser("compare", help="Compara SavedModel contra .tflite")
+    p_compare.add_argument("--tflite", required=True)
+    p_compare.add_argument("--images", default=IMG_DIR)
+
+    args = parser.parse_args()
+    try:
+        if args.command == "convert":
+            output = args.output or default_tflite_path(SAVEDMODEL_DIR, args.mode)
+            convert_saved_model(SAVEDMODEL_DIR, output, mode=args.mode,
+                                calib_dir=args.calib, input_size=INPUT_SIZE, roi=ROI)
+            print(f"Modelo TFLite ({args.mode}) guardado en {output}")
+        else:
+            compare(args.tflite, args.images)
+    except Exception as e:
+        print(f"[ERROR] Ha ocurrido un error en la herramienta TFLite: {e}")
+        # Código de salida distinto de 0 para que un script o CI note el fallo.
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
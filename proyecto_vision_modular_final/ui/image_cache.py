@@ -0,0 +1,134 @@
+'''
+ImageCache guarda las imágenes de los componentes ya decodificadas y escaladas.
+    1.-get(path) devuelve la imagen PIL reducida a max_width de ancho. Primero busca en memoria,
+    después en la caché en disco y, si no está, abre el original, lo escala con LANCZOS y guarda
+    la versión escalada en disco para los próximos arranques.
+    2.-La caché en memoria es LRU con presupuesto en bytes: al pasarse de max_bytes se descartan
+    las imágenes usadas hace más tiempo.
+    3.-preload(paths) hace ese trabajo en un hilo aparte al arrancar, así la ventana de detalle
+    encuentra la imagen lista. Si la ventana pide una imagen que el hilo está procesando, espera
+    ese resultado en lugar de decodificarla otra vez.
+    4.-El archivo en disco se nombra con la ruta, el tamaño, la fecha de modificación del original
+    y max_width: si la imagen original cambia, se vuelve a escalar.
+Se guardan imágenes PIL y no PhotoImage porque PhotoImage solo se puede crear en el hilo de Tk.
+PIL se importa recién en el primer uso para no alargar el arranque.
+'''
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from infrastructure.repo.atomic_io import atomic_write
+
+
+def _image_bytes(img) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+class ImageCache:
+    def __init__(self, max_width: int = 720, max_bytes: int = 64 * 1024 * 1024,
+                 disk_dir: Optional[str] = None) -> None:
+        self._max_width = max_width
+        self._max_bytes = max_bytes
+        self._disk_dir = disk_dir
+        self._lock = threading.Lock()
+        self._images: "OrderedDict[str, object]" = OrderedDict()
+        self._bytes = 0
+        self._in_flight: Dict[str, threading.Event] = {}
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return path in self._images
+
+    def _disk_path(self, path: str) -> Optional[str]:
+        if not self._disk_dir:
+            return None
+        st = os.stat(path)
+        key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{self._max_width}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._disk_dir, f"{digest}.png")
+
+    def _load(self, path: str):
+        from PIL import Image
+
+        cached = self._disk_path(path)
+        if cached and os.path.exists(cached):
+            with Image.open(cached) as img:
+                img.load()
+                self.disk_hits += 1
+                return img.copy()
+
+        with Image.open(path) as original:
+            scale = min(1.0, self._max_width / original.width)
+            img = original.resize(
+                (int(original.width * scale), int(original.height * scale)),
+                Image.LANCZOS,
+            )
+        self.misses += 1
+        if cached:
+            try:
+                os.makedirs(self._disk_dir, exist_ok=True)
+                atomic_write(cached, lambda tmp_path: img.save(tmp_path, format="PNG"))
+            except Exception as e:
+                # Sin caché en disco igual se puede mostrar la imagen.
+                print(f"[ERROR] Ha ocurrido un error al guardar la imagen escalada: {e}")
+        return img
+
+    def _store(self, path: str, img) -> None:
+        self._images[path] = img
+        self._bytes += _image_bytes(img)
+        while self._bytes > self._max_bytes and len(self._images) > 1:
+            _, old = self._images.popitem(last=False)
+            self._bytes -= _image_bytes(old)
+
+    def get(self, path: str):
+        """Devuelve la imagen PIL escalada; lanza la excepción si no se puede abrir."""
+        while True:
+            with self._lock:
+                img = self._images.get(path)
+                if img is not None:
+                    self._images.move_to_end(path)
+                    self.hits += 1
+                    return img
+                event = self._in_flight.get(path)
+                owner = event is None
+                if owner:
+                    event = self._in_flight[path] = threading.Event()
+            if owner:
+                break
+            # Otro hilo ya la está cargando: se espera y se vuelve a mirar la caché.
+            event.wait()
+
+        try:
+            img = self._load(path)
+            with self._lock:
+                self._store(path, img)
+            return img
+        finally:
+            with self._lock:
+                self._in_flight.pop(path, None)
+            event.set()
+
+    def preload(self, paths: Iterable[str]) -> threading.Thread:
+        """Carga las imágenes en un hilo aparte; los errores se imprimen y no detienen la carga."""
+        paths = list(paths)
+
+        def run() -> None:
+            for path in paths:
+                try:
+                    self.get(path)
+                except Exception as e:
+                    print(f"[ERROR] Ha ocurrido un error al precargar la imagen {path}: {e}")
+
+        thread = threading.Thread(target=run, name="precarga-imagenes", daemon=True)
+        thread.start()
+        return thread
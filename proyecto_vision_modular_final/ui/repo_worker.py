@@ -0,0 +1,170 @@
+'''
+Utilidades para que la ventana de detalle no toque el inventario desde el hilo de Tk.
+    1.-RepoWorker ejecuta las llamadas al repositorio en un único hilo aparte (así las escrituras
+    mantienen su orden) y entrega el resultado en el hilo de Tk revisando el Future con root.after.
+    2.-QuantityUpdater lleva la cantidad de un componente en la ventana: muestra al instante la
+    cantidad optimista (última conocida + clics todavía no guardados) con un indicador de
+    pendiente, y junta los clics seguidos en un solo apply_deltas. Cada clic se limita a 0 en el
+    momento, igual que si se guardara solo: "–1" con 0 unidades no resta nada y el "+1" que
+    sigue sí suma. Si una escritura falla se informa, y los clics que llegaron mientras tanto se
+    guardan en la siguiente.
+Con eso, tocar "+1" diez veces no congela la cámara ni la UI diez veces: se hace una escritura
+con +10 (o unas pocas si el repositorio tarda).
+'''
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from interfaces import IInventoryRepo
+
+
+class RepoWorker:
+    def __init__(self, root, poll_ms: int = 20) -> None:
+        self._root = root
+        self._poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inventario")
+
+    def submit(self, fn: Callable, *args,
+               on_done: Optional[Callable[[object], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
+        """Ejecuta fn(*args) en el hilo del inventario; on_done/on_error corren en el hilo de Tk."""
+        future = self._executor.submit(fn, *args)
+        self._root.after(self._poll_ms, self._poll, future, on_done, on_error)
+        return future
+
+    def _poll(self, future: Future, on_done, on_error) -> None:
+        if not future.done():
+            self._root.after(self._poll_ms, self._poll, future, on_done, on_error)
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+        elif on_done is not None:
+            on_done(future.result())
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+class QuantityUpdater:
+    def __init__(self, root, worker: RepoWorker, repo: IInventoryRepo, component_name: str,
+                 on_display: Callable[[Optional[int], bool], None],
+                 on_error: Optional[Callable[[BaseException], None]] = None,
+                 debounce_ms: int = 150) -> None:
+        self._root = root
+        self._worker = worker
+        self._repo = repo
+        self._name = component_name
+        self._on_display = on_display
+        self._on_error = on_error
+        self._debounce_ms = debounce_ms
+
+        self._known: Optional[int] = None
+        # Clics anteriores a la primera lectura: se limitan a 0 recién cuando se conoce la cantidad.
+        self._early: List[int] = []
+        self._pending = 0
+        self._in_flight = 0
+        self._sending = False
+        self._timer = None
+        self._closed = False
+
+        self.writes = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._known is None or self._sending or self._pending != 0 or bool(self._early)
+
+    @property
+    def quantity(self) -> Optional[int]:
+        """Cantidad optimista: la última confirmada más los cambios aún no guardados."""
+        if self._known is None:
+            return None
+        return max(0, self._known + self._in_flight + self._pending)
+
+    def _display(self) -> None:
+        if not self._closed:
+            self._on_display(self.quantity, self.pending)
+
+    def load(self) -> None:
+        self._display()
+        self._worker.submit(self._repo.read_qty, self._name,
+                            on_done=self._loaded, on_error=self._load_failed)
+
+    def _loaded(self, qty: int) -> None:
+        self._known = int(qty)
+        early, self._early = self._early, []
+        for delta in early:
+            self.add(delta)
+        self._display()
+
+    def _load_failed(self, error: BaseException) -> None:
+        print(f"[ERROR] Ha ocurrido un error al leer el inventario de {self._name}: {error}")
+        if self._early:
+            print(f"[ERROR] No se guardaron {len(self._early)} cambios de {self._name}.")
+            self._early = []
+        self._display()
+        if self._on_error is not None and not self._closed:
+            self._on_error(error)
+
+    def add(self, delta: int) -> None:
+        if self._known is None:
+            self._early.append(int(delta))
+            self._display()
+            return
+        current = self.quantity
+        # Se limita cada clic por separado: la suma del lote ya no puede bajar de 0 a mitad.
+        self._pending += max(0, current + int(delta)) - current
+        self._display()
+        if self._timer is None and not self._sending:
+            self._timer = self._root.after(self._debounce_ms, self._send)
+
+    def _send(self) -> None:
+        self._timer = None
+        if self._sending or self._pending == 0:
+            return
+        self._in_flight, self._pending = self._pending, 0
+        self._sending = True
+        self.writes += 1
+        self._worker.submit(self._repo.apply_deltas, {self._name: self._in_flight},
+                            on_done=self._sent, on_error=self._failed)
+
+    def _sent(self, result) -> None:
+        self._known = int(result[self._name])
+        self._in_flight = 0
+        self._sending = False
+        if self._pending:
+            # Los clics que llegaron mientras se guardaba van juntos en la próxima escritura.
+            self._send()
+        self._display()
+
+    def _failed(self, error: BaseException) -> None:
+        print(f"[ERROR] Ha ocurrido un error al actualizar el inventario de {self._name} "
+              f"({self._in_flight:+d} sin guardar): {error}")
+        self._in_flight = 0
+        self._sending = False
+        if self._pending and not self._closed:
+            # Los clics que llegaron durante la escritura fallida se intentan guardar igual.
+            self._send()
+        self._display()
+        if self._on_error is not None and not self._closed:
+            self._on_error(error)
+
+    def close(self) -> None:
+        """Envía lo que falte y pide al repositorio guardar; no espera a que termine."""
+        self._closed = True
+        if self._timer is not None:
+            self._root.after_cancel(self._timer)
+            self._timer = None
+        if self._pending:
+            delta, self._pending = self._pending, 0
+            self._worker.submit(self._repo.apply_deltas, {self._name: delta},
+                                on_error=self._report)
+        for delta in self._early:
+            # Sin cantidad conocida no se pueden juntar sin pasar por debajo de 0: van de a uno.
+            self._worker.submit(self._repo.apply_deltas, {self._name: delta},
+                                on_error=self._report)
+        self._early = []
+        self._worker.submit(self._repo.flush, on_error=self._report)
+
+    def _report(self, error: BaseException) -> None:
+        print(f"[ERROR] Ha ocurrido un error al guardar el inventario de {self._name}: {error}")
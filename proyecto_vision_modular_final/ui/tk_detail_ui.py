@@ -1,11 +1,21 @@
 '''
 TkDetailUI es la interfaz gráfica de detalle del componente reconocido.
-    1.-Cuando el motor de inferencia detecta algo, llama a show, que abre una ventana con la 
-    imagen del componente, el nombre, la confianza y la cantidad actual en Excel.
-    2.-Desde esa ventana el usuario puede ver el datasheet, sumar o restar unidades, o añadir 
-    una cantidad personalizada, y todos esos cambios se guardan inmediatamente en el Excel.
-    3.-Al cerrar con “Volver a lectura”, la UI llama al callback on_resume para que el sistema 
-    retome la captura en tiempo real.
+    1.-La ventana (un Toplevel con todos sus Label y Button) se construye una sola vez, en el
+    primer show. Después cada detección solo cambia su contenido: imagen, título, cantidad y
+    datasheet; entre detecciones la ventana se oculta con withdraw en lugar de destruirse.
+    2.-La imagen sale de un ImageCache (ya decodificada y escalada a 720 px de ancho) y el
+    PhotoImage de cada componente se crea una vez y se reutiliza, así las imágenes de Tk no se
+    acumulan a lo largo del turno.
+    3.-Desde esa ventana el usuario puede ver el datasheet, sumar o restar unidades, o añadir
+    una cantidad personalizada. Las lecturas y escrituras del inventario corren en un hilo aparte
+    (RepoWorker): la cantidad se actualiza al instante con un indicador de "guardando…" y los
+    clics seguidos se guardan juntos en una sola escritura.
+    4.-Al cerrar con “Volver a lectura” (o con la X de la ventana), la UI envía lo pendiente,
+    pide al repositorio guardar (flush) sin esperarlo y llama al callback on_resume para que el
+    sistema retome la captura en tiempo real.
+    5.-Con docked=True el panel queda siempre visible en la esquina superior derecha de la
+    pantalla, al lado de la vista de la cámara, y no bloquea las demás ventanas (sin grab_set).
+    Entre detecciones queda en espera, vacío y con los botones deshabilitados.
 '''
 
 from tkinter import (
@@ -15,121 +25,194 @@ from tkinter import (
     LEFT,
     RIGHT,
     TOP,
+    NORMAL,
+    DISABLED,
     simpledialog,
     messagebox,
 )
-from typing import Callable
+from typing import Callable, Dict, Optional
 
-from PIL import Image, ImageTk
 import webbrowser
 
 from config.assets import ASSETS, EXCEL_NAME_MAP
 from interfaces import IDetailUI, IInventoryRepo
+from ui.image_cache import ImageCache
+from ui.repo_worker import QuantityUpdater, RepoWorker
 
 
 class TkDetailUI(IDetailUI):
-    def __init__(self, root, repo: IInventoryRepo) -> None:
+    def __init__(self, root, repo: IInventoryRepo, images: Optional[ImageCache] = None,
+                 docked: bool = False) -> None:
         self._root = root
         self._repo = repo
+        self._images = images or ImageCache(max_width=720)
+        self._worker = RepoWorker(root)
+        self._docked = docked
 
-    def show(self, label_str: str, conf: float, on_resume: Callable[[], None]) -> None:
-        try:
-            excel_name = EXCEL_NAME_MAP.get(label_str, label_str)
-            current_qty = self._repo.read_qty(excel_name)
-        except Exception as e:
-            print(f"[ERROR] Ha ocurrido un error al obtener la cantidad desde el repositorio: {e}")
-            raise
-
-        info = ASSETS.get(label_str)
+        self._top = None
+        self._photos: Dict[str, object] = {}
+        self._quantity: Optional[QuantityUpdater] = None
+        self._on_resume: Optional[Callable[[], None]] = None
+        self._url: Optional[str] = None
 
+    def _build(self) -> None:
         top = Toplevel(self._root)
-        top.title(f"{label_str} — conf. {conf:.0%}")
-
-        # Imagen
-        if info and info.get("img"):
-            try:
-                pil_img = Image.open(info["img"])
-                max_w = 720
-                scale = min(1.0, max_w / pil_img.width)
-                pil_img = pil_img.resize(
-                    (int(pil_img.width * scale), int(pil_img.height * scale)),
-                    Image.LANCZOS,
-                )
-                tk_img = ImageTk.PhotoImage(pil_img)
-                img_label = Label(top, image=tk_img)
-                img_label.image = tk_img
-                img_label.pack(side=TOP, padx=12, pady=8)
-            except Exception as e:
-                print(f"[ERROR] Ha ocurrido un error al cargar la imagen de {label_str}: {e}")
-                Label(top, text=f"(Error al cargar imagen para {label_str})").pack(
-                    side=TOP, pady=8
-                )
-        else:
-            Label(top, text=f"(No se encontró imagen para {label_str})").pack(
-                side=TOP, pady=8
-            )
+        top.protocol("WM_DELETE_WINDOW", self._resume)
+
+        self._img_label = Label(top)
+        self._img_label.pack(side=TOP, padx=12, pady=8)
 
-        qty_label = Label(
+        self._qty_label = Label(
             top,
-            text=f"Cantidad actual en Excel: {current_qty}",
+            text="Cantidad actual en Excel: …",
             font=("Segoe UI", 12, "bold"),
         )
-        qty_label.pack(side=TOP, pady=4)
-
-        def refresh_qty() -> None:
-            q = self._repo.read_qty(excel_name)
-            qty_label.config(text=f"Cantidad actual en Excel: {q}")
-
-        def add_one() -> None:
-            q = self._repo.read_qty(excel_name) + 1
-            self._repo.write_qty(excel_name, q)
-            refresh_qty()
-
-        def sub_one() -> None:
-            q = max(0, self._repo.read_qty(excel_name) - 1)
-            self._repo.write_qty(excel_name, q)
-            refresh_qty()
-
-        def add_custom() -> None:
-            try:
-                n = simpledialog.askinteger(
-                    "Añadir cantidad",
-                    "¿Cuántas unidades deseas añadir?",
-                    parent=top,
-                    minvalue=1,
-                )
-                if n is not None:
-                    q = self._repo.read_qty(excel_name) + int(n)
-                    self._repo.write_qty(excel_name, q)
-                    refresh_qty()
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo actualizar: {e}")
-
-        if info and info.get("url"):
-            Button(
-                top,
-                text="Ver datasheet",
-                command=lambda: webbrowser.open(info["url"], new=2),
-                width=18,
-            ).pack(side=LEFT, padx=10, pady=12)
-
-        Button(top, text="–1", width=6, command=sub_one).pack(
-            side=LEFT, padx=6, pady=12
-        )
-        Button(top, text="+1", width=6, command=add_one).pack(
-            side=LEFT, padx=6, pady=12
+        self._qty_label.pack(side=TOP, pady=4)
+
+        self._datasheet_btn = Button(
+            top,
+            text="Ver datasheet",
+            command=self._open_datasheet,
+            width=18,
         )
-        Button(
+        self._datasheet_btn.pack(side=LEFT, padx=10, pady=12)
+
+        sub_one = Button(top, text="–1", width=6, command=lambda: self._add(-1))
+        sub_one.pack(side=LEFT, padx=6, pady=12)
+        add_one = Button(top, text="+1", width=6, command=lambda: self._add(1))
+        add_one.pack(side=LEFT, padx=6, pady=12)
+        add_custom = Button(
             top,
             text="Añadir cantidad…",
             width=18,
-            command=add_custom,
-        ).pack(side=LEFT, padx=10, pady=12)
+            command=self._add_custom,
+        )
+        add_custom.pack(side=LEFT, padx=10, pady=12)
+        self._qty_buttons = (sub_one, add_one, add_custom)
+
         Button(
             top,
             text="Volver a lectura",
             width=18,
-            command=lambda: (top.destroy(), on_resume()),
+            command=self._resume,
         ).pack(side=RIGHT, padx=10, pady=12)
 
-        top.grab_set()
+        if self._docked:
+            top.geometry("-0+0")
+        else:
+            top.withdraw()
+        self._top = top
+
+    def _photo(self, path: str):
+        # PIL se importa al primer uso para no alargar el arranque.
+        from PIL import ImageTk
+
+        # Normalmente ya está escalada en memoria (precarga de ImageCache).
+        return ImageTk.PhotoImage(self._images.get(path))
+
+    def _set_image(self, label_str: str, info) -> None:
+        path = info.get("img") if info else None
+        if not path:
+            self._img_label.config(image="", text=f"(No se encontró imagen para {label_str})")
+            return
+        try:
+            photo = self._photos.get(path)
+            if photo is None:
+                photo = self._photos[path] = self._photo(path)
+            self._img_label.config(image=photo, text="")
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al cargar la imagen de {label_str}: {e}")
+            self._img_label.config(image="", text=f"(Error al cargar imagen para {label_str})")
+
+    def _display(self, qty: Optional[int], pending: bool) -> None:
+        text = f"Cantidad actual en Excel: {'…' if qty is None else qty}"
+        self._qty_label.config(text=text + (" (guardando…)" if pending and qty is not None else ""))
+
+    def _set_qty_buttons(self, state: str) -> None:
+        for button in self._qty_buttons:
+            button.config(state=state)
+
+    def show(self, label_str: str, conf: float, on_resume: Callable[[], None]) -> None:
+        if self._top is None:
+            self._build()
+        if self._quantity is not None:
+            # Otra cámara confirmó con el panel abierto: se cierra la detección anterior.
+            self._finish()
+
+        excel_name = EXCEL_NAME_MAP.get(label_str, label_str)
+        info = ASSETS.get(label_str)
+
+        self._top.title(f"{label_str} — conf. {conf:.0%}")
+        self._set_image(label_str, info)
+        self._url = info.get("url") if info else None
+        self._datasheet_btn.config(state=NORMAL if self._url else DISABLED)
+        self._set_qty_buttons(NORMAL)
+
+        self._on_resume = on_resume
+        self._quantity = QuantityUpdater(
+            self._root,
+            self._worker,
+            self._repo,
+            excel_name,
+            on_display=self._display,
+            on_error=lambda e: messagebox.showerror("Error", f"No se pudo actualizar: {e}"),
+        )
+        self._quantity.load()
+
+        if self._docked:
+            self._top.lift()
+        else:
+            self._top.deiconify()
+            self._top.grab_set()
+
+    def _open_datasheet(self) -> None:
+        if self._url:
+            webbrowser.open(self._url, new=2)
+
+    def _add(self, delta: int) -> None:
+        if self._quantity is not None:
+            self._quantity.add(delta)
+
+    def _add_custom(self) -> None:
+        try:
+            n = simpledialog.askinteger(
+                "Añadir cantidad",
+                "¿Cuántas unidades deseas añadir?",
+                parent=self._top,
+                minvalue=1,
+            )
+            if n is not None:
+                self._add(int(n))
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo actualizar: {e}")
+
+    def _finish(self) -> None:
+        # Lo pendiente se guarda en el hilo del inventario; la cámara vuelve enseguida.
+        self._quantity.close()
+        self._quantity = None
+        on_resume, self._on_resume = self._on_resume, None
+        if on_resume is not None:
+            on_resume()
+
+    def _resume(self) -> None:
+        if self._quantity is None:
+            return
+        if self._docked:
+            # El panel queda a la vista pero sin los datos del componente anterior.
+            self._top.title("Detalle — esperando detección")
+            self._img_label.config(image="", text="")
+            self._qty_label.config(text="Esperando detección…")
+            self._url = None
+            self._datasheet_btn.config(state=DISABLED)
+            self._set_qty_buttons(DISABLED)
+        else:
+            self._top.grab_release()
+            self._top.withdraw()
+        self._finish()
+
+    def close(self) -> None:
+        """Guarda lo pendiente y espera a que terminen las escrituras del inventario."""
+        if self._quantity is not None:
+            self._quantity.close()
+            self._quantity = None
+        self._worker.shutdown(wait=True)